@@ -0,0 +1,96 @@
+"""
+분배 내역 저장 방식별 성능 벤치마크
+
+SprayService 의 분배 내역 저장 방식 두 가지를 인원 수(10, 1,000, 100,000)별로 비교합니다.
+- orm: MoneyDistributionDetail 객체를 하나씩 session.add() 후 flush
+- bulk: Core insert 를 executemany 로 실행 (asyncmy 가 multi-row INSERT 로 재작성)
+
+실행 방법 (backend 디렉터리에서):
+    python -m benchmarks.detail_insert_benchmark --repeat 3
+
+주의: TEST_DATABASE_URL 의 테이블을 모두 삭제 후 다시 생성합니다.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.api.distribution.service.spray_service import SprayService
+from src.core.config import settings
+from src.db.models import Base, ChatRoom, MoneyDistribution, User
+
+RECIPIENT_COUNTS = (10, 1_000, 100_000)
+
+
+async def prepare(session: AsyncSession) -> int:
+    """분배 내역이 참조할 사용자/대화방/뿌리기 건 생성"""
+    session.add(User(id=1, username="bench", password="dummy", email="bench@example.com"))
+    session.add(ChatRoom(id="bench_room", room_name="Benchmark Room"))
+    await session.flush()
+
+    distribution = MoneyDistribution(
+        token="BNC",
+        creator_id=1,
+        chat_room_id="bench_room",
+        total_amount=10_000_000,
+        recipient_count=max(RECIPIENT_COUNTS)
+    )
+    session.add(distribution)
+    await session.commit()
+    return distribution.id
+
+
+async def run_once(session_maker, distribution_id: int, count: int, mode: str) -> float:
+    """한 번 저장하는 데 걸린 시간(ms) 측정 후 롤백"""
+    async with session_maker() as session:
+        service = SprayService(session)
+        amounts = service.distribute_amount(count * 100, count)
+
+        started = time.perf_counter()
+        if mode == "orm":
+            service._add_details(distribution_id, amounts)
+            await session.flush()
+        else:
+            await service._bulk_insert_details(service._build_detail_rows(distribution_id, amounts))
+        elapsed = (time.perf_counter() - started) * 1000
+
+        await session.rollback()
+        return elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="인원 수/방식별 반복 횟수")
+    args = parser.parse_args()
+
+    engine = create_async_engine(settings.TEST_DATABASE_URL)
+    session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with session_maker() as session:
+        distribution_id = await prepare(session)
+
+    print(f"{'recipients':>10}{'orm(ms)':>12}{'bulk(ms)':>12}{'speedup':>10}")
+    for count in RECIPIENT_COUNTS:
+        timings = {}
+        for mode in ("orm", "bulk"):
+            timings[mode] = statistics.median([
+                await run_once(session_maker, distribution_id, count, mode)
+                for _ in range(args.repeat)
+            ])
+        print(f"{count:>10,}{timings['orm']:>12.1f}{timings['bulk']:>12.1f}{timings['orm'] / timings['bulk']:>9.1f}x")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,69 @@
+"""
+금액 분배 구현별 성능 벤치마크
+
+SprayService 의 금액 분배 구현 세 가지를 인원 수별로 비교합니다.
+- list: distribute_amount (Python int 리스트 + shuffle)
+- numpy: _distribute_amount_numpy (numpy int64 배열, 벡터 연산)
+- array: _distribute_amount_array (array('q'), numpy 미설치 환경용)
+
+실행 방법 (backend 디렉터리에서):
+    python -m benchmarks.distribute_amount_benchmark --repeat 5
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+from src.api.distribution.service.spray_service import SprayService, np
+
+RECIPIENT_COUNTS = (100, 10_000, 1_000_000, 10_000_000)
+
+
+def implementations() -> dict:
+    impls = {
+        "list": SprayService.distribute_amount,
+        "array": SprayService._distribute_amount_array,
+    }
+    if np is not None:
+        impls["numpy"] = SprayService._distribute_amount_numpy
+    return impls
+
+
+def result_size(amounts) -> int:
+    """분배 결과가 차지하는 메모리(bytes) 추정"""
+    if isinstance(amounts, list):
+        # 리스트 자체 + 원소 int 객체 (base/base+1 두 값만 공유되므로 사실상 포인터 배열)
+        return sys.getsizeof(amounts) + sum(sys.getsizeof(value) for value in set(amounts))
+    return len(amounts) * amounts.itemsize
+
+
+def measure(func, total_amount: int, count: int, repeat: int) -> tuple[float, int]:
+    """실행 시간 중앙값(ms)과 결과 메모리 크기(bytes) 측정"""
+    elapsed = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        amounts = func(total_amount, count)
+        elapsed.append((time.perf_counter() - started) * 1000)
+    return statistics.median(elapsed), result_size(amounts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if np is None:
+        print("numpy 미설치: numpy 구현은 건너뜁니다.", file=sys.stderr)
+
+    print(f"{'count':>12} {'impl':>6} {'median(ms)':>12} {'size(MB)':>10}")
+    for count in RECIPIENT_COUNTS:
+        # 잔액이 생기도록 나누어 떨어지지 않는 금액 사용
+        total_amount = count * 10 + count // 3
+        for name, func in implementations().items():
+            median_ms, size = measure(func, total_amount, count, args.repeat)
+            print(f"{count:>12,} {name:>6} {median_ms:>12.2f} {size / 1024 / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+분배 전략별 처리량 벤치마크
+
+등록된 분배 전략(EQUAL, RANDOM, FIRST_COME_BONUS)을 인원 수별로 실행해
+1회 분배 시간과 초당 분배 인원 수를 비교합니다. 모든 전략은 O(n) 이므로
+인원 수가 10배가 되면 시간도 약 10배가 되어야 합니다.
+
+실행 방법 (backend 디렉터리에서):
+    python -m benchmarks.distribution_strategy_benchmark --repeat 5
+"""
+
+import argparse
+import statistics
+import time
+
+from src.common.enums import DistributionType
+from src.utils.distribution_strategy.distribution_strategy import get_strategy
+
+RECIPIENT_COUNTS = (100, 10_000, 1_000_000)
+
+
+def measure(strategy, total_amount: int, count: int, repeat: int) -> float:
+    """실행 시간 중앙값(ms) 측정"""
+    elapsed = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        strategy(total_amount, count)
+        elapsed.append((time.perf_counter() - started) * 1000)
+    return statistics.median(elapsed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'count':>12} {'strategy':>18} {'median(ms)':>12} {'recipients/s':>14}")
+    for count in RECIPIENT_COUNTS:
+        # 잔액이 생기도록 나누어 떨어지지 않는 금액 사용
+        total_amount = count * 100 + count // 3
+        for distribution_type in DistributionType:
+            median_ms = measure(get_strategy(distribution_type), total_amount, count, args.repeat)
+            throughput = count / (median_ms / 1000) if median_ms else float("inf")
+            print(f"{count:>12,} {distribution_type.value:>18} {median_ms:>12.2f} {throughput:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+받기 결과 전달 방식별 지연 시간 / 처리량 벤치마크
+
+Celery rpc 결과 백엔드(태스크마다 대기 스레드에서 AsyncResult.get)와
+Redis pub/sub 결과 채널(프로세스 단위 구독 + task_id 별 Future)을 동시 요청 수별로 비교합니다.
+결과 전달 경로만 비교하기 위해 존재하지 않는 토큰으로 받기 태스크를 보내
+워커가 DB 조회 한 번 후 바로 실패 결과를 돌려주도록 합니다.
+
+실행 전 RabbitMQ / Redis / MySQL 과 받기 워커가 실행 중이어야 합니다.
+    celery -A src.worker.celery_app worker -Q receive_requests --concurrency=4
+
+실행 방법 (backend 디렉터리에서):
+    python -m benchmarks.result_channel_benchmark --requests 2000 --concurrency 1 16 64
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+from src.db.redis import close_redis_pool
+from src.utils.result_channel.result_channel import ResultChannel
+from src.worker.routing import receive_queue_for
+from src.worker.tasks import process_receive_money
+
+MODES = ("rpc", "redis")
+BENCHMARK_TOKEN = "___"  # 존재하지 않는 토큰 (워커에서 즉시 검증 실패)
+TIMEOUT_SECONDS = 30
+
+
+def task_kwargs(user_id: int) -> dict:
+    return {"token": BENCHMARK_TOKEN, "user_id": user_id, "room_id": "benchmark"}
+
+
+def rpc_round_trip(user_id: int) -> float:
+    """rpc 백엔드: 발행한 스레드에서 결과 대기"""
+    started = time.perf_counter()
+    result = process_receive_money.apply_async(kwargs=task_kwargs(user_id), queue=receive_queue_for(BENCHMARK_TOKEN))
+    result.get(timeout=TIMEOUT_SECONDS, propagate=False)
+    return (time.perf_counter() - started) * 1000
+
+
+async def measure_rpc(requests: int, concurrency: int) -> list[float]:
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(await asyncio.gather(*(
+            loop.run_in_executor(executor, rpc_round_trip, user_id) for user_id in range(requests)
+        )))
+
+
+async def measure_redis(channel: ResultChannel, requests: int, concurrency: int) -> list[float]:
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    # 발행만 스레드에서 수행 (결과 대기는 이벤트 루프에서)
+    executor = ThreadPoolExecutor(max_workers=min(concurrency, 8))
+
+    async def round_trip(user_id: int) -> float:
+        async with semaphore:
+            started = time.perf_counter()
+            task_id = str(uuid4())
+            channel.expect(task_id)
+            await loop.run_in_executor(executor, lambda: process_receive_money.apply_async(
+                kwargs={**task_kwargs(user_id), "reply_channel": channel.name},
+                queue=receive_queue_for(BENCHMARK_TOKEN),
+                task_id=task_id,
+                ignore_result=True
+            ))
+            await channel.wait(task_id, timeout=TIMEOUT_SECONDS)
+            return (time.perf_counter() - started) * 1000
+
+    try:
+        return list(await asyncio.gather(*(round_trip(user_id) for user_id in range(requests))))
+    finally:
+        executor.shutdown()
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000, help="모드 / 동시 요청 수별 요청 수")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64], help="동시 요청 수 목록")
+    args = parser.parse_args()
+
+    channel = ResultChannel()
+    await channel.start()
+
+    print(f"{'mode':<8}{'concurrency':>12}{'req/s':>10}{'p50(ms)':>10}{'p95':>8}{'p99':>8}")
+    for concurrency in args.concurrency:
+        for mode in MODES:
+            started = time.perf_counter()
+            if mode == "rpc":
+                latencies = await measure_rpc(args.requests, concurrency)
+            else:
+                latencies = await measure_redis(channel, args.requests, concurrency)
+            elapsed = time.perf_counter() - started
+            print(
+                f"{mode:<8}{concurrency:>12}{args.requests / elapsed:>10.1f}"
+                f"{statistics.median(latencies):>10.2f}{percentile(latencies, 95):>8.2f}{percentile(latencies, 99):>8.2f}"
+            )
+
+    await channel.stop()
+    await close_redis_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
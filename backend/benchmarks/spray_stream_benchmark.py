@@ -0,0 +1,175 @@
+"""
+뿌리기 상태 스트림(SSE) 구독자 수별 서버 비용 벤치마크
+
+구독자 N 명이 /spray/{token}/stream 을 열어 둔 상태에서 API 서버 프로세스의
+메모리(RSS) / 유휴 CPU(keepalive 만 전송) / 받기 내역 1건 전파 비용과 전파 지연을 측정하고,
+구독자 10,000 명 기준으로 환산해 출력합니다.
+
+받기 내역은 받기 처리 경로와 같은 SprayStatusCache.bump 로 발행하며, 금액 0 / 음수 user_id 의
+가짜 내역이므로 DB 와 스트림 종료 조건에는 영향이 없지만 해당 토큰의 조회 캐시 버전은 증가합니다.
+테스트 환경에서만 실행하세요.
+
+실행 전 API 서버 / Redis 가 실행 중이어야 하고, 받기 가능 기간(10분) 안의 뿌리기 토큰과
+뿌린 사용자 ID 가 필요합니다. 구독자 수만큼 소켓을 열기 때문에 양쪽 모두 파일 디스크립터 한도를
+늘려야 합니다 (ulimit -n 65536). 서버 측 수치는 /proc 를 읽으므로 같은 호스트에서 실행합니다.
+    uvicorn src.main:app --port 8000
+
+실행 방법 (backend 디렉터리에서):
+    python -m benchmarks.spray_stream_benchmark --token ABC --user-id 1 --server-pid $(pgrep -f "uvicorn src.main") \\
+        --watchers 1000 10000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+from src.db.redis import close_redis_pool, get_redis_client
+from src.utils.spray_status_cache.spray_status_cache import SprayStatusCache
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+CONNECT_CONCURRENCY = 200  # 동시에 진행하는 연결 수립 수
+
+
+def server_usage(pids: list[int]) -> tuple[float, float]:
+    """서버 프로세스들의 (누적 CPU 시간(초), RSS(MB)) 합계"""
+    cpu_seconds, rss_mb = 0.0, 0.0
+    for pid in pids:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        cpu_seconds += (int(fields[11]) + int(fields[12])) / CLOCK_TICKS  # utime + stime
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    rss_mb += int(line.split()[1]) / 1024
+    return cpu_seconds, rss_mb
+
+
+class Watcher:
+    """SSE 구독자 하나 (HTTP/1.1 소켓으로 직접 읽어 클라이언트 측 오버헤드 최소화)"""
+
+    def __init__(self, host: str, port: int, path: str, user_id: int):
+        self._host, self._port, self._path, self._user_id = host, port, path, user_id
+        self._reader = None
+        self._writer = None
+        self.received: dict[int, float] = {}  # claim 이벤트 id -> 수신 시각
+
+    async def connect(self) -> None:
+        """연결 후 snapshot 이벤트까지 수신"""
+        self._reader, self._writer = await asyncio.open_connection(self._host, self._port)
+        self._writer.write((
+            f"GET {self._path} HTTP/1.1\r\nHost: {self._host}\r\n"
+            f"X-USER-ID: {self._user_id}\r\nAccept: text/event-stream\r\n\r\n"
+        ).encode())
+        status = await self._reader.readline()
+        if b" 200 " not in status:
+            raise RuntimeError(f"Stream rejected: {status.decode().strip()}")
+        while not (await self._reader.readline()).startswith(b"event: snapshot"):
+            pass
+
+    async def listen(self) -> None:
+        """claim 이벤트 수신 시각 기록 (chunked 인코딩의 크기 줄은 무시)"""
+        event_id = None
+        while True:
+            line = await self._reader.readline()
+            if not line:
+                return
+            if line.startswith(b"id: "):
+                event_id = int(line[4:])
+            elif line.startswith(b"event: claim") and event_id is not None:
+                self.received[event_id] = time.perf_counter()
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+async def open_watchers(count: int, args) -> list[Watcher]:
+    semaphore = asyncio.Semaphore(CONNECT_CONCURRENCY)
+    path = f"/api/v1/spray/{args.token}/stream"
+
+    async def open_one() -> Watcher:
+        async with semaphore:
+            watcher = Watcher(args.host, args.port, path, args.user_id)
+            await watcher.connect()
+            return watcher
+
+    return list(await asyncio.gather(*(open_one() for _ in range(count))))
+
+
+async def measure(count: int, args) -> dict:
+    cache = SprayStatusCache(get_redis_client())
+    cpu_before, rss_before = server_usage(args.server_pid)
+
+    started = time.perf_counter()
+    watchers = await open_watchers(count, args)
+    connect_seconds = time.perf_counter() - started
+    listeners = [asyncio.create_task(watcher.listen()) for watcher in watchers]
+    try:
+        await asyncio.sleep(1)  # 연결 수립 직후 처리 정리 대기
+        cpu_connected, rss_connected = server_usage(args.server_pid)
+
+        # 유휴 구간: keepalive 만 전송
+        await asyncio.sleep(args.idle_seconds)
+        cpu_idle, _ = server_usage(args.server_pid)
+
+        # 전파 구간: 받기 내역 1건씩 발행 후 모든 구독자 수신까지 대기
+        latencies = []
+        for sequence in range(args.events):
+            published = time.perf_counter()
+            version = await cache.bump(args.token, [{"user_id": -(sequence + 1), "amount": 0}])
+            while sum(version in watcher.received for watcher in watchers) < count:
+                if time.perf_counter() - published > 30:
+                    raise RuntimeError(f"Event {version} not delivered to all watchers")
+                await asyncio.sleep(0.005)
+            latencies.append((max(watcher.received[version] for watcher in watchers) - published) * 1000)
+        cpu_events, _ = server_usage(args.server_pid)
+    finally:
+        for listener in listeners:
+            listener.cancel()
+        for watcher in watchers:
+            watcher.close()
+
+    return {
+        "connect_seconds": connect_seconds,
+        "connect_cpu": cpu_connected - cpu_before,
+        "rss_mb": rss_connected - rss_before,
+        "idle_cpu_pct": (cpu_idle - cpu_connected) / args.idle_seconds * 100,
+        "event_cpu_ms": (cpu_events - cpu_idle) / args.events * 1000,
+        "fanout_p50": statistics.median(latencies),
+        "fanout_max": max(latencies),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--token", required=True, help="받기 가능 기간 안의 뿌리기 토큰")
+    parser.add_argument("--user-id", type=int, required=True, help="뿌린 사용자 ID")
+    parser.add_argument("--server-pid", type=int, nargs="+", required=True, help="API 서버 프로세스 ID (워커 여러 개면 모두)")
+    parser.add_argument("--watchers", type=int, nargs="+", default=[1000, 10000], help="구독자 수 목록")
+    parser.add_argument("--idle-seconds", type=float, default=30.0, help="유휴 CPU 측정 시간(초)")
+    parser.add_argument("--events", type=int, default=20, help="전파 비용 측정용 발행 수")
+    args = parser.parse_args()
+
+    print(
+        f"{'watchers':>9}{'connect(s)':>11}{'RSS MB/10k':>11}{'idle CPU%/10k':>14}"
+        f"{'CPU ms/event/10k':>17}{'fanout p50(ms)':>15}{'max':>8}"
+    )
+    for count in args.watchers:
+        result = await measure(count, args)
+        per_10k = 10000 / count
+        print(
+            f"{count:>9}{result['connect_seconds']:>11.1f}{result['rss_mb'] * per_10k:>11.1f}"
+            f"{result['idle_cpu_pct'] * per_10k:>14.2f}{result['event_cpu_ms'] * per_10k:>17.1f}"
+            f"{result['fanout_p50']:>15.1f}{result['fanout_max']:>8.1f}"
+        )
+        await asyncio.sleep(2)  # 서버 측 구독 해제 대기
+
+    await close_redis_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,108 @@
+"""
+토큰 발급 방식별 지연 시간 벤치마크
+
+랜덤 생성 + 중복 재시도(WATCH) 방식, 스크립트 방식, 토큰 풀 방식의 토큰 발급 지연 시간을
+토큰 공간 점유율(10%, 50%, 90%)별로 비교합니다.
+
+실행 방법 (backend 디렉터리에서):
+    python -m benchmarks.token_pool_benchmark --samples 500 --db 15
+
+주의: 지정한 Redis DB 는 측정 전에 FLUSHDB 됩니다. 운영 DB 번호를 사용하지 마세요.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from itertools import product
+
+import redis.asyncio as redis
+
+from src.core.config import settings
+from src.utils.token.token import TOKEN_CHARSET, TOKEN_LENGTH, TokenService
+
+OCCUPANCIES = (0.1, 0.5, 0.9)
+MODES = ("watch", "script", "pool")
+EXPIRY_SECONDS = 7 * 24 * 60 * 60
+
+
+async def fill_live_tokens(client: redis.Redis, occupancy: float) -> None:
+    """전체 토큰 공간 중 occupancy 비율만큼을 사용 중인 토큰으로 채웁니다."""
+    all_tokens = [''.join(chars) for chars in product(TOKEN_CHARSET, repeat=TOKEN_LENGTH)]
+    live_tokens = random.sample(all_tokens, int(len(all_tokens) * occupancy))
+    created_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+
+    async with client.pipeline(transaction=False) as pipe:
+        for token in live_tokens:
+            pipe.sadd("used_tokens", token)
+            pipe.hset(f"token:{token}", mapping={"created_at": created_at, "status": "active"})
+            pipe.expire(f"token:{token}", EXPIRY_SECONDS)
+        await pipe.execute()
+
+
+async def release_token(client: redis.Redis, token: str, mode: str) -> None:
+    """점유율을 유지하기 위해 측정에 사용한 토큰을 되돌립니다."""
+    async with client.pipeline() as pipe:
+        pipe.delete(f"token:{token}")
+        pipe.srem("used_tokens", token)
+        if mode == "pool":
+            pipe.rpush("token_pool", token)
+        await pipe.execute()
+
+
+async def measure(client: redis.Redis, occupancy: float, mode: str, samples: int) -> list[float]:
+    await client.flushdb()
+    await fill_live_tokens(client, occupancy)
+
+    service = TokenService(
+        redis_client=client,
+        use_token_pool=mode == "pool",
+        use_claim_script=mode == "script"
+    )
+    if mode == "pool":
+        await service.init_token_pool(force=True)
+
+    latencies = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        token = await service.generate_token()
+        latencies.append((time.perf_counter() - started) * 1000)
+        await release_token(client, token, mode)
+    return latencies
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=500, help="점유율별 측정 횟수")
+    parser.add_argument("--db", type=int, default=15, help="벤치마크에 사용할 Redis DB 번호 (FLUSHDB 됨)")
+    args = parser.parse_args()
+
+    client = redis.Redis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=args.db,
+        decode_responses=True
+    )
+
+    print(f"{'mode':<8}{'occupancy':>10}{'mean(ms)':>10}{'p50':>8}{'p95':>8}{'p99':>8}")
+    for mode in MODES:
+        for occupancy in OCCUPANCIES:
+            latencies = await measure(client, occupancy, mode, args.samples)
+            print(
+                f"{mode:<8}{occupancy:>10.0%}{statistics.mean(latencies):>10.3f}"
+                f"{percentile(latencies, 50):>8.3f}{percentile(latencies, 95):>8.3f}{percentile(latencies, 99):>8.3f}"
+            )
+
+    await client.flushdb()
+    await client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
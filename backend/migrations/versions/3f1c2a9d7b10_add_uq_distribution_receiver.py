@@ -0,0 +1,37 @@
+"""add uq_distribution_receiver to money_distribution_details
+
+Revision ID: 3f1c2a9d7b10
+Revises: 
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a9d7b10'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 조건부 UPDATE 받기 처리에서 중복 받기를 막는 유니크 제약
+    op.create_unique_constraint(
+        'uq_distribution_receiver',
+        'money_distribution_details',
+        ['distribution_id', 'receiver_id']
+    )
+
+
+def downgrade() -> None:
+    # MySQL 은 유니크 인덱스를 distribution_id 외래 키 인덱스로 사용하므로 대체 인덱스를 먼저 생성
+    op.create_index(
+        'ix_money_distribution_details_distribution_id',
+        'money_distribution_details',
+        ['distribution_id']
+    )
+    op.drop_constraint('uq_distribution_receiver', 'money_distribution_details', type_='unique')
@@ -0,0 +1,42 @@
+"""add claim summary columns to money_distribution
+
+Revision ID: 8b2e4d6f1a3c
+Revises: 3f1c2a9d7b10
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e4d6f1a3c'
+down_revision: Union[str, None] = '3f1c2a9d7b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 받기 처리 시 함께 갱신되는 받기 집계 컬럼
+    op.add_column('money_distribution', sa.Column('claimed_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('money_distribution', sa.Column('claimed_amount', sa.BigInteger(), nullable=False, server_default='0'))
+    op.add_column('money_distribution', sa.Column('last_claimed_at', sa.DateTime(), nullable=True))
+
+    # 기존 뿌리기 건은 분배 내역으로 집계 채우기
+    op.execute(
+        "UPDATE money_distribution SET "
+        "claimed_count = (SELECT COUNT(*) FROM money_distribution_details d "
+        "WHERE d.distribution_id = money_distribution.id AND d.receiver_id IS NOT NULL), "
+        "claimed_amount = (SELECT COALESCE(SUM(d.allocated_amount), 0) FROM money_distribution_details d "
+        "WHERE d.distribution_id = money_distribution.id AND d.receiver_id IS NOT NULL), "
+        "last_claimed_at = (SELECT MAX(d.claimed_at) FROM money_distribution_details d "
+        "WHERE d.distribution_id = money_distribution.id AND d.receiver_id IS NOT NULL)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('money_distribution', 'last_claimed_at')
+    op.drop_column('money_distribution', 'claimed_amount')
+    op.drop_column('money_distribution', 'claimed_count')
@@ -0,0 +1,32 @@
+"""add (distribution_id, claimed_at) index to money_distribution_details
+
+Revision ID: c5e1a7d3b9f2
+Revises: 8b2e4d6f1a3c
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e1a7d3b9f2'
+down_revision: Union[str, None] = '8b2e4d6f1a3c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 상태 조회의 받은 시간순 정렬 (distribution_id = ? ORDER BY claimed_at, id) 을 인덱스 순서로 처리
+    # 받기 처리 쿼리는 uq_distribution_receiver (distribution_id, receiver_id) 를 사용
+    op.create_index(
+        'ix_details_distribution_claimed_at',
+        'money_distribution_details',
+        ['distribution_id', 'claimed_at']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_details_distribution_claimed_at', table_name='money_distribution_details')
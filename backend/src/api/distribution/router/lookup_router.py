@@ -1,23 +1,72 @@
-from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
 from ....db.database import get_db
+from ....db.redis import get_redis
 from ..schema import SprayStatusResponse
 from ..service.lookup_service import LookupService
+from typing import Optional
 import logging
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-@router.get("/spray/{token}", response_model=SprayStatusResponse)
+@router.get(
+    "/spray/{token}",
+    response_model=SprayStatusResponse,
+    responses={304: {"description": "If-None-Match 와 ETag 가 같으면 본문 없이 응답 (변경 없음)"}}
+)
 async def get_spray_status(
     token: str,
     x_user_id: int = Header(..., alias="X-USER-ID"),
-    db: AsyncSession = Depends(get_db)
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+    db: AsyncSession = Depends(get_db),
+    redis_client: Redis = Depends(get_redis)
 ):
     """
     뿌리기 건의 현재 상태를 조회합니다.
     - 뿌린 사람 자신만 조회 가능
     - 뿌린 시점으로부터 7일 동안 조회 가능
+    - 응답의 ETag 를 If-None-Match 로 보내면 받기 내역이 바뀌지 않은 경우 304 응답
     """
-    lookup_service = LookupService(db)
-    return await lookup_service.get_spray_status(token, x_user_id) 
\ No newline at end of file
+    lookup_service = LookupService(db, redis_client)
+    body, etag = await lookup_service.get_spray_status_cached(token, x_user_id, if_none_match)
+
+    # 캐시된 응답도 매번 ETag 로 재검증하도록 설정
+    headers = {"Cache-Control": "private, no-cache"}
+    if etag:
+        headers["ETag"] = etag
+    if body is None:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get(
+    "/spray/{token}/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}, "description": "snapshot / claim / resync / end 이벤트 스트림"}}
+)
+async def stream_spray_status(
+    token: str,
+    x_user_id: int = Header(..., alias="X-USER-ID"),
+    db: AsyncSession = Depends(get_db),
+    redis_client: Redis = Depends(get_redis)
+):
+    """
+    뿌리기 건의 상태 변경을 Server-Sent Events 로 전달합니다. (조회 API 폴링 대체)
+    - 조회 API 와 같은 권한 / 조회 가능 기간 적용
+    - 현재 상태(snapshot) 이후 받기가 반영될 때마다 받기 내역(claim) 전달
+    - 받기 가능 기간(10분)이 끝나거나 모두 받으면 end 이벤트 후 종료
+    - resync 이벤트를 받으면 조회 API 로 전체 상태를 다시 조회
+    """
+    lookup_service = LookupService(db, redis_client)
+    events = await lookup_service.open_status_stream(token, x_user_id)
+
+    # 스트림이 열려 있는 동안 DB 커넥션을 점유하지 않도록 반환
+    await db.close()
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}  # 프록시 버퍼링 비활성화
+    )
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, Header
+from fastapi import APIRouter, Depends, Header, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
 from ....db.database import get_db
-from ..schema import ReceiveRequest, ReceiveResponse
+from ....db.redis import get_redis
+from ....core.config import settings
+from ..schema import ReceiveRequest, ReceiveResponse, ReceiveAcceptedResponse, ReceiveStatusResponse
 from ..service.receive_service import ReceiveService
 import logging
 
@@ -13,12 +16,43 @@ async def receive_money(
     request: ReceiveRequest,
     x_user_id: int = Header(...),  # 필수 헤더
     x_room_id: str = Header(...),  # 필수 헤더
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis_client: Redis = Depends(get_redis)
 ):
     """돈 받기 요청을 처리하는 엔드포인트"""
-    service = ReceiveService(db)
+    service = ReceiveService(db, redis_client)
     return await service.process_receive_request(
         token=request.token,
         user_id=x_user_id,
         room_id=x_room_id
-    ) 
\ No newline at end of file
+    )
+
+@router.post("/receive/async", response_model=ReceiveAcceptedResponse, status_code=status.HTTP_202_ACCEPTED)
+async def receive_money_async(
+    request: ReceiveRequest,
+    x_user_id: int = Header(...),  # 필수 헤더
+    x_room_id: str = Header(...),  # 필수 헤더
+    db: AsyncSession = Depends(get_db),
+    redis_client: Redis = Depends(get_redis)
+):
+    """돈 받기 요청을 접수만 하고 claim ID 를 반환하는 엔드포인트 (결과는 상태 조회로 확인)"""
+    service = ReceiveService(db, redis_client)
+    claim_id = await service.process_receive_request_async(
+        token=request.token,
+        user_id=x_user_id,
+        room_id=x_room_id
+    )
+    return ReceiveAcceptedResponse(claim_id=claim_id)
+
+@router.get("/receive/claims/{claim_id}", response_model=ReceiveStatusResponse)
+async def get_receive_status(
+    claim_id: str,
+    wait: float = Query(0, ge=0, le=settings.RECEIVE_STATUS_MAX_WAIT_SECONDS, description="처리 완료까지 대기할 최대 시간(초, long-poll)"),
+    x_user_id: int = Header(...),  # 필수 헤더
+    db: AsyncSession = Depends(get_db),
+    redis_client: Redis = Depends(get_redis)
+):
+    """비동기 받기 요청의 처리 상태를 조회하는 엔드포인트"""
+    service = ReceiveService(db, redis_client)
+    result = await service.get_claim_status(claim_id, x_user_id, wait)
+    return ReceiveStatusResponse(**result)
@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, Header
 from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
 from ....db.database import get_db
-from ..schema import SprayRequest, SprayResponse
+from ....db.redis import get_redis
+from ..schema import SprayRequest, SprayResponse, BulkSprayRequest, BulkSprayResponse
 from ..service.spray_service import SprayService
 import logging
 
@@ -13,14 +15,34 @@ async def create_spray(
     request: SprayRequest,
     x_user_id: int = Header(...),
     x_room_id: str = Header(...),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis_client: Redis = Depends(get_redis)
 ):
-    service = SprayService(db)
+    service = SprayService(db, redis_client)
     token = await service.create_spray(
         user_id=x_user_id,
         room_id=x_room_id,
         total_amount=request.total_amount,
-        recipient_count=request.recipient_count
+        recipient_count=request.recipient_count,
+        distribution_type=request.distribution_type
     )
     
-    return SprayResponse(token=token) 
\ No newline at end of file
+    return SprayResponse(token=token)
+
+@router.post("/spray/bulk", response_model=BulkSprayResponse)
+async def create_sprays_bulk(
+    request: BulkSprayRequest,
+    x_user_id: int = Header(...),
+    db: AsyncSession = Depends(get_db),
+    redis_client: Redis = Depends(get_redis)
+):
+    """
+    여러 건의 뿌리기를 한 번에 생성합니다. (이벤트 캠페인용)
+    - 토큰은 Redis round trip 한 번으로 일괄 발급
+    - 일정 건수 단위로 한 트랜잭션에서 multi-row INSERT 로 저장
+    - 항목별 성공/실패 결과 반환
+    """
+    service = SprayService(db, redis_client)
+    results = await service.create_sprays(user_id=x_user_id, items=request.items)
+
+    return BulkSprayResponse(results=results) 
\ No newline at end of file
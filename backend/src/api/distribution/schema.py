@@ -1,10 +1,12 @@
 from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 from typing import List, Optional
+from src.common.enums import DistributionType
 
 class SprayRequest(BaseModel):
     total_amount: int = Field(..., description="뿌릴 총 금액", gt=0)
     recipient_count: int = Field(..., description="뿌릴 인원 수", gt=0)
+    distribution_type: DistributionType = Field(DistributionType.EQUAL, description="분배 방식 (EQUAL: 동일 분배, RANDOM: 랜덤 분배, FIRST_COME_BONUS: 선착순 보너스)")
 
     @field_validator('recipient_count')
     def validate_recipient_count(cls, v, info):
@@ -17,12 +19,57 @@ class SprayRequest(BaseModel):
 class SprayResponse(BaseModel):
     token: str = Field(..., description="생성된 뿌리기 토큰 (3자리)")
 
+class BulkSprayItem(SprayRequest):
+    """대량 뿌리기 항목"""
+    room_id: str = Field(..., description="뿌릴 대화방 ID")
+
+class BulkSprayRequest(BaseModel):
+    """대량 뿌리기 요청"""
+    items: List[BulkSprayItem] = Field(..., description="뿌리기 항목 목록", min_length=1, max_length=10000)
+
+class BulkSprayItemResult(BaseModel):
+    """대량 뿌리기 항목별 결과"""
+    index: int = Field(..., description="요청 항목 순번 (0부터 시작)")
+    success: bool = Field(..., description="생성 성공 여부")
+    token: Optional[str] = Field(None, description="생성된 뿌리기 토큰 (성공 시)")
+    error: Optional[str] = Field(None, description="실패 사유 (실패 시)")
+
+class BulkSprayResponse(BaseModel):
+    """대량 뿌리기 응답"""
+    results: List[BulkSprayItemResult] = Field(default_factory=list, description="항목별 결과 목록")
+
 class ReceiveRequest(BaseModel):
     token: str
 
 class ReceiveResponse(BaseModel):
     received_amount: int
 
+class ReceiveAcceptedResponse(BaseModel):
+    """비동기 받기 요청 접수 응답"""
+    claim_id: str = Field(..., description="받기 요청 ID (상태 조회용)")
+    status: str = Field("PENDING", description="처리 상태")
+
+class ReceiveStatusResponse(BaseModel):
+    """비동기 받기 요청 처리 상태"""
+    claim_id: str = Field(..., description="받기 요청 ID")
+    status: str = Field(..., description="처리 상태 (PENDING, SUCCESS, FAILED)")
+    received_amount: Optional[int] = Field(None, description="받은 금액 (성공 시)")
+    error: Optional[str] = Field(None, description="실패 사유 (실패 시)")
+
+class ReceiveValidationContext(BaseModel):
+    """API 단계 받기 검증 결과 (태스크 payload 로 워커에 전달, 이후 바뀌지 않는 값만 포함)"""
+    distribution_id: int = Field(..., description="뿌리기 건 ID")
+    creator_id: int = Field(..., description="뿌린 사용자 ID")
+    created_at: datetime = Field(..., description="뿌린 시각 (받기 가능 시간 재검증용)")
+
+    @classmethod
+    def from_distribution(cls, distribution) -> "ReceiveValidationContext":
+        return cls(
+            distribution_id=distribution.id,
+            creator_id=distribution.creator_id,
+            created_at=distribution.created_at
+        )
+
 class SprayReceiveDetail(BaseModel):
     """받기 완료된 정보"""
     amount: int = Field(..., description="받은 금액")
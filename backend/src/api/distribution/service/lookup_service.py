@@ -1,8 +1,21 @@
+import asyncio
+import json
 from datetime import datetime, timedelta
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
+from typing import AsyncIterator, Optional, Tuple
 import logging
+import redis
 from src.utils.token.token import TokenService
+from src.utils.spray_status_cache.spray_status_cache import SprayStatusCache
+from src.utils.spray_status_stream.spray_status_stream import (
+    RESYNC,
+    SprayStatusHub,
+    get_spray_status_hub,
+    sse_event
+)
+from src.core.config import settings
 from fastapi import HTTPException
 from ..schema import SprayStatusResponse, SprayReceiveDetail
 
@@ -14,61 +27,239 @@ from ....db.models import (
 logger = logging.getLogger(__name__)
 
 class LookupService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, redis_client: Optional[Redis] = None):
         self.db = db
-        self._token_service = TokenService()
+        self._token_service = TokenService(redis_client)
+        self._status_cache = SprayStatusCache(redis_client)
+        self._lookup_days = 7  # 조회 가능 기간
+        self._receive_window = timedelta(minutes=10)  # 받기 가능 기간 (이후에는 상태가 바뀌지 않음)
+        self._stream_grace = timedelta(seconds=5)  # 받기 가능 기간 직전에 커밋된 받기 내역의 발행 대기 시간
+        self._stream_keepalive_seconds = settings.SPRAY_STREAM_KEEPALIVE_SECONDS
 
     async def get_spray_status(self, token: str, user_id: int) -> SprayStatusResponse:
         """
         뿌리기 건의 현재 상태를 조회합니다.
         - 뿌린 사람 자신만 조회 가능
         - 뿌린 시점으로부터 7일 동안 조회 가능
+
+        뿌리기 정보 / 받기 집계 / 받기 완료 내역을 한 번의 쿼리로 조회합니다.
         """
-        # 뿌리기 정보 조회
-        spray = await self.get_spray_by_token(token)
-        if not spray:
-            raise HTTPException(status_code=404, detail="해당 토큰의 뿌리기 건이 존재하지 않습니다.")
-        
-        # 뿌린 사람 본인인지 확인
-        if spray.creator_id != user_id:
-            raise HTTPException(status_code=403, detail="뿌리기 건은 생성자만 조회할 수 있습니다.")
-        
-        # 상세 정보 조회
-        details = await self.get_spray_details(spray.id)
-        
-        # 디버깅을 위한 로그 추가
-        logger.debug(f"Spray details - token: {token}, details count: {len(details)}")
-        logger.debug(f"Details with receivers: {[d for d in details if d.receiver_id is not None]}")
-        
-        # 받기 완료된 금액 총합 계산
-        total_received = sum(detail.allocated_amount for detail in details if detail.receiver_id is not None)
-        
-        # 받기 완료된 정보 목록 생성
+        # Redis에서 토큰 유효성 먼저 확인
+        if not await self._token_service.validate_token(token):
+            raise ValueError("유효하지 않은 토큰입니다.")
+
+        rows = await self.get_spray_status_rows(token)
+        if not rows:
+            raise ValueError("해당 토큰으로 분배된 내역이 없습니다.")
+
+        # 뿌리기 정보와 합계는 모든 행에 동일하게 포함됨
+        spray = rows[0]
+        self._check_access(spray.created_at, spray.creator_id, user_id)
+
+        # 받기 완료된 정보 목록 생성 (받은 건이 없으면 상세 컬럼이 NULL 인 행 하나만 존재)
         received_list = [
-            SprayReceiveDetail(
-                amount=detail.allocated_amount,
-                user_id=detail.receiver_id
-            )
-            for detail in details
-            if detail.receiver_id is not None  # 받은 건만 포함
+            SprayReceiveDetail(amount=row.allocated_amount, user_id=row.receiver_id)
+            for row in rows
+            if row.receiver_id is not None
         ]
-        
-        response = SprayStatusResponse(
+        logger.debug(f"Spray status - token: {token}, received count: {len(received_list)}")
+
+        return SprayStatusResponse(
             spray_time=spray.created_at,
             spray_amount=spray.total_amount,
-            received_amount=total_received,
+            received_amount=spray.received_amount,
             received_list=received_list
         )
-        
-        # 최종 응답 로깅
-        logger.debug(f"Final response: {response}")
-        
-        return response
+
+    async def get_spray_status_cached(
+        self,
+        token: str,
+        user_id: int,
+        if_none_match: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        응답 캐시를 사용하는 뿌리기 상태 조회 - (응답 본문 JSON, ETag) 반환
+
+        캐시된 응답이 현재 버전이면 DB 를 조회하지 않고, If-None-Match 가 현재 ETag 와 같으면
+        본문 대신 None 을 반환합니다 (304). 캐시 Redis 장애 시에는 캐시 없이 조회합니다 (ETag 없음).
+        """
+        body, version, _ = await self._load_status(token, user_id)
+        if version is None:
+            return body, None
+
+        etag = SprayStatusCache.etag(token, version)
+        if self._etag_matches(if_none_match, etag):
+            return None, etag
+        return body, etag
+
+    async def _load_status(self, token: str, user_id: int) -> Tuple[str, Optional[str], datetime]:
+        """
+        캐시를 사용하는 상태 조회 - (응답 본문 JSON, 응답 버전, 뿌린 시각) 반환
+
+        캐시 Redis 장애 시에는 캐시 없이 조회하며 버전은 None 입니다.
+        """
+        try:
+            version, entry = await self._status_cache.get(token)
+        except redis.RedisError as e:
+            logger.warning(f"Spray status cache unavailable: {str(e)}")
+            response = await self.get_spray_status(token, user_id)
+            return response.model_dump_json(), None, response.spray_time
+
+        if entry is not None:
+            created_at = datetime.fromisoformat(entry["created_at"])
+            self._check_access(created_at, int(entry["creator_id"]), user_id)
+            return entry["body"], version, created_at
+
+        response = await self.get_spray_status(token, user_id)
+        body = response.model_dump_json()
+
+        # 조회 가능 기간이 끝나면 캐시도 만료되도록 TTL 제한
+        remaining = response.spray_time + timedelta(days=self._lookup_days) - datetime.utcnow()
+        try:
+            # 조회 시작 전에 읽은 버전으로 저장하므로 그 사이 받기가 반영되었으면 저장되지 않음
+            await self._status_cache.set(
+                token,
+                version,
+                creator_id=user_id,  # 권한 검증을 통과했으므로 조회한 사용자가 뿌린 사람
+                created_at=response.spray_time.isoformat(),
+                body=body,
+                ttl=int(remaining.total_seconds())
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Failed to fill spray status cache: {str(e)}")
+
+        return body, version, response.spray_time
+
+    async def open_status_stream(
+        self,
+        token: str,
+        user_id: int,
+        hub: Optional[SprayStatusHub] = None
+    ) -> AsyncIterator[str]:
+        """
+        뿌리기 상태 스트림 (SSE) 시작 - 권한 확인 후 이벤트 프레임을 내보내는 async iterator 반환
+
+        - snapshot: 현재 상태 전체 (조회 API 응답과 동일, id 는 응답 버전)
+        - claim: 이후 커밋된 받기 내역 {"version", "claims": [{"user_id", "amount"}]}
+        - resync: 내역 일부를 놓쳤으므로 조회 API 로 전체 상태를 다시 받아야 함
+        - end: 받기 가능 기간이 끝났거나 모두 받아 더 이상 변경이 없음
+
+        발행된 내역을 놓치지 않도록 구독을 먼저 한 뒤 스냅샷을 조회하므로, 스냅샷에 이미 포함된
+        받기 내역이 claim 으로 한 번 더 올 수 있습니다 (클라이언트는 user_id 로 중복 제거).
+        권한 / 기간 검증은 이 메서드에서 끝나고, 반환된 iterator 는 DB 세션을 사용하지 않습니다.
+        """
+        try:
+            hub = hub or await get_spray_status_hub()
+            queue = await hub.subscribe(token)
+        except redis.RedisError as e:
+            logger.warning(f"Spray status stream unavailable: {str(e)}")
+            raise HTTPException(status_code=503, detail="상태 스트림을 사용할 수 없습니다. 상태 조회 API 를 사용해주세요.")
+
+        try:
+            body, version, created_at = await self._load_status(token, user_id)
+        except BaseException:
+            await hub.unsubscribe(token, queue)
+            raise
+
+        return self._stream_events(
+            hub,
+            token,
+            queue,
+            body,
+            int(version) if version is not None else 0,
+            created_at + self._receive_window + self._stream_grace
+        )
+
+    async def _stream_events(
+        self,
+        hub: SprayStatusHub,
+        token: str,
+        queue: asyncio.Queue,
+        body: str,
+        version: int,
+        closes_at: datetime
+    ) -> AsyncIterator[str]:
+        snapshot = json.loads(body)
+        remaining_amount = snapshot["spray_amount"] - snapshot["received_amount"]
+        # 스냅샷과 claim 에 중복으로 포함된 받기 내역은 남은 금액에서 한 번만 차감
+        receivers = {received["user_id"] for received in snapshot["received_list"]}
+        try:
+            yield sse_event("snapshot", body, version)
+            while remaining_amount > 0:
+                timeout = (closes_at - datetime.utcnow()).total_seconds()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), min(timeout, self._stream_keepalive_seconds))
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"  # 프록시 유휴 연결 종료 방지
+                    continue
+
+                if item is RESYNC:
+                    yield sse_event("resync", "{}")
+                    continue
+                item_version, claims, frame = item
+                if item_version <= version:  # 스냅샷에 이미 반영된 버전
+                    continue
+                yield frame
+                for claim in claims:
+                    if claim["user_id"] not in receivers:
+                        receivers.add(claim["user_id"])
+                        remaining_amount -= claim["amount"]
+            yield sse_event("end", "{}")
+        finally:
+            await hub.unsubscribe(token, queue)
+
+    def _check_access(self, created_at: datetime, creator_id: int, user_id: int) -> None:
+        """조회 가능 기간 / 뿌린 사람 본인 여부 확인"""
+        # 7일 이내 조회 가능 확인
+        if datetime.utcnow() > created_at + timedelta(days=self._lookup_days):
+            raise ValueError("조회 가능 기간이 만료되었습니다.")
+
+        # 뿌린 사람 본인인지 확인
+        if creator_id != user_id:
+            raise HTTPException(status_code=403, detail="뿌리기 건은 생성자만 조회할 수 있습니다.")
+
+    @staticmethod
+    def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+        """If-None-Match 헤더(여러 값 / 약한 비교 허용)가 ETag 와 일치하는지 확인"""
+        if not if_none_match:
+            return False
+        candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+        return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+    async def get_spray_status_rows(self, token: str) -> list:
+        """
+        뿌리기 정보 + 받기 집계 + 받기 완료 내역 조회 (단일 쿼리, 필요한 컬럼만 조회)
+
+        받은 금액 합계는 받기 처리 시 갱신되는 집계 컬럼을 사용하고, 분배 내역은
+        받기 완료된 행만 LEFT JOIN 하므로 행마다 뿌리기 정보가 함께 반환됩니다 (받은 시간순 정렬).
+        """
+        query = (
+            select(
+                MoneyDistribution.creator_id,
+                MoneyDistribution.created_at,
+                MoneyDistribution.total_amount,
+                MoneyDistribution.claimed_amount.label("received_amount"),
+                MoneyDistributionDetail.allocated_amount,
+                MoneyDistributionDetail.receiver_id
+            )
+            .outerjoin(
+                MoneyDistributionDetail,
+                and_(
+                    MoneyDistributionDetail.distribution_id == MoneyDistribution.id,
+                    MoneyDistributionDetail.receiver_id.is_not(None)
+                )
+            )
+            .where(MoneyDistribution.token == token)
+            .order_by(MoneyDistributionDetail.claimed_at, MoneyDistributionDetail.id)  # 받은 시간순으로 정렬
+        )
+        return (await self.db.execute(query)).all()
 
     async def get_spray_by_token(self, token: str) -> MoneyDistribution:
         """토큰으로 뿌리기 건을 조회합니다."""
         # Redis에서 토큰 유효성 먼저 확인
-        if not self._token_service.validate_token(token):
+        if not await self._token_service.validate_token(token):
             raise ValueError("유효하지 않은 토큰입니다.")
 
         # MySQL에서 상세 정보 조회
@@ -1,15 +1,39 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from sqlalchemy import select, and_, update
+from uuid import uuid4
+from celery.exceptions import TimeoutError as CeleryTimeoutError
+from sqlalchemy import select, and_, or_, case, update, text, insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+import redis
+from redis.asyncio import Redis
+from typing import Optional, Union
 import logging
 from fastapi import HTTPException
-from ....worker.tasks import process_receive_money
+from ..schema import ReceiveValidationContext
+from ....worker.tasks import process_receive_money, process_receive_money_batch
+from ....worker.celery_app import get_queue_depth
+from ....worker.routing import receive_queue_for
 from fastapi import status
+from ....core.config import settings
+from ....db.redis import redis_circuit_breaker, PoolExhaustedError
+from ....utils.claim_result.claim_result_store import ClaimResultStore
+from ....utils.membership.membership_cache import MembershipCache
+from ....utils.spray_status_cache.spray_status_cache import SprayStatusCache
+from ....utils.result_channel.result_channel import get_result_channel, RESULT_FAILED
+from ....utils.receive_dispatch.receive_dispatch import ReceiveDispatcher, PATH_INLINE, PATH_CELERY
+from ....utils.claim_queue.claim_queue import (
+    ClaimQueue,
+    CLAIM_DUPLICATE,
+    CLAIM_EXHAUSTED,
+    CLAIM_MISSING
+)
 
 from ....db.models import (
     MoneyDistribution,
     MoneyDistributionDetail,
-    ChatRoomMember,
     TransactionHistory,
     TransactionTypeEnum as TransactionType,
     TransactionStatusEnum as TransactionStatus,
@@ -18,51 +42,92 @@ from ....db.models import (
 
 logger = logging.getLogger(__name__)
 
+# 동기 받기 요청의 태스크 결과 대기용 스레드 풀
+_receive_wait_executor = ThreadPoolExecutor(
+    max_workers=settings.RECEIVE_WAIT_THREADS,
+    thread_name_prefix="receive-wait"
+)
+
+# 받기 처리 경로 선택기 (프로세스 단위, 경로별 지표 집계)
+receive_dispatcher = ReceiveDispatcher(
+    max_in_flight=settings.RECEIVE_INLINE_MAX_IN_FLIGHT,
+    max_queue_depth=settings.RECEIVE_INLINE_MAX_QUEUE_DEPTH,
+    depth_ttl=settings.RECEIVE_QUEUE_DEPTH_CACHE_SECONDS,
+    depth_probe=get_queue_depth,
+    queue_for=receive_queue_for,
+    # 샤드 큐를 쓰면 샤드별 단일 워커의 처리 순서를 앞지르지 않도록 inline 조건을 강화
+    serialize_queues=settings.RECEIVE_QUEUE_SHARDS > 1
+)
+
 class ReceiveService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, redis_client: Optional[Redis] = None):
         self.db = db
+        self._claim_queue = ClaimQueue(redis_client)
+        self._membership = MembershipCache(redis_client)
+        self._status_cache = SprayStatusCache(redis_client)
+        self._claim_results = ClaimResultStore(redis_client)
 
     async def process_receive_request(self, token: str, user_id: int, room_id: str) -> dict:
         """
         돈 받기 요청을 처리하는 메서드
         
         1. 기본 유효성 검증 수행
-        2. Celery 태스크로 실제 처리 위임
+        2. 처리 경로 선택 후 실제 처리
+           - inline: 큐가 한가하고 같은 토큰의 처리 중 요청이 적으면 요청 세션으로 바로 처리
+             (샤드 큐 사용 시에는 같은 샤드로 처리 중인 요청이 없고 큐가 비어 있을 때만)
+           - celery: Celery 태스크로 위임 (결과 대기는 별도 스레드에서 수행하여 이벤트 루프를 막지 않음)
         3. 처리 결과 반환
         """
         try:
             logger.info(f"Processing receive request - Token: {token}, User: {user_id}, Room: {room_id}")
             
             # 기본 검증 (채팅방 멤버십, 토큰 유효성 등)
-            await self.validate_receive_request(token, user_id, room_id)
+            context = await self.validate_receive_request(token, user_id, room_id)
             logger.info("Request validation passed")
             
-            # Celery 태스크로 실제 처리 위임
+            # Celery 태스크로 실제 처리 위임 (검증 결과를 함께 넘겨 워커의 중복 조회 생략)
             task_kwargs = {
                 "token": token,
                 "user_id": user_id,
-                "room_id": room_id
+                "room_id": room_id,
+                "context": context.model_dump(mode="json")
             }
             
-            # 태스크 실행 및 결과 대기
-            logger.info("Delegating to Celery worker...")
-            task = process_receive_money.apply_async(
-                kwargs=task_kwargs,
-                queue='receive_requests'
-            )
-            
+            # 처리 경로 선택 (한가하면 Celery 를 거치지 않고 요청 세션으로 바로 처리)
+            if settings.RECEIVE_INLINE_ENABLED:
+                path = await receive_dispatcher.choose_path(token)
+            else:
+                path = PATH_CELERY
+
+            started = time.perf_counter()
+            success = False
             try:
-                # 결과 대기 시간을 10초로 설정
-                result = task.get(timeout=10)
+                if path == PATH_INLINE:
+                    logger.info("Processing inline...")
+                    with receive_dispatcher.track(token):
+                        received_amount = await self.receive_money(token, user_id, room_id, context)
+                    result = {"received_amount": received_amount}
+                else:
+                    # 태스크 실행 및 결과 대기
+                    logger.info("Delegating to Celery worker...")
+                    with receive_dispatcher.track_dispatch(token):
+                        if settings.RECEIVE_RESULT_CHANNEL == "redis":
+                            result = await self._dispatch_and_wait_redis(task_kwargs)
+                        else:
+                            loop = asyncio.get_running_loop()
+                            result = await loop.run_in_executor(_receive_wait_executor, self._dispatch_and_wait, task_kwargs)
                 logger.info(f"Task completed. Result: {result}")
+                success = True
                 return result
                 
-            except TimeoutError:
+            except (CeleryTimeoutError, TimeoutError):
                 logger.error("Task processing timed out")
                 raise HTTPException(
                     status_code=408,
                     detail="요청 처리 시간이 초과되었습니다. 잠시 후 다시 시도해주세요."
                 )
+            finally:
+                receive_dispatcher.record(path, time.perf_counter() - started, success)
                 
         except ValueError as e:
             logger.error(f"Validation error: {str(e)}")
@@ -73,32 +138,195 @@ class ReceiveService:
             logger.error(f"Unexpected error: {str(e)}", exc_info=True)
             raise HTTPException(status_code=500, detail="Internal server error") 
 
-    async def receive_money(self, token: str, user_id: int, room_id: str) -> int:
+    @staticmethod
+    def _dispatch_and_wait(task_kwargs: dict) -> dict:
+        """태스크 발행 후 결과 대기 (rpc 백엔드는 발행한 스레드로 결과를 돌려주므로 같은 스레드에서 수행)"""
+        task = ReceiveService._receive_task().apply_async(
+            kwargs=task_kwargs,
+            queue=receive_queue_for(task_kwargs["token"])  # 토큰별 샤드 큐
+        )
+        return task.get(timeout=settings.RECEIVE_RESULT_TIMEOUT_SECONDS)
+
+    @staticmethod
+    def _publish_task(task_kwargs: dict, task_id: str) -> None:
+        """결과 백엔드를 거치지 않는 태스크 발행 (결과는 reply_channel 또는 ClaimResultStore 로 전달됨)"""
+        ReceiveService._receive_task().apply_async(
+            kwargs=task_kwargs,
+            queue=receive_queue_for(task_kwargs["token"]),  # 토큰별 샤드 큐
+            task_id=task_id,
+            ignore_result=True
+        )
+
+    async def _dispatch_and_wait_redis(self, task_kwargs: dict) -> dict:
+        """
+        태스크 발행 후 Redis pub/sub 결과 채널로 결과 대기
+
+        구독은 프로세스 단위로 한 번만 하고 요청은 task_id 로 결과를 기다리므로
+        대기 중인 요청이 스레드를 점유하지 않습니다.
+        """
+        channel = await get_result_channel()
+        task_id = str(uuid4())
+        # pub/sub 은 메시지를 보관하지 않으므로 발행 전에 대기 등록
+        channel.expect(task_id)
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                _receive_wait_executor,
+                self._publish_task,
+                {**task_kwargs, "reply_channel": channel.name},
+                task_id
+            )
+        except Exception:
+            channel.discard(task_id)
+            raise
+
+        message = await channel.wait(task_id, timeout=settings.RECEIVE_RESULT_TIMEOUT_SECONDS)
+        if message["status"] == RESULT_FAILED:
+            # 검증 실패는 400, 그 외는 500 으로 응답되도록 예외 종류 유지
+            if message.get("validation_error"):
+                raise ValueError(message["error"])
+            raise RuntimeError(message["error"])
+        return {"received_amount": message["received_amount"]}
+
+    @staticmethod
+    def _receive_task():
+        """받기 처리 태스크 (micro-batching 사용 시 배치 태스크)"""
+        if settings.RECEIVE_BATCH_ENABLED:
+            return process_receive_money_batch
+        return process_receive_money
+
+    async def process_receive_request_async(self, token: str, user_id: int, room_id: str) -> str:
+        """
+        돈 받기 요청을 큐에 넣고 결과를 기다리지 않고 claim ID 반환
+
+        처리 결과는 워커가 ClaimResultStore 에 기록하며 get_claim_status 로 조회합니다.
+        """
+        try:
+            context = await self.validate_receive_request(token, user_id, room_id)
+
+            # 워커가 결과를 기록하기 전에 PENDING 상태가 먼저 기록되도록 태스크 ID 를 미리 생성
+            claim_id = str(uuid4())
+            await self._claim_results.create(claim_id, user_id)
+
+            # 브로커 발행은 블로킹 호출이므로 이벤트 루프를 막지 않도록 별도 스레드에서 수행
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                _receive_wait_executor,
+                self._publish_task,
+                {
+                    "token": token,
+                    "user_id": user_id,
+                    "room_id": room_id,
+                    "store_result": True,
+                    "context": context.model_dump(mode="json")
+                },
+                claim_id
+            )
+            return claim_id
+
+        except ValueError as e:
+            logger.error(f"Validation error: {str(e)}")
+            raise HTTPException(status_code=400, detail=str(e))
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    async def get_claim_status(self, claim_id: str, user_id: int, wait: float = 0) -> dict:
+        """비동기 받기 요청의 처리 상태 조회 (wait 초 동안 처리 완료를 기다림)"""
+        if wait > 0:
+            result = await self._claim_results.wait(claim_id, wait)
+        else:
+            result = await self._claim_results.get(claim_id)
+
+        # 다른 사용자의 요청은 존재 여부도 노출하지 않음
+        if result is None or result["user_id"] != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="받기 요청을 찾을 수 없습니다."
+            )
+        return result
+
+    async def receive_money(
+        self,
+        token: str,
+        user_id: int,
+        room_id: str,
+        context: Optional[ReceiveValidationContext] = None
+    ) -> int:
+        """
+        뿌린 금액 받기 - RECEIVE_CLAIM_MODE 에 따라 처리 방식 선택
+
+        context 는 API 단계(validate_receive_request)의 검증 결과입니다. 주어지면 뿌리기 건 조회와
+        이미 받은 사용자 조회를 생략하고, 단계 사이에 바뀔 수 있는 조건(받기 가능 시간, 남은 금액,
+        중복 받기)만 다시 확인합니다. 중복 받기는 (distribution_id, receiver_id) 유니크 제약으로 막습니다.
+        """
+        if settings.RECEIVE_CLAIM_MODE == "conditional_update":
+            return await self._receive_money_with_conditional_update(token, user_id, room_id, context)
+        if settings.RECEIVE_CLAIM_MODE == "redis_queue":
+            amount = await self._receive_money_from_queue(token, user_id, room_id, context)
+            if amount is not None:
+                return amount
+        return await self._receive_money_with_lock(token, user_id, room_id, context)
+
+    async def _load_receive_target(
+        self,
+        token: str,
+        room_id: str,
+        context: Optional[ReceiveValidationContext],
+        lock: bool = False
+    ) -> ReceiveValidationContext:
+        """받기 대상 뿌리기 건 (API 단계 검증 결과가 있으면 토큰 조회 생략, lock 이면 행 락 획득)"""
+        if context is not None:
+            if lock:
+                # 받기 직렬화를 위한 행 락만 PK 로 획득
+                lock_query = select(MoneyDistribution.id).where(
+                    MoneyDistribution.id == context.distribution_id
+                ).with_for_update()
+                if (await self.db.execute(lock_query)).scalar_one_or_none() is None:
+                    raise ValueError("유효하지 않은 뿌리기 토큰입니다.")
+            return context
+
+        distribution_query = select(MoneyDistribution).where(
+            and_(
+                MoneyDistribution.token == token,
+                MoneyDistribution.chat_room_id == room_id
+            )
+        )
+        if lock:
+            distribution_query = distribution_query.with_for_update()
+        distribution = (await self.db.execute(distribution_query)).scalar_one_or_none()
+        if not distribution:
+            raise ValueError("유효하지 않은 뿌리기 토큰입니다.")
+        return ReceiveValidationContext.from_distribution(distribution)
+
+    async def _receive_money_with_lock(
+        self,
+        token: str,
+        user_id: int,
+        room_id: str,
+        context: Optional[ReceiveValidationContext] = None
+    ) -> int:
         """뿌린 금액 받기 - 비관적 락을 사용하여 동시성 처리"""
         try:
             # 1. 뿌리기 건 조회 - 비관적 락 적용
-            distribution_query = select(MoneyDistribution).where(
-                and_(
-                    MoneyDistribution.token == token,
-                    MoneyDistribution.chat_room_id == room_id
-                )
-            ).with_for_update()
-            
-            distribution = (await self.db.execute(distribution_query)).scalar_one_or_none()
-            if not distribution:
-                raise ValueError("유효하지 않은 뿌리기 토큰입니다.")
+            target = await self._load_receive_target(token, room_id, context, lock=True)
 
-            # 2. 유효성 검증
-            await self._validate_receive_conditions(distribution, user_id)
+            # 2. 유효성 검증 (API 단계에서 검증된 경우 받기 가능 시간만 재확인)
+            if context is None:
+                await self._validate_receive_conditions(target, user_id)
+            else:
+                self._validate_receive_window(target, user_id)
 
             # 3. 할당되지 않은 분배 내역 가져오기 - 비관적 락 적용
             detail_query = select(MoneyDistributionDetail).where(
                 and_(
-                    MoneyDistributionDetail.distribution_id == distribution.id,
+                    MoneyDistributionDetail.distribution_id == target.distribution_id,
                     MoneyDistributionDetail.receiver_id.is_(None)
                 )
-            ).order_by(MoneyDistributionDetail.id).with_for_update()
-            
+            ).order_by(MoneyDistributionDetail.id).limit(1).with_for_update()  # 미할당 행 전체가 아닌 한 행만 잠금
+
             detail = (await self.db.execute(detail_query)).scalars().first()
             if not detail:
                 raise ValueError("받을 수 있는 금액이 없습니다.")
@@ -114,9 +342,10 @@ class ReceiveService:
                 
             wallet.balance += detail.allocated_amount
 
-            # 5. 분배 내역 업데이트
+            # 5. 분배 내역 업데이트 및 받기 집계 반영
             detail.receiver_id = user_id
             detail.claimed_at = datetime.utcnow()
+            await self._record_claims(target.distribution_id, 1, detail.allocated_amount, detail.claimed_at)
 
             # 6. 거래 이력 기록
             transaction = TransactionHistory(
@@ -124,7 +353,7 @@ class ReceiveService:
                 user_id=user_id,
                 amount=detail.allocated_amount,
                 balance_after=wallet.balance,
-                related_user_id=distribution.creator_id,
+                related_user_id=target.creator_id,
                 token=token,
                 chat_room_id=room_id,
                 description="뿌리기 받기",
@@ -132,28 +361,404 @@ class ReceiveService:
             )
             self.db.add(transaction)
 
+            claimed_amount = detail.allocated_amount  # 커밋 후에는 속성이 만료되므로 미리 보관
             await self.db.commit()
-            return detail.allocated_amount
+            await self._publish_claims(token, [{"user_id": user_id, "amount": claimed_amount}])
+            return claimed_amount
 
+        except IntegrityError:
+            # 검증 결과를 넘겨받아 중복 조회를 생략한 경우 유니크 제약으로 중복 받기 확인
+            await self.db.rollback()
+            raise ValueError("이미 받은 사용자입니다.")
         except Exception as e:
             await self.db.rollback()
             logger.error(f"Error in receive_money: {str(e)}")
             raise
 
-    async def _validate_receive_conditions(self, distribution: MoneyDistribution, user_id: int):
-        """받기 조건을 검증합니다."""
+    async def _receive_money_from_queue(
+        self,
+        token: str,
+        user_id: int,
+        room_id: str,
+        context: Optional[ReceiveValidationContext] = None
+    ) -> Optional[int]:
+        """
+        뿌린 금액 받기 - Redis 분배 금액 큐 사용 (큐가 없는 뿌리기 건이면 None 반환)
+
+        받은 사용자 확인과 금액 선점은 Redis 스크립트 한 번으로 처리하고,
+        MySQL 에는 뿌리기 건 행 락 없이 한 트랜잭션으로 결과만 기록합니다.
+        DB 반영에 실패하면 선점한 금액을 큐로 되돌립니다.
+        """
+        try:
+            target = await self._load_receive_target(token, room_id, context)
+
+            # 중복 받기 여부는 Redis 받은 사용자 Set 으로 확인
+            self._validate_receive_window(target, user_id)
+        except Exception:
+            await self.db.rollback()
+            raise
+
+        claim_status, amount = await self._claim_queue.claim(token, user_id)
+        if claim_status == CLAIM_MISSING:
+            return None
+        if claim_status == CLAIM_DUPLICATE:
+            raise ValueError("이미 받은 사용자입니다.")
+        if claim_status == CLAIM_EXHAUSTED:
+            raise ValueError("받을 수 있는 금액이 없습니다.")
+
+        try:
+            # 1. 선점한 금액과 같은 미할당 분배 내역 하나에 받은 사용자 기록
+            #    (다른 요청이 잡고 있는 행은 건너뛰므로 락 대기 없음)
+            detail_query = select(MoneyDistributionDetail).where(
+                and_(
+                    MoneyDistributionDetail.distribution_id == target.distribution_id,
+                    MoneyDistributionDetail.allocated_amount == amount,
+                    MoneyDistributionDetail.receiver_id.is_(None)
+                )
+            ).order_by(MoneyDistributionDetail.id).limit(1).with_for_update(skip_locked=True)
+
+            detail = (await self.db.execute(detail_query)).scalars().first()
+            if not detail:
+                raise ValueError("받을 수 있는 금액이 없습니다.")
+
+            detail.receiver_id = user_id
+            detail.claimed_at = datetime.utcnow()
+
+            # 2. 지갑 잔액 증가 및 거래 이력 기록
+            await self._credit_receiver(target.creator_id, token, room_id, user_id, amount)
+            await self._record_claims(target.distribution_id, 1, amount, detail.claimed_at)
+
+            await self.db.commit()
+            await self._publish_claims(token, [{"user_id": user_id, "amount": amount}])
+            return amount
+
+        except Exception as e:
+            await self.db.rollback()
+            await self._claim_queue.release(token, user_id, amount)
+            logger.error(f"Error in receive_money (redis_queue): {str(e)}")
+            raise
+
+    async def _receive_money_with_conditional_update(
+        self,
+        token: str,
+        user_id: int,
+        room_id: str,
+        context: Optional[ReceiveValidationContext] = None
+    ) -> int:
+        """
+        뿌린 금액 받기 - 조건부 UPDATE 한 번으로 분배 내역 선점
+
+        SELECT ... FOR UPDATE 대신 '미할당 분배 내역 중 첫 번째' 를 UPDATE 한 문장으로 선점합니다.
+        중복 받기는 (distribution_id, receiver_id) 유니크 제약으로 막고,
+        지갑 잔액은 balance = balance + ? 로 갱신하므로 읽은 값을 미리 잠글 필요가 없습니다.
+        UPDATE 로 잡은 분배 내역 / 지갑 / 집계 행 락은 InnoDB 에서 문장이 끝나도 트랜잭션 커밋까지 유지되므로,
+        선점 이후에는 외부 호출(Redis 발행 등) 없이 DB 문장만 실행하고 곧바로 커밋해 락 유지 구간을 줄입니다.
+        """
+        try:
+            # 1. 뿌리기 건 조회 (락 없음)
+            target = await self._load_receive_target(token, room_id, context)
+
+            # 2. 유효성 검증 (중복 받기는 유니크 제약으로 확인)
+            self._validate_receive_window(target, user_id)
+
+            # 3. 미할당 분배 내역 하나에 받은 사용자 기록
+            claimed_at = datetime.utcnow()
+            try:
+                claimed = await self.db.execute(
+                    self._claim_detail_statement(),
+                    {
+                        "receiver_id": user_id,
+                        "claimed_at": claimed_at,
+                        "distribution_id": target.distribution_id
+                    }
+                )
+            except IntegrityError:
+                raise ValueError("이미 받은 사용자입니다.")
+
+            amount_query = select(MoneyDistributionDetail.allocated_amount).where(
+                and_(
+                    MoneyDistributionDetail.distribution_id == target.distribution_id,
+                    MoneyDistributionDetail.receiver_id == user_id
+                )
+            )
+            amount = (await self.db.execute(amount_query)).scalar_one_or_none()
+            if claimed.rowcount == 0:
+                # 모두 소진된 뒤의 요청이라도 이미 받은 사용자면 중복 받기로 안내
+                if amount is not None:
+                    raise ValueError("이미 받은 사용자입니다.")
+                raise ValueError("받을 수 있는 금액이 없습니다.")
+
+            # 4. 지갑 잔액 증가 및 거래 이력 기록
+            await self._credit_receiver(target.creator_id, token, room_id, user_id, amount)
+            await self._record_claims(target.distribution_id, 1, amount, claimed_at)
+
+            await self.db.commit()
+            await self._publish_claims(token, [{"user_id": user_id, "amount": amount}])
+            return amount
+
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error in receive_money (conditional_update): {str(e)}")
+            raise
+
+    def _claim_detail_statement(self):
+        """미할당 분배 내역 중 ID 가 가장 작은 행 하나를 선점하는 UPDATE 문"""
+        if self.db.bind.dialect.name == "mysql":
+            return text(
+                "UPDATE money_distribution_details "
+                "SET receiver_id = :receiver_id, claimed_at = :claimed_at "
+                "WHERE distribution_id = :distribution_id AND receiver_id IS NULL "
+                "ORDER BY id LIMIT 1"
+            )
+        # UPDATE ... ORDER BY/LIMIT 를 지원하지 않는 DB(테스트용 SQLite 등)는 서브쿼리 사용
+        return text(
+            "UPDATE money_distribution_details "
+            "SET receiver_id = :receiver_id, claimed_at = :claimed_at "
+            "WHERE id = ("
+            "SELECT id FROM money_distribution_details "
+            "WHERE distribution_id = :distribution_id AND receiver_id IS NULL "
+            "ORDER BY id LIMIT 1"
+            ") AND receiver_id IS NULL"
+        )
+
+    async def _credit_receiver(
+        self,
+        creator_id: int,
+        token: str,
+        room_id: str,
+        user_id: int,
+        amount: int
+    ) -> None:
+        """받은 금액만큼 지갑 잔액을 늘리고 거래 이력 기록 (커밋은 호출자가 수행)"""
+        # 조회 후 갱신 대신 단일 UPDATE 로 잔액 증가
+        wallet_update = await self.db.execute(
+            update(UserWallet)
+            .where(UserWallet.user_id == user_id)
+            .values(balance=UserWallet.balance + amount)
+        )
+        if wallet_update.rowcount == 0:
+            raise ValueError("사용자 지갑을 찾을 수 없습니다.")
+
+        balance_query = select(UserWallet.balance).where(UserWallet.user_id == user_id)
+        balance_after = (await self.db.execute(balance_query)).scalar_one()
+
+        transaction = TransactionHistory(
+            transaction_type=TransactionType.RECEIVE,
+            user_id=user_id,
+            amount=amount,
+            balance_after=balance_after,
+            related_user_id=creator_id,
+            token=token,
+            chat_room_id=room_id,
+            description="뿌리기 받기",
+            status=TransactionStatus.SUCCESS
+        )
+        self.db.add(transaction)
+
+    async def _publish_claims(self, token: str, claims: list[dict]) -> None:
+        """
+        받기 반영 후 뿌리기 상태 조회 캐시 버전 증가 및 상태 스트림으로 받기 내역 발행
+
+        받기는 이미 커밋되었으므로 Redis 장애 시에도 실패로 처리하지 않으며,
+        이 경우 캐시된 응답은 SPRAY_STATUS_CACHE_TTL_SECONDS 이후 만료되고
+        스트림 구독자는 해당 받기 내역을 받지 못합니다.
+        """
+        if not redis_circuit_breaker.allow_request():
+            logger.warning(f"Spray status cache not invalidated (circuit open) - Token: {token}")
+            return
+        try:
+            await self._status_cache.bump(token, claims)
+            redis_circuit_breaker.record_success()
+        except PoolExhaustedError as e:
+            redis_circuit_breaker.release_trial()  # 부하로 인한 대기 시간 초과는 장애로 집계하지 않음
+            logger.warning(f"Failed to invalidate spray status cache - Token: {token}: {str(e)}")
+        except (redis.ConnectionError, redis.TimeoutError) as e:
+            redis_circuit_breaker.record_failure()
+            logger.warning(f"Failed to invalidate spray status cache - Token: {token}: {str(e)}")
+        except redis.RedisError as e:
+            redis_circuit_breaker.record_success()  # Redis 는 응답함
+            logger.warning(f"Failed to invalidate spray status cache - Token: {token}: {str(e)}")
+        except BaseException:
+            redis_circuit_breaker.release_trial()
+            raise
+
+    async def _record_claims(self, distribution_id: int, count: int, amount: int, claimed_at: datetime) -> None:
+        """뿌리기 건의 받기 집계(받은 인원 / 금액 / 마지막 받은 시각) 증가 (커밋은 호출자가 수행)"""
+        await self.db.execute(
+            update(MoneyDistribution)
+            .where(MoneyDistribution.id == distribution_id)
+            .values(
+                claimed_count=MoneyDistribution.claimed_count + count,
+                claimed_amount=MoneyDistribution.claimed_amount + amount,
+                # 커밋 순서가 받은 시각 순서와 다를 수 있으므로 더 늦은 시각만 반영
+                last_claimed_at=case(
+                    (
+                        or_(
+                            MoneyDistribution.last_claimed_at.is_(None),
+                            MoneyDistribution.last_claimed_at < claimed_at
+                        ),
+                        claimed_at
+                    ),
+                    else_=MoneyDistribution.last_claimed_at
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def receive_money_batch(
+        self,
+        token: str,
+        room_id: str,
+        user_ids: list[int],
+        context: Optional[ReceiveValidationContext] = None
+    ) -> list:
+        """
+        같은 뿌리기 건에 대한 여러 받기 요청을 한 번에 처리 (워커 micro-batching 용)
+
+        db_lock 모드에서는 한 트랜잭션으로 처리합니다. 뿌리기 건 / 미할당 분배 내역은 배치당 한 번만 잠그고,
+        지갑은 사용자별 UPDATE 한 번, 거래 이력은 multi-row INSERT 로 기록합니다.
+        그 외 모드(redis_queue / conditional_update)는 분배 금액 큐 등 모드별 상태와 어긋나지 않도록
+        요청마다 receive_money 로 처리합니다.
+        요청 순서대로 받은 금액(int) 또는 실패 사유(예외)를 담은 목록을 반환합니다.
+        """
+        if settings.RECEIVE_CLAIM_MODE != "db_lock":
+            outcomes = []
+            for user_id in user_ids:
+                try:
+                    outcomes.append(await self.receive_money(token, user_id, room_id, context))
+                except Exception as e:
+                    outcomes.append(e)
+            return outcomes
+
+        outcomes: list = [None] * len(user_ids)
+        try:
+            # 1. 뿌리기 건 조회 - 비관적 락 적용 (배치당 1회, API 단계 검증 결과가 있으면 PK 로 잠금)
+            try:
+                target = await self._load_receive_target(token, room_id, context, lock=True)
+            except ValueError as e:
+                await self.db.rollback()
+                return [e for _ in user_ids]
+
+            # 2. 요청별 유효성 검증 (이미 받은 사용자 / 지갑 존재 여부는 한 번의 조회로 확인)
+            received_query = select(MoneyDistributionDetail.receiver_id).where(
+                and_(
+                    MoneyDistributionDetail.distribution_id == target.distribution_id,
+                    MoneyDistributionDetail.receiver_id.in_(user_ids)
+                )
+            )
+            received_users = set((await self.db.execute(received_query)).scalars().all())
+            wallet_query = select(UserWallet.user_id).where(UserWallet.user_id.in_(user_ids))
+            wallet_users = set((await self.db.execute(wallet_query)).scalars().all())
+
+            claimants = []
+            for index, user_id in enumerate(user_ids):
+                try:
+                    self._validate_receive_window(target, user_id)
+                    if user_id in received_users:
+                        raise ValueError("이미 받은 사용자입니다.")
+                    if user_id not in wallet_users:
+                        raise ValueError("사용자 지갑을 찾을 수 없습니다.")
+                except ValueError as e:
+                    outcomes[index] = e
+                    continue
+                received_users.add(user_id)  # 같은 배치 안의 중복 요청 방지
+                claimants.append((index, user_id))
+
+            # 3. 미할당 분배 내역을 필요한 수만큼 한 번에 잠그고 요청 순서대로 배정
+            details = []
+            if claimants:
+                detail_query = select(MoneyDistributionDetail).where(
+                    and_(
+                        MoneyDistributionDetail.distribution_id == target.distribution_id,
+                        MoneyDistributionDetail.receiver_id.is_(None)
+                    )
+                ).order_by(MoneyDistributionDetail.id).limit(len(claimants)).with_for_update()
+                details = (await self.db.execute(detail_query)).scalars().all()
+
+            for index, _ in claimants[len(details):]:
+                outcomes[index] = ValueError("받을 수 있는 금액이 없습니다.")
+            assigned = list(zip(claimants, details))
+            if not assigned:
+                await self.db.rollback()
+                return outcomes
+
+            claimed_at = datetime.utcnow()
+            for (_, user_id), detail in assigned:
+                detail.receiver_id = user_id
+                detail.claimed_at = claimed_at
+
+            # 4. 사용자별 지갑 잔액 증가 (UPDATE 1회씩) 후 잔액 일괄 조회
+            for (_, user_id), detail in assigned:
+                await self.db.execute(
+                    update(UserWallet)
+                    .where(UserWallet.user_id == user_id)
+                    .values(balance=UserWallet.balance + detail.allocated_amount)
+                )
+            balance_query = select(UserWallet.user_id, UserWallet.balance).where(
+                UserWallet.user_id.in_([user_id for (_, user_id), _ in assigned])
+            )
+            balances = dict((await self.db.execute(balance_query)).all())
+
+            # 5. 거래 이력 기록 (multi-row INSERT)
+            await self.db.execute(insert(TransactionHistory), [
+                {
+                    "transaction_type": TransactionType.RECEIVE,
+                    "user_id": user_id,
+                    "amount": detail.allocated_amount,
+                    "balance_after": balances[user_id],
+                    "related_user_id": target.creator_id,
+                    "token": token,
+                    "chat_room_id": room_id,
+                    "description": "뿌리기 받기",
+                    "status": TransactionStatus.SUCCESS
+                }
+                for (_, user_id), detail in assigned
+            ])
+
+            # 6. 받기 집계 반영 (배치당 UPDATE 1회)
+            await self._record_claims(
+                target.distribution_id,
+                len(assigned),
+                sum(detail.allocated_amount for _, detail in assigned),
+                claimed_at
+            )
+
+            received_amounts = [(index, detail.allocated_amount) for (index, _), detail in assigned]
+            await self.db.commit()
+            await self._publish_claims(token, [
+                {"user_id": user_ids[index], "amount": amount} for index, amount in received_amounts
+            ])
+            for index, amount in received_amounts:
+                outcomes[index] = amount
+            return outcomes
+
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error in receive_money_batch: {str(e)}")
+            raise
+
+    def _validate_receive_window(
+        self,
+        target: Union[MoneyDistribution, ReceiveValidationContext],
+        user_id: int
+    ) -> None:
+        """뿌린 사람 / 받기 가능 시간 조건을 검증합니다."""
         # 자신이 뿌린 건은 받을 수 없음
-        if distribution.creator_id == user_id:
+        if target.creator_id == user_id:
             raise ValueError("자신이 뿌린 건은 받을 수 없습니다.")
 
         # 10분 제한 확인
-        if datetime.utcnow() > distribution.created_at + timedelta(minutes=10):
+        if datetime.utcnow() > target.created_at + timedelta(minutes=10):
             raise ValueError("뿌린지 10분이 지나 받을 수 없습니다.")
 
+    async def _validate_receive_conditions(self, target: ReceiveValidationContext, user_id: int):
+        """받기 조건을 검증합니다."""
+        self._validate_receive_window(target, user_id)
+
         # 이미 받은 내역이 있는지 확인
-        query = select(MoneyDistributionDetail).where(
+        query = select(MoneyDistributionDetail.id).where(
             and_(
-                MoneyDistributionDetail.distribution_id == distribution.id,
+                MoneyDistributionDetail.distribution_id == target.distribution_id,
                 MoneyDistributionDetail.receiver_id == user_id
             )
         )
@@ -161,32 +766,23 @@ class ReceiveService:
         if result.scalar_one_or_none():
             raise ValueError("이미 받은 사용자입니다.")
 
-    async def validate_receive_request(self, token: str, user_id: int, room_id: str) -> None:
-        """돈 받기 요청에 대한 기본 검증을 수행합니다."""
-        # 1. 채팅방 멤버 확인
-        member_query = select(ChatRoomMember).where(
-            ChatRoomMember.chat_room_id == room_id,
-            ChatRoomMember.user_id == user_id
-        )
-        member = await self.db.execute(member_query)
-        if not member.scalar_one_or_none():
+    async def validate_receive_request(self, token: str, user_id: int, room_id: str) -> ReceiveValidationContext:
+        """
+        돈 받기 요청에 대한 기본 검증을 수행합니다.
+
+        검증 결과(뿌리기 건 ID / 뿌린 사람 / 뿌린 시각)를 반환하며, 이를 receive_money 에 넘기면
+        워커에서는 단계 사이에 바뀔 수 있는 조건만 다시 확인합니다.
+        """
+        # 1. 채팅방 멤버 확인 (멤버십 캐시 사용)
+        if not await self._membership.is_member(self.db, room_id, user_id):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="해당 대화방의 멤버가 아닙니다."
             )
 
         # 2. 뿌리기 건 조회
-        distribution_query = select(MoneyDistribution).where(
-            and_(
-                MoneyDistribution.token == token,
-                MoneyDistribution.chat_room_id == room_id
-            )
-        )
-        distribution = (await self.db.execute(distribution_query)).scalar_one_or_none()
-        if not distribution:
-            raise ValueError("유효하지 않은 뿌리기 토큰입니다.")
+        context = await self._load_receive_target(token, room_id, None)
 
         # 3. 기본 유효성 검증
-        await self._validate_receive_conditions(distribution, user_id)
-
-    
\ No newline at end of file
+        await self._validate_receive_conditions(context, user_id)
+        return context
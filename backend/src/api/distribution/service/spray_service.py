@@ -1,65 +1,111 @@
 from datetime import datetime
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
+from typing import Optional
+from array import array
 import logging
 import random
 from src.utils.token.token import TokenService
+from src.utils.claim_queue.claim_queue import ClaimQueue
+from src.utils.membership.membership_cache import MembershipCache
+from src.utils.distribution_strategy.distribution_strategy import (
+    equal_split,
+    get_strategy,
+    validate_split_input
+)
+from src.common.enums import DistributionType
+from src.core.config import settings
+from ..schema import BulkSprayItem, BulkSprayItemResult
 
 from ....db.models import (
     MoneyDistribution,
     MoneyDistributionDetail,
-    ChatRoomMember,
     TransactionHistory,
     TransactionTypeEnum as TransactionType,
     TransactionStatusEnum as TransactionStatus,
     UserWallet
 )
 
+try:
+    import numpy as np
+except ImportError:  # numpy 가 없으면 array 모듈 기반 구현 사용
+    np = None
+
 logger = logging.getLogger(__name__)
 
 class SprayService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, redis_client: Optional[Redis] = None):
         self.db = db
-        self._token_service = TokenService()
+        self._token_service = TokenService(redis_client)
+        self._claim_queue = ClaimQueue(redis_client)
+        self._membership = MembershipCache(redis_client)
 
     @staticmethod
     def distribute_amount(total_amount: int, count: int) -> list[int]:
         """총액을 count만큼 동일하게 분배하고 잔액은 랜덤 분배"""
-        if count <= 0 or total_amount <= 0:
-            raise ValueError("Invalid input values")
-        
-        # 최소 1원씩은 받을 수 있도록 보장
-        if total_amount < count:
-            raise ValueError("Total amount must be greater than recipient count")
-        
-        # 기본 동일 분배 금액 계산
-        base_amount = total_amount // count
-        remaining = total_amount % count
-        
-        # 기본 금액으로 리스트 생성
-        amounts = [base_amount] * count
-        
-        # 잔액이 있는 경우 랜덤하게 분배
+        return equal_split(total_amount, count)
+
+    @staticmethod
+    def distribute_amount_compact(total_amount: int, count: int):
+        """
+        distribute_amount 와 같은 규칙(동일 분배 + 잔액 1원씩 랜덤 분배)의 대량 인원용 구현
+
+        Python int 리스트 대신 압축 배열(numpy int64 배열, 없으면 array('q'))을 반환합니다.
+        잔액을 받을 인원을 비복원 균등 추출하므로 별도의 셔플 없이도
+        distribute_amount 와 같은 분포를 가집니다.
+        """
+        validate_split_input(total_amount, count)
+
+        if np is not None:
+            return SprayService._distribute_amount_numpy(total_amount, count)
+        return SprayService._distribute_amount_array(total_amount, count)
+
+    @staticmethod
+    def _split_amount(
+        total_amount: int,
+        count: int,
+        distribution_type: DistributionType = DistributionType.EQUAL
+    ):
+        """
+        분배 방식에 맞는 전략으로 금액 분배
+
+        동일 분배는 인원이 많으면 압축 배열 기반 구현을 사용합니다.
+        """
+        if distribution_type == DistributionType.EQUAL and count >= settings.VECTORIZED_SPLIT_THRESHOLD:
+            return SprayService.distribute_amount_compact(total_amount, count)
+        return get_strategy(distribution_type)(total_amount, count)
+
+    @staticmethod
+    def _distribute_amount_numpy(total_amount: int, count: int):
+        """numpy 벡터 연산으로 분배"""
+        base_amount, remaining = divmod(total_amount, count)
+        amounts = np.full(count, base_amount, dtype=np.int64)
         if remaining > 0:
-            # 랜덤하게 선택된 인덱스들에게 1원씩 추가 분배
-            lucky_indices = random.sample(range(count), remaining)
-            for idx in lucky_indices:
-                amounts[idx] += 1
-        
-        # 금액 순서를 랜덤하게 섞기
-        random.shuffle(amounts)
-        
+            lucky_indices = np.random.default_rng().choice(count, size=remaining, replace=False)
+            amounts[lucky_indices] += 1
+        return amounts
+
+    @staticmethod
+    def _distribute_amount_array(total_amount: int, count: int) -> array:
+        """array 모듈로 분배 (numpy 미설치 환경용)"""
+        base_amount, remaining = divmod(total_amount, count)
+        amounts = array('q', [base_amount]) * count
+        for idx in random.sample(range(count), remaining):
+            amounts[idx] += 1
         return amounts
 
-    async def create_spray(self, user_id: int, room_id: str, total_amount: int, recipient_count: int) -> str:
-        # 1. 채팅방 멤버 확인
-        member_query = select(ChatRoomMember).where(
-            ChatRoomMember.chat_room_id == room_id,
-            ChatRoomMember.user_id == user_id
-        )
-        member = await self.db.execute(member_query)
-        if not member.scalar_one_or_none():
+    async def create_spray(
+        self,
+        user_id: int,
+        room_id: str,
+        total_amount: int,
+        recipient_count: int,
+        distribution_type: DistributionType = DistributionType.EQUAL
+    ) -> str:
+        # 1. 채팅방 멤버 확인 (멤버십 캐시 사용)
+        if not await self._membership.is_member(self.db, room_id, user_id):
             raise HTTPException(status_code=403, detail="해당 대화방의 멤버가 아닙니다.")
 
         # 2. 잔액 확인
@@ -68,9 +114,10 @@ class SprayService:
         if not wallet or wallet.balance < total_amount:
             raise HTTPException(status_code=400, detail="잔액이 부족합니다.")
 
+        token = None
         try:
             # Redis에서 토큰 생성 
-            token = self._token_service.generate_token()
+            token = await self._token_service.generate_token()
             
             # 뿌리기 건 생성 (MySQL에 저장)
             distribution = MoneyDistribution(
@@ -84,15 +131,13 @@ class SprayService:
             await self.db.flush()
 
             # 3. 금액 분배
-            amounts = self.distribute_amount(total_amount, recipient_count)
+            amounts = self._split_amount(total_amount, recipient_count, distribution_type)
 
-            # 4. 분배 내역 생성
-            for amount in amounts:
-                detail = MoneyDistributionDetail(
-                    distribution_id=distribution.id,
-                    allocated_amount=amount
-                )
-                self.db.add(detail)
+            # 4. 분배 내역 생성 (인원이 많으면 ORM 객체 없이 bulk INSERT)
+            if recipient_count >= settings.DETAIL_BULK_INSERT_THRESHOLD:
+                await self._bulk_insert_details(self._build_detail_rows(distribution.id, amounts))
+            else:
+                self._add_details(distribution.id, amounts)
 
             # 5. 거래 내역 기록 및 잔액 차감
             wallet.balance -= total_amount
@@ -111,9 +156,199 @@ class SprayService:
             self.db.add(transaction)
             await self.db.commit()
 
+            # 6. 받기용 분배 금액 큐 생성 (redis_queue 모드)
+            await self._push_claim_queue({token: amounts})
+
             return token
 
         except Exception as e:
             await self.db.rollback()
             logger.error(f"Error in create_spray: {e}")
-            raise HTTPException(status_code=500, detail="뿌리기 생성에 실패했습니다.") 
\ No newline at end of file
+            if token is not None:
+                await self._release_tokens([token])
+            raise HTTPException(status_code=500, detail="뿌리기 생성에 실패했습니다.")
+
+    async def create_sprays(self, user_id: int, items: list[BulkSprayItem]) -> list[BulkSprayItemResult]:
+        """
+        여러 건의 뿌리기를 한 번에 생성 (대량 뿌리기)
+
+        1. 대화방 멤버 여부를 한 번에 확인 (멤버십 캐시에 없는 대화방만 한 번의 쿼리로 조회)
+        2. BULK_SPRAY_CHUNK_SIZE 단위로 나누어 각 묶음을 하나의 트랜잭션으로 처리
+           - 잔액 확인 후 처리 가능한 항목만 선별
+           - 토큰을 Redis round trip 한 번으로 일괄 발급
+           - 뿌리기/분배 내역/거래 내역을 multi-row INSERT 로 저장
+        3. 항목별 결과를 요청 순서대로 반환
+        """
+        results: dict[int, BulkSprayItemResult] = {}
+
+        # 1. 채팅방 멤버 확인 (요청에 포함된 모든 대화방을 한 번에 조회)
+        room_ids = {item.room_id for item in items}
+        member_room_ids = await self._membership.member_rooms(self.db, user_id, room_ids)
+
+        valid_items = []
+        for index, item in enumerate(items):
+            if item.room_id not in member_room_ids:
+                results[index] = BulkSprayItemResult(index=index, success=False, error="해당 대화방의 멤버가 아닙니다.")
+            else:
+                valid_items.append((index, item))
+
+        # 2. 묶음 단위 처리
+        chunk_size = settings.BULK_SPRAY_CHUNK_SIZE
+        for start in range(0, len(valid_items), chunk_size):
+            chunk = valid_items[start:start + chunk_size]
+            for result in await self._create_spray_chunk(user_id, chunk):
+                results[result.index] = result
+
+        return [results[index] for index in range(len(items))]
+
+    async def _create_spray_chunk(
+        self, user_id: int, chunk: list[tuple[int, BulkSprayItem]]
+    ) -> list[BulkSprayItemResult]:
+        """대량 뿌리기 묶음 하나를 하나의 트랜잭션으로 저장"""
+        results = []
+        tokens = []
+        try:
+            # 잔액 확인 (묶음 처리 중 다른 차감과 겹치지 않도록 지갑 잠금)
+            wallet_query = select(UserWallet).where(UserWallet.user_id == user_id).with_for_update()
+            wallet = (await self.db.execute(wallet_query)).scalar_one_or_none()
+            balance = wallet.balance if wallet else 0
+
+            accepted = []
+            for index, item in chunk:
+                if item.total_amount > balance:
+                    results.append(BulkSprayItemResult(index=index, success=False, error="잔액이 부족합니다."))
+                    continue
+                balance -= item.total_amount
+                accepted.append((index, item))
+
+            if not accepted:
+                await self.db.rollback()
+                return results
+
+            # Redis에서 토큰 일괄 생성
+            tokens = await self._token_service.generate_tokens(len(accepted))
+
+            # 뿌리기 건 생성 (multi-row INSERT)
+            await self.db.execute(insert(MoneyDistribution), [
+                {
+                    "token": token,
+                    "creator_id": user_id,
+                    "chat_room_id": item.room_id,
+                    "total_amount": item.total_amount,
+                    "recipient_count": item.recipient_count
+                }
+                for token, (_, item) in zip(tokens, accepted)
+            ])
+            id_query = select(MoneyDistribution.token, MoneyDistribution.id).where(
+                MoneyDistribution.token.in_(tokens)
+            )
+            distribution_ids = dict((await self.db.execute(id_query)).all())
+
+            # 분배 내역 생성 (multi-row INSERT)
+            detail_rows = []
+            shares = {}
+            for token, (_, item) in zip(tokens, accepted):
+                amounts = self._split_amount(item.total_amount, item.recipient_count, item.distribution_type)
+                detail_rows.extend(self._build_detail_rows(distribution_ids[token], amounts))
+                shares[token] = amounts
+            await self._bulk_insert_details(detail_rows)
+
+            # 거래 내역 기록 (multi-row INSERT) 및 잔액 차감
+            balance_after = wallet.balance
+            transaction_rows = []
+            for token, (_, item) in zip(tokens, accepted):
+                balance_after -= item.total_amount
+                transaction_rows.append({
+                    "transaction_type": TransactionType.SPRAY,
+                    "user_id": user_id,
+                    "amount": -item.total_amount,
+                    "balance_after": balance_after,
+                    "token": token,
+                    "chat_room_id": item.room_id,
+                    "description": f"{item.recipient_count}명에게 뿌리기",
+                    "status": TransactionStatus.SUCCESS
+                })
+            await self.db.execute(insert(TransactionHistory), transaction_rows)
+
+            wallet.balance = balance_after
+            await self.db.commit()
+
+            # 받기용 분배 금액 큐 생성 (redis_queue 모드)
+            await self._push_claim_queue(shares)
+
+            results.extend(
+                BulkSprayItemResult(index=index, success=True, token=token)
+                for token, (index, _) in zip(tokens, accepted)
+            )
+            return results
+
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error in create_sprays chunk: {e}")
+            await self._release_tokens(tokens)
+            failed = {result.index for result in results}
+            return results + [
+                BulkSprayItemResult(index=index, success=False, error="뿌리기 생성에 실패했습니다.")
+                for index, _ in chunk
+                if index not in failed
+            ]
+
+    async def _release_tokens(self, tokens: list[str]) -> None:
+        """
+        저장에 실패한 뿌리기 건의 토큰 사용 처리 취소
+
+        취소에 실패해도 원래 오류를 그대로 반환하도록 예외를 올리지 않습니다.
+        취소하지 못한 토큰은 만료 후 회수됩니다.
+        """
+        try:
+            await self._token_service.release_tokens(tokens)
+        except Exception as e:
+            logger.warning(f"Failed to release tokens {tokens}: {e}")
+
+    @staticmethod
+    def _build_detail_rows(distribution_id: int, amounts) -> list[dict]:
+        """분배 금액 목록(리스트 또는 압축 배열)을 분배 내역 INSERT 용 row 로 변환"""
+        if not isinstance(amounts, list):
+            amounts = amounts.tolist()
+        return [
+            {"distribution_id": distribution_id, "allocated_amount": amount}
+            for amount in amounts
+        ]
+
+    async def _push_claim_queue(self, shares: dict) -> None:
+        """
+        redis_queue 받기 모드에서 토큰별 분배 금액을 받기 큐에 저장
+
+        뿌리기 생성은 이미 커밋된 상태이므로 실패해도 예외를 올리지 않습니다.
+        큐가 없는 뿌리기 건의 받기는 DB 락 방식으로 처리됩니다.
+        """
+        if settings.RECEIVE_CLAIM_MODE != "redis_queue":
+            return
+        try:
+            await self._claim_queue.push_shares({
+                token: amounts if isinstance(amounts, list) else amounts.tolist()
+                for token, amounts in shares.items()
+            })
+        except Exception as e:
+            logger.warning(f"Failed to push claim queue (fallback to db_lock): {e}")
+
+    def _add_details(self, distribution_id: int, amounts) -> None:
+        """분배 내역을 ORM 객체로 세션에 추가 (인원이 적은 경우)"""
+        for amount in amounts:
+            detail = MoneyDistributionDetail(
+                distribution_id=distribution_id,
+                allocated_amount=amount
+            )
+            self.db.add(detail)
+
+    async def _bulk_insert_details(self, rows: list[dict]) -> None:
+        """
+        분배 내역을 ORM 객체 생성 없이 multi-row INSERT 로 저장
+
+        Core insert 를 executemany 로 실행하면 asyncmy 드라이버가 INSERT ... VALUES 를
+        여러 row 의 단일 문장으로 재작성합니다. 파라미터 목록이 너무 커지지 않도록
+        DETAIL_INSERT_BATCH_SIZE 단위로 나누어 실행합니다.
+        """
+        batch_size = settings.DETAIL_INSERT_BATCH_SIZE
+        for start in range(0, len(rows), batch_size):
+            await self.db.execute(insert(MoneyDistributionDetail.__table__), rows[start:start + batch_size]) 
\ No newline at end of file
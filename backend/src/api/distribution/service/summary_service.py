@@ -0,0 +1,111 @@
+from datetime import datetime
+from sqlalchemy import select, update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+import logging
+
+from ....db.models import (
+    MoneyDistribution,
+    MoneyDistributionDetail
+)
+
+logger = logging.getLogger(__name__)
+
+class SummaryService:
+    """
+    뿌리기 건 받기 집계(claimed_count / claimed_amount / last_claimed_at) 정합성 점검
+
+    집계 컬럼은 받기 처리와 같은 트랜잭션에서 증가하므로 정상적으로는 분배 내역과 항상 일치합니다.
+    수동 데이터 보정 등으로 어긋난 경우를 찾아 분배 내역 기준으로 다시 맞춥니다.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def find_mismatches(self, since: Optional[datetime] = None) -> list[dict]:
+        """집계 컬럼이 분배 내역과 다른 뿌리기 건 목록 (since 이후 생성된 건만 점검)"""
+        claimed = (
+            select(
+                MoneyDistributionDetail.distribution_id,
+                func.count(MoneyDistributionDetail.id).label("claimed_count"),
+                func.sum(MoneyDistributionDetail.allocated_amount).label("claimed_amount"),
+                func.max(MoneyDistributionDetail.claimed_at).label("last_claimed_at")
+            )
+            .where(MoneyDistributionDetail.receiver_id.is_not(None))
+            .group_by(MoneyDistributionDetail.distribution_id)
+        )
+        if since is not None:
+            # 점검 대상 뿌리기 건의 분배 내역만 집계 (전체 분배 내역 GROUP BY 방지)
+            claimed = claimed.join(
+                MoneyDistribution, MoneyDistribution.id == MoneyDistributionDetail.distribution_id
+            ).where(MoneyDistribution.created_at >= since)
+        claimed = claimed.subquery()
+        actual_count = func.coalesce(claimed.c.claimed_count, 0)
+        actual_amount = func.coalesce(claimed.c.claimed_amount, 0)
+
+        query = (
+            select(
+                MoneyDistribution.id,
+                MoneyDistribution.claimed_count,
+                MoneyDistribution.claimed_amount,
+                MoneyDistribution.last_claimed_at,
+                actual_count.label("actual_count"),
+                actual_amount.label("actual_amount"),
+                claimed.c.last_claimed_at.label("actual_last_claimed_at")
+            )
+            .outerjoin(claimed, claimed.c.distribution_id == MoneyDistribution.id)
+            .where(
+                (MoneyDistribution.claimed_count != actual_count)
+                | (MoneyDistribution.claimed_amount != actual_amount)
+                | MoneyDistribution.last_claimed_at.is_distinct_from(claimed.c.last_claimed_at)
+            )
+            .order_by(MoneyDistribution.id)
+        )
+        if since is not None:
+            query = query.where(MoneyDistribution.created_at >= since)
+
+        return [
+            {
+                "distribution_id": row.id,
+                "claimed_count": row.claimed_count,
+                "claimed_amount": row.claimed_amount,
+                "last_claimed_at": row.last_claimed_at,
+                "actual_count": row.actual_count,
+                "actual_amount": row.actual_amount,
+                "actual_last_claimed_at": row.actual_last_claimed_at,
+            }
+            for row in (await self.db.execute(query)).all()
+        ]
+
+    async def reconcile(self, since: Optional[datetime] = None) -> list[dict]:
+        """어긋난 집계를 분배 내역 기준으로 보정하고 보정한 건 목록 반환"""
+        mismatches = await self.find_mismatches(since)
+        for mismatch in mismatches:
+            logger.warning(f"Distribution summary mismatch: {mismatch}")
+            # 점검 이후 받기가 반영되었을 수 있으므로 분배 내역을 다시 집계하여 갱신
+            await self.db.execute(
+                update(MoneyDistribution)
+                .where(MoneyDistribution.id == mismatch["distribution_id"])
+                .values(
+                    claimed_count=self._claimed_detail_aggregate(mismatch["distribution_id"], func.count(MoneyDistributionDetail.id)),
+                    claimed_amount=func.coalesce(
+                        self._claimed_detail_aggregate(mismatch["distribution_id"], func.sum(MoneyDistributionDetail.allocated_amount)),
+                        0
+                    ),
+                    last_claimed_at=self._claimed_detail_aggregate(mismatch["distribution_id"], func.max(MoneyDistributionDetail.claimed_at))
+                )
+                .execution_options(synchronize_session=False)
+            )
+        await self.db.commit()
+        return mismatches
+
+    @staticmethod
+    def _claimed_detail_aggregate(distribution_id: int, aggregate):
+        return (
+            select(aggregate)
+            .where(
+                MoneyDistributionDetail.distribution_id == distribution_id,
+                MoneyDistributionDetail.receiver_id.is_not(None)
+            )
+            .scalar_subquery()
+        )
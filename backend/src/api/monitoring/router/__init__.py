@@ -0,0 +1,10 @@
+"""
+Monitoring API Router Package
+"""
+from fastapi import APIRouter
+from .monitoring_router import router as monitoring_router
+
+router = APIRouter()
+
+# Include all sub-routers
+router.include_router(monitoring_router, tags=["monitoring"])
@@ -0,0 +1,36 @@
+from fastapi import APIRouter
+from ....db.redis import get_redis_pool_stats
+from ....utils.token.token import token_validation_cache
+from ...distribution.service.receive_service import receive_dispatcher
+import logging
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+@router.get("/monitoring/redis-pool")
+async def get_redis_pool_status():
+    """
+    Redis 커넥션 풀 사용 현황을 조회합니다.
+    - in_use: 사용 중인 커넥션 수
+    - idle: 반납되어 재사용 대기 중인 커넥션 수
+    - created: 지금까지 생성된 커넥션 수
+    """
+    return get_redis_pool_stats()
+
+@router.get("/monitoring/token-cache")
+async def get_token_cache_status():
+    """
+    토큰 검증 결과 캐시 현황을 조회합니다.
+    - hits: Redis 조회 없이 캐시로 응답한 횟수
+    - misses: 캐시에 없어 Redis 를 조회한 횟수
+    """
+    return token_validation_cache.stats()
+
+@router.get("/monitoring/receive-dispatch")
+async def get_receive_dispatch_status():
+    """
+    받기 요청 처리 경로별 현황을 조회합니다.
+    - inline / celery: 경로별 처리 건수, 실패 건수, 지연 시간(p50/p95/max, ms)
+    - queue_depths: 큐별로 마지막으로 확인한 Celery 받기 큐 메시지 수
+    """
+    return receive_dispatcher.stats()
@@ -8,4 +8,9 @@ class TransactionType(str, Enum):
 class TransactionStatus(str, Enum):
     SUCCESS = "SUCCESS"
     FAILED = "FAILED"
-    CANCELLED = "CANCELLED" 
\ No newline at end of file
+    CANCELLED = "CANCELLED" 
+
+class DistributionType(str, Enum):
+    EQUAL = "EQUAL"
+    RANDOM = "RANDOM"
+    FIRST_COME_BONUS = "FIRST_COME_BONUS"
@@ -6,6 +6,14 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     REDIS_HOST: str
     REDIS_PORT: int
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
+    REDIS_SOCKET_TIMEOUT: float = 1.0
+    # 커넥션 풀이 모두 사용 중일 때 반환을 기다리는 최대 시간(초)
+    REDIS_POOL_TIMEOUT_SECONDS: float = 2.0
+    REDIS_RETRY_ATTEMPTS: int = 2
+    REDIS_CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5
+    REDIS_CIRCUIT_BREAKER_RESET_SECONDS: int = 30
     RABBITMQ_HOST: str
     RABBITMQ_PORT: int
     RABBITMQ_USER: str
@@ -18,6 +26,66 @@ class Settings(BaseSettings):
     TEST_RABBITMQ_USER: str
     TEST_RABBITMQ_PASSWORD: str
 
+    # 토큰 풀 모드 (미리 섞어둔 토큰 풀에서 꺼내 쓰는 방식)
+    TOKEN_POOL_ENABLED: bool = False
+    # 스크립트 방식 토큰 발급 (WATCH/MULTI 재시도 대신 EVALSHA 한 번으로 선점)
+    TOKEN_SCRIPT_ENABLED: bool = False
+    # 대량 뿌리기 시 한 트랜잭션에서 처리할 뿌리기 건수
+    BULK_SPRAY_CHUNK_SIZE: int = 500
+    # 분배 내역을 ORM 객체 대신 bulk INSERT 로 저장하기 시작하는 인원 수 / INSERT 1회당 row 수
+    DETAIL_BULK_INSERT_THRESHOLD: int = 1
+    DETAIL_INSERT_BATCH_SIZE: int = 5000
+    # 금액 분배 시 압축 배열(numpy/array) 기반 구현을 사용하기 시작하는 인원 수
+    VECTORIZED_SPLIT_THRESHOLD: int = 5000
+    # 선착순 보너스 분배 시 첫 수령자에게 줄 보너스 비율(%, 인원별 최소 1원 제외 금액 기준)
+    FIRST_COME_BONUS_PERCENT: int = 20
+    # 받기 처리 방식
+    # (db_lock: 행 락으로 분배 내역 선점, redis_queue: Redis 분배 금액 큐에서 pop,
+    #  conditional_update: 조건부 UPDATE 한 문장으로 분배 내역 선점)
+    RECEIVE_CLAIM_MODE: str = "db_lock"
+    # 분배 금액 큐 / 받은 사용자 Set 유지 시간 (받기 가능 시간 10분 + 여유)
+    CLAIM_QUEUE_TTL_SECONDS: int = 660
+    # 비동기 받기 요청 결과 보관 시간 / 상태 조회 long-poll 최대 대기 시간
+    RECEIVE_CLAIM_RESULT_TTL_SECONDS: int = 600
+    RECEIVE_STATUS_MAX_WAIT_SECONDS: float = 25.0
+    # 동기 받기 요청의 태스크 결과 대기 스레드 수 (이벤트 루프를 막지 않도록 별도 스레드에서 대기)
+    RECEIVE_WAIT_THREADS: int = 64
+    # 받기 inline 처리 (큐가 한가하면 Celery 를 거치지 않고 API 프로세스에서 바로 처리)
+    # RECEIVE_QUEUE_SHARDS > 1 이면 같은 샤드로 처리 중인 요청이 없고 샤드 큐가 비어 있을 때만 inline 처리
+    # (같은 프로세스 안에서만 순서를 지키며, 다른 API 프로세스와의 토큰별 순서는 보장하지 않음)
+    RECEIVE_INLINE_ENABLED: bool = False
+    RECEIVE_INLINE_MAX_IN_FLIGHT: int = 4  # 토큰별 동시 inline 처리 수 상한
+    RECEIVE_INLINE_MAX_QUEUE_DEPTH: int = 10  # 받기 큐 메시지 수 상한
+    RECEIVE_QUEUE_DEPTH_CACHE_SECONDS: float = 1.0
+    # Celery 워커 프로세스별 DB 커넥션 풀 크기
+    WORKER_DB_POOL_SIZE: int = 5
+    # 워커 DB 엔진 SQL 로그 출력 여부 (받기 처리량이 많은 워커에서는 기본 비활성화)
+    WORKER_DB_ECHO: bool = False
+    # 받기 큐 샤드 수 (1 이면 단일 receive_requests 큐, N 이면 receive_requests.0 ~ N-1 로 토큰별 라우팅)
+    RECEIVE_QUEUE_SHARDS: int = 1
+    # 받기 요청 micro-batching (워커가 최대 RECEIVE_BATCH_SIZE 건 또는 RECEIVE_BATCH_INTERVAL_SECONDS 마다 모아서 처리)
+    RECEIVE_BATCH_ENABLED: bool = False
+    RECEIVE_BATCH_SIZE: int = 64
+    RECEIVE_BATCH_INTERVAL_SECONDS: float = 0.005
+    # 동기 받기 요청의 결과 전달 방식 (rpc: Celery rpc 결과 백엔드, redis: 프로세스별 Redis pub/sub 채널)
+    RECEIVE_RESULT_CHANNEL: str = "rpc"
+    RECEIVE_RESULT_TIMEOUT_SECONDS: float = 10.0
+    # 뿌리기 상태 조회 응답 캐시 유지 시간(초)
+    SPRAY_STATUS_CACHE_TTL_SECONDS: int = 300
+    # 뿌리기 상태 스트림 (keepalive 주기(초) / 구독자별 대기 이벤트 수, 초과 시 resync)
+    SPRAY_STREAM_KEEPALIVE_SECONDS: float = 15.0
+    SPRAY_STREAM_QUEUE_SIZE: int = 64
+    # 받기 집계 정합성 점검 주기(초) / 점검 대상 기간(일, 조회 가능 기간과 동일)
+    SUMMARY_RECONCILE_INTERVAL_SECONDS: int = 3600
+    SUMMARY_RECONCILE_LOOKBACK_DAYS: int = 7
+    # 대화방 멤버십 캐시 (Redis Set 유지 시간 / 프로세스 내 캐시 크기 / 프로세스 내 캐시 유지 시간)
+    MEMBERSHIP_CACHE_TTL_SECONDS: int = 3600
+    MEMBERSHIP_LOCAL_CACHE_SIZE: int = 10000
+    MEMBERSHIP_LOCAL_CACHE_TTL_SECONDS: float = 5.0
+    # 토큰 검증 결과 프로세스 내 캐시 설정
+    TOKEN_VALIDATION_CACHE_SIZE: int = 10000
+    TOKEN_VALIDATION_CACHE_TTL_SECONDS: int = 60
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -8,6 +8,7 @@ from sqlalchemy import (
     Enum,
     JSON,
     UniqueConstraint,
+    Index,
     func,
     CHAR,
 )
@@ -126,6 +127,10 @@ class MoneyDistribution(Base):
     total_amount = Column(BigInteger, nullable=False)
     recipient_count = Column(Integer, nullable=False)
     created_at = Column(DateTime, server_default=func.now())
+    # 받기 집계 (받기 처리와 같은 트랜잭션에서 갱신, 상태 조회 시 분배 내역을 다시 집계하지 않음)
+    claimed_count = Column(Integer, nullable=False, server_default="0")
+    claimed_amount = Column(BigInteger, nullable=False, server_default="0")
+    last_claimed_at = Column(DateTime, nullable=True)
 
     details = relationship("MoneyDistributionDetail", back_populates="distribution")
     creator = relationship("User")
@@ -144,6 +149,15 @@ class MoneyDistributionDetail(Base):
     receiver_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     claimed_at = Column(DateTime, nullable=True)
 
+    __table_args__ = (
+        # 같은 뿌리기 건을 한 사용자가 두 번 받지 못하도록 보장 (receiver_id 가 NULL 인 미할당 행은 제외)
+        # 받기 처리의 (distribution_id, receiver_id IS NULL) ORDER BY id 와
+        # (distribution_id, receiver_id) 조회도 이 인덱스를 사용 (InnoDB 보조 인덱스는 PK 순으로 정렬됨)
+        UniqueConstraint("distribution_id", "receiver_id", name="uq_distribution_receiver"),
+        # 상태 조회의 받은 시간순 정렬 (distribution_id = ? ORDER BY claimed_at, id)
+        Index("ix_details_distribution_claimed_at", "distribution_id", "claimed_at"),
+    )
+
     distribution = relationship("MoneyDistribution", back_populates="details")
     receiver = relationship("User")
 
@@ -0,0 +1,130 @@
+import asyncio
+from collections import deque
+from typing import AsyncGenerator, Optional
+import redis.asyncio as redis
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError
+from ..core.config import settings
+from ..utils.circuit_breaker.circuit_breaker import CircuitBreaker
+
+# Redis 장애 시 사용자에게 반환하는 메시지
+REDIS_UNAVAILABLE_MESSAGE = "Redis connection failed, 현재 서비스를 이용할 수 없습니다. 관리자에게 문의하세요."
+
+# Redis 장애 시 빠르게 실패하기 위한 프로세스 단위 서킷 브레이커
+redis_circuit_breaker = CircuitBreaker(
+    failure_threshold=settings.REDIS_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    reset_timeout=settings.REDIS_CIRCUIT_BREAKER_RESET_SECONDS
+)
+
+class PoolExhaustedError(ConnectionError):
+    """커넥션 풀의 모든 커넥션이 사용 중이어서 대기 시간 안에 커넥션을 얻지 못함 (Redis 장애 아님)"""
+
+
+# 생성된 커넥션 수를 집계하는 커넥션 풀
+# 커넥션이 모두 사용 중이면 즉시 실패하지 않고 timeout 초 동안 반환을 기다림
+# (redis-py 5.0 의 BlockingConnectionPool 은 연결 실패 시 release 에서 Condition 락을 다시 잡아
+#  교착되므로 사용하지 않고, 대기 요청별 Future 로 반환을 알림)
+class StatsConnectionPool(redis.ConnectionPool):
+    def __init__(self, *args, timeout: float = 2.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.created_connections = 0
+        self.timeout = timeout
+        self._release_waiters: deque[asyncio.Future] = deque()
+
+    def make_connection(self):
+        self.created_connections += 1
+        return super().make_connection()
+
+    def _exhausted(self) -> bool:
+        return not self._available_connections and len(self._in_use_connections) >= self.max_connections
+
+    async def get_connection(self, command_name, *keys, **options):
+        if self._exhausted():
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.timeout
+            # 깨어난 뒤 다른 요청이 먼저 가져갔으면 남은 시간 동안 다시 대기
+            while self._exhausted():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise PoolExhaustedError("No connection available.")
+                waiter = loop.create_future()
+                self._release_waiters.append(waiter)
+                try:
+                    await asyncio.wait_for(waiter, remaining)
+                except asyncio.TimeoutError:
+                    raise PoolExhaustedError("No connection available.") from None
+                finally:
+                    if waiter in self._release_waiters:
+                        self._release_waiters.remove(waiter)
+        # 대기 확인 이후 await 없이 커넥션을 가져가므로 그 사이 다른 요청이 끼어들지 않음
+        return await super().get_connection(command_name, *keys, **options)
+
+    async def release(self, connection):
+        await super().release(connection)
+        # 대기 중인 요청 하나만 깨움
+        while self._release_waiters:
+            waiter = self._release_waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+# 애플리케이션 단위 Redis 커넥션 풀 (FastAPI startup 에서 생성, shutdown 에서 정리)
+redis_pool: Optional[StatsConnectionPool] = None
+
+# Redis 커넥션 풀 생성
+def init_redis_pool() -> StatsConnectionPool:
+    global redis_pool
+    if redis_pool is None:
+        redis_pool = StatsConnectionPool(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=0,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+            decode_responses=True,
+            # 매 요청마다 PING 하지 않고, 일정 시간 유휴 상태였던 커넥션만 사용 전에 점검
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            # 끊어진 커넥션은 짧은 백오프 후 재연결하여 재시도
+            retry=Retry(ExponentialBackoff(cap=0.1, base=0.01), settings.REDIS_RETRY_ATTEMPTS),
+            retry_on_error=[ConnectionError]
+        )
+    return redis_pool
+
+# Redis 커넥션 풀 정리
+async def close_redis_pool() -> None:
+    global redis_pool
+    if redis_pool is not None:
+        await redis_pool.aclose()
+        redis_pool = None
+
+# 공유 풀을 사용하는 Redis 클라이언트 반환 (워커 등 startup 이벤트가 없는 환경에서는 풀을 지연 생성)
+def get_redis_client() -> redis.Redis:
+    return redis.Redis(connection_pool=init_redis_pool())
+
+# 의존성 주입을 위한 제너레이터 함수
+async def get_redis() -> AsyncGenerator[redis.Redis, None]:
+    yield get_redis_client()
+
+# 커넥션 풀 사용 현황 (풀 크기 산정용)
+def get_redis_pool_stats() -> dict:
+    if redis_pool is None:
+        return {
+            "initialized": False,
+            "in_use": 0,
+            "idle": 0,
+            "created": 0,
+            "max_connections": settings.REDIS_MAX_CONNECTIONS,
+            "circuit_breaker": redis_circuit_breaker.stats(),
+        }
+
+    return {
+        "initialized": True,
+        "in_use": len(redis_pool._in_use_connections),
+        "idle": len(redis_pool._available_connections),
+        "created": redis_pool.created_connections,
+        "max_connections": redis_pool.max_connections,
+        "circuit_breaker": redis_circuit_breaker.stats(),
+    }
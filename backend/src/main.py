@@ -2,7 +2,12 @@ from fastapi import FastAPI
 from .core.config import settings
 from fastapi.middleware.cors import CORSMiddleware
 from .api.distribution.router import router as distribution_router
+from .api.monitoring.router import router as monitoring_router
 from .db.database import engine, Base
+from .db.redis import init_redis_pool, close_redis_pool
+from .utils.token.token import TokenService
+from .utils.result_channel.result_channel import close_result_channel
+from .utils.spray_status_stream.spray_status_stream import close_spray_status_hub
 import logging
 
 # 로깅 설정
@@ -26,6 +31,7 @@ app.add_middleware(
 )
 
 app.include_router(distribution_router, prefix="/api/v1")
+app.include_router(monitoring_router, prefix="/api/v1")
 
 @app.on_event("startup")
 async def startup():
@@ -33,6 +39,23 @@ async def startup():
         # await conn.run_sync(Base.metadata.drop_all)  # 테스트 시에만 사용
         await conn.run_sync(Base.metadata.create_all)
 
+    # 애플리케이션 단위 Redis 커넥션 풀 생성
+    init_redis_pool()
+
+    # 토큰 풀 모드인 경우 최초 1회 토큰 풀 적재
+    if settings.TOKEN_POOL_ENABLED:
+        loaded = await TokenService().init_token_pool()
+        logger.info(f"Token pool initialized - loaded tokens: {loaded}")
+
+@app.on_event("shutdown")
+async def shutdown():
+    # Redis 결과 채널 / 상태 스트림 구독 해제 (커넥션 풀 정리 전에 수행)
+    await close_result_channel()
+    await close_spray_status_hub()
+
+    # Redis 커넥션 풀 정리
+    await close_redis_pool()
+
 # 접속 테스트
 @app.get("/")
 async def root():
@@ -0,0 +1,66 @@
+import pytest
+from src.utils.cache.lru_ttl_cache import LRUTTLCache
+
+class FakeClock:
+    """테스트용 시계"""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def test_cache_hit_and_miss(clock):
+    """저장된 값 조회 시 hit, 없는 값 조회 시 miss 가 집계되는지 테스트"""
+    cache = LRUTTLCache(maxsize=10, ttl_seconds=60, clock=clock)
+    cache.set("ABC", True)
+
+    assert cache.get("ABC") is True
+    assert cache.get("XYZ") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+def test_cache_expires_with_shorter_ttl(clock):
+    """항목별 TTL 이 기본 TTL 보다 짧으면 그 시각에 만료되는지 테스트"""
+    cache = LRUTTLCache(maxsize=10, ttl_seconds=60, clock=clock)
+    cache.set("ABC", True, ttl=5)
+    cache.set("DEF", True, ttl=600)  # 기본 TTL(60초)보다 길게 유지되지 않음
+
+    clock.now = 5
+    assert cache.get("ABC") is None
+    assert cache.get("DEF") is True
+
+    clock.now = 60
+    assert cache.get("DEF") is None
+    assert cache.stats()["size"] == 0
+
+def test_cache_ignores_already_expired(clock):
+    """이미 만료된(TTL <= 0) 항목은 저장하지 않는지 테스트"""
+    cache = LRUTTLCache(maxsize=10, ttl_seconds=60, clock=clock)
+    cache.set("ABC", True, ttl=-1)
+
+    assert cache.get("ABC") is None
+
+def test_cache_evicts_least_recently_used(clock):
+    """크기 제한을 넘으면 가장 오래 사용되지 않은 항목부터 제거되는지 테스트"""
+    cache = LRUTTLCache(maxsize=2, ttl_seconds=60, clock=clock)
+    cache.set("A", 1)
+    cache.set("B", 2)
+    cache.get("A")  # A 를 최근 사용으로 갱신
+    cache.set("C", 3)
+
+    assert cache.get("B") is None
+    assert cache.get("A") == 1
+    assert cache.get("C") == 3
+    assert cache.stats()["evictions"] == 1
+
+def test_cache_invalidate(clock):
+    """invalidate 로 항목이 즉시 제거되는지 테스트"""
+    cache = LRUTTLCache(maxsize=10, ttl_seconds=60, clock=clock)
+    cache.set("ABC", True)
+    cache.invalidate("ABC")
+
+    assert cache.get("ABC") is None
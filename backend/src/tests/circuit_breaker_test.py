@@ -0,0 +1,68 @@
+from src.utils.circuit_breaker.circuit_breaker import CircuitBreaker
+
+class FakeClock:
+    """테스트용 시계"""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_circuit_opens_after_consecutive_failures():
+    """연속 실패가 임계치에 도달하면 요청을 거절하는지 테스트"""
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=FakeClock())
+
+    for _ in range(2):
+        assert breaker.allow_request()
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow_request() is False
+    assert breaker.stats()["rejected"] == 1
+
+def test_success_resets_failure_count():
+    """성공 시 연속 실패 횟수가 초기화되는지 테스트"""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=FakeClock())
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_half_open_allows_single_trial():
+    """reset_timeout 이 지나면 시험 요청 1건만 허용하고, 결과에 따라 상태가 바뀌는지 테스트"""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 10
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request() is True
+    assert breaker.allow_request() is False  # 시험 요청 진행 중
+
+    # 시험 요청 실패 → 다시 open
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # 시험 요청 성공 → closed
+    clock.now = 20
+    assert breaker.allow_request() is True
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request() is True
+
+def test_half_open_trial_released_without_verdict():
+    """시험 요청이 성공/실패 판단 없이 끝나면 다음 요청이 시험 요청으로 허용되는지 테스트"""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 10
+    assert breaker.allow_request() is True
+    breaker.release_trial()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request() is True
+    assert breaker.allow_request() is False
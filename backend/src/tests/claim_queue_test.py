@@ -0,0 +1,60 @@
+import pytest
+from fakeredis import aioredis as fakeredis
+
+from src.utils.claim_queue.claim_queue import (
+    ClaimQueue,
+    CLAIM_OK,
+    CLAIM_DUPLICATE,
+    CLAIM_EXHAUSTED,
+    CLAIM_MISSING
+)
+
+pytestmark = pytest.mark.asyncio
+
+@pytest.fixture
+async def claim_queue():
+    """Lua 스크립트를 실행할 수 있는 fakeredis 기반 분배 금액 큐"""
+    redis_client = fakeredis.FakeRedis(decode_responses=True)
+    yield ClaimQueue(redis_client)
+    await redis_client.flushall()
+    await redis_client.aclose()
+
+async def test_claim_pops_shares_in_order(claim_queue):
+    """넣은 순서대로 금액을 받고, 다 받으면 exhausted"""
+    await claim_queue.push_shares({"ABC": [1001, 1000, 1000]})
+
+    assert await claim_queue.claim("ABC", 2) == (CLAIM_OK, 1001)
+    assert await claim_queue.claim("ABC", 3) == (CLAIM_OK, 1000)
+    assert await claim_queue.claim("ABC", 4) == (CLAIM_OK, 1000)
+    assert await claim_queue.claim("ABC", 5) == (CLAIM_EXHAUSTED, None)
+
+async def test_claim_duplicate_user(claim_queue):
+    """같은 사용자는 두 번 받을 수 없음"""
+    await claim_queue.push_shares({"ABC": [1000, 1000]})
+
+    assert (await claim_queue.claim("ABC", 2))[0] == CLAIM_OK
+    assert await claim_queue.claim("ABC", 2) == (CLAIM_DUPLICATE, None)
+    assert await claim_queue.remaining("ABC") == 1
+
+async def test_claim_missing_queue(claim_queue):
+    """큐가 없는 토큰은 missing (DB 락 방식으로 처리)"""
+    assert await claim_queue.claim("XYZ", 2) == (CLAIM_MISSING, None)
+
+async def test_release_restores_share(claim_queue):
+    """DB 반영 실패 시 금액과 받은 사용자 기록이 되돌려지는지 테스트"""
+    await claim_queue.push_shares({"ABC": [1000]})
+    _, amount = await claim_queue.claim("ABC", 2)
+
+    assert await claim_queue.release("ABC", 2, amount) is True
+    assert await claim_queue.remaining("ABC") == 1
+    # 되돌린 뒤에는 같은 사용자가 다시 받을 수 있음
+    assert await claim_queue.claim("ABC", 2) == (CLAIM_OK, 1000)
+
+async def test_push_resets_reused_token(claim_queue):
+    """재사용된 토큰으로 다시 큐를 만들면 이전 큐와 받은 사용자 기록이 초기화됨"""
+    await claim_queue.push_shares({"ABC": [1000]})
+    await claim_queue.claim("ABC", 2)
+
+    await claim_queue.push_shares({"ABC": [500, 500]})
+    assert await claim_queue.claim("ABC", 2) == (CLAIM_OK, 500)
+    assert await claim_queue.remaining("ABC") == 1
@@ -0,0 +1,100 @@
+import asyncio
+import pytest
+from fakeredis import aioredis as fakeredis
+
+from src.utils.claim_result.claim_result_store import (
+    ClaimResultStore,
+    CLAIM_PENDING,
+    CLAIM_SUCCESS,
+    CLAIM_FAILED
+)
+from src.utils.result_channel.result_channel import ResultChannel
+
+pytestmark = pytest.mark.asyncio
+
+@pytest.fixture
+async def redis_client():
+    client = fakeredis.FakeRedis(decode_responses=True)
+    yield client
+    await client.aclose()
+
+@pytest.fixture
+async def result_channel(redis_client):
+    channel = ResultChannel(redis_client)
+    await channel.start()
+    yield channel
+    await channel.stop()
+
+@pytest.fixture
+async def store(redis_client, result_channel):
+    return ClaimResultStore(redis_client, result_channel)
+
+async def test_pending_then_success(store):
+    """접수 후 PENDING, 처리 후 SUCCESS 와 받은 금액이 조회되는지 테스트"""
+    await store.create("claim-1", user_id=2)
+    result = await store.get("claim-1")
+    assert result["status"] == CLAIM_PENDING
+    assert result["user_id"] == 2
+    assert result["received_amount"] is None
+
+    await store.save_success("claim-1", 1000)
+    result = await store.get("claim-1")
+    assert result["status"] == CLAIM_SUCCESS
+    assert result["received_amount"] == 1000
+
+async def test_failure_keeps_error(store):
+    """처리 실패 시 사유가 조회되는지 테스트"""
+    await store.create("claim-1", user_id=2)
+    await store.save_failure("claim-1", "받을 수 있는 금액이 없습니다.")
+
+    result = await store.get("claim-1")
+    assert result["status"] == CLAIM_FAILED
+    assert result["error"] == "받을 수 있는 금액이 없습니다."
+
+async def test_get_unknown_claim(store):
+    """없는 요청은 None"""
+    assert await store.get("unknown") is None
+
+async def test_wait_returns_when_completed(store):
+    """long-poll 대기 중 처리가 끝나면 바로 결과를 반환하는지 테스트"""
+    await store.create("claim-1", user_id=2)
+
+    async def complete_later():
+        await asyncio.sleep(0.05)
+        await store.save_success("claim-1", 1000)
+
+    completion = asyncio.create_task(complete_later())
+    result = await store.wait("claim-1", timeout=5)
+    await completion
+
+    assert result["status"] == CLAIM_SUCCESS
+
+async def test_wait_uses_completion_notice_instead_of_polling(store, redis_client, result_channel, monkeypatch):
+    """대기 중 Redis 를 반복 조회하지 않고 처리 완료 알림으로 깨어나는지 테스트"""
+    await store.create("claim-1", user_id=2)
+    reads = []
+    original_hgetall = redis_client.hgetall
+
+    async def counting_hgetall(key):
+        reads.append(key)
+        return await original_hgetall(key)
+
+    monkeypatch.setattr(redis_client, "hgetall", counting_hgetall)
+
+    async def complete_later():
+        await asyncio.sleep(0.3)
+        await store.save_failure("claim-1", "받을 수 있는 금액이 없습니다.")
+
+    completion = asyncio.create_task(complete_later())
+    result = await store.wait("claim-1", timeout=5)
+    await completion
+
+    assert result["status"] == CLAIM_FAILED
+    assert len(reads) == 3  # 대기 전 / 대기 등록 후 / 알림 수신 후
+    assert not result_channel._claim_watchers
+
+async def test_wait_times_out_as_pending(store):
+    """대기 시간이 지나도록 처리되지 않으면 PENDING 을 반환하는지 테스트"""
+    await store.create("claim-1", user_id=2)
+    result = await store.wait("claim-1", timeout=0.05)
+    assert result["status"] == CLAIM_PENDING
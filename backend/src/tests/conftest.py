@@ -30,6 +30,12 @@ def mock_settings(monkeypatch):
     test_settings = TestSettings()
     monkeypatch.setattr("src.core.config.settings", test_settings)
 
+@pytest.fixture(autouse=True)
+def clear_membership_cache():
+    """테스트마다 같은 대화방 ID 를 사용하므로 프로세스 단위 멤버십 캐시 초기화"""
+    from src.utils.membership.membership_cache import membership_local_cache
+    membership_local_cache.clear()
+
 @pytest.fixture(scope="session")
 def event_loop():
     loop = asyncio.new_event_loop()
@@ -0,0 +1,28 @@
+import pytest
+
+from src.api.distribution.service.spray_service import SprayService
+
+@pytest.mark.parametrize("impl", ["numpy", "array"])
+def test_distribute_amount_compact(impl):
+    """압축 배열 기반 금액 분배가 리스트 구현과 같은 규칙을 지키는지 테스트"""
+    if impl == "numpy":
+        np = pytest.importorskip("numpy")
+        amounts = SprayService._distribute_amount_numpy(total_amount=1_000_003, count=100_000)
+        assert amounts.dtype == np.int64
+    else:
+        amounts = SprayService._distribute_amount_array(total_amount=1_000_003, count=100_000)
+        assert amounts.typecode == 'q'
+
+    values = amounts.tolist()
+    assert len(values) == 100_000
+    assert sum(values) == 1_000_003
+    assert set(values) == {10, 11}
+    assert values.count(11) == 3
+
+def test_distribute_amount_compact_invalid_input():
+    """압축 배열 기반 금액 분배의 유효하지 않은 입력 테스트"""
+    with pytest.raises(ValueError):
+        SprayService.distribute_amount_compact(total_amount=-1000, count=3)
+
+    with pytest.raises(ValueError):
+        SprayService.distribute_amount_compact(total_amount=2, count=3)
@@ -0,0 +1,78 @@
+import pytest
+from hypothesis import given, settings as hypothesis_settings, strategies as st
+
+from src.common.enums import DistributionType
+from src.core.config import settings
+from src.utils.distribution_strategy.distribution_strategy import (
+    equal_split,
+    first_come_bonus_split,
+    get_strategy,
+    random_split
+)
+
+@st.composite
+def split_inputs(draw):
+    """인원별 최소 1원이 가능한 (총액, 인원 수) 조합"""
+    count = draw(st.integers(min_value=1, max_value=2000))
+    total_amount = draw(st.integers(min_value=count, max_value=count * 10_000))
+    return total_amount, count
+
+@pytest.mark.parametrize("distribution_type", list(DistributionType))
+@hypothesis_settings(max_examples=200, deadline=None)
+@given(inputs=split_inputs())
+def test_strategy_is_exact(distribution_type, inputs):
+    """모든 전략은 합계가 총액과 정확히 같고 인원별 최소 1원을 보장"""
+    total_amount, count = inputs
+    amounts = get_strategy(distribution_type)(total_amount, count)
+
+    assert len(amounts) == count
+    assert sum(amounts) == total_amount
+    assert min(amounts) >= 1
+    assert all(isinstance(amount, int) for amount in amounts)
+
+@hypothesis_settings(max_examples=200, deadline=None)
+@given(inputs=split_inputs())
+def test_equal_split_shares_differ_by_at_most_one(inputs):
+    """동일 분배는 모든 금액이 base 또는 base+1"""
+    total_amount, count = inputs
+    amounts = equal_split(total_amount, count)
+    base_amount, remaining = divmod(total_amount, count)
+
+    assert set(amounts) <= {base_amount, base_amount + 1}
+    assert amounts.count(base_amount + 1) == remaining
+
+@hypothesis_settings(max_examples=200, deadline=None)
+@given(inputs=split_inputs())
+def test_first_come_bonus_goes_to_first_recipient(inputs):
+    """선착순 보너스 분배는 첫 번째 금액에 보너스가 더해짐"""
+    total_amount, count = inputs
+    amounts = first_come_bonus_split(total_amount, count)
+    bonus = (total_amount - count) * settings.FIRST_COME_BONUS_PERCENT // 100
+
+    assert amounts[0] >= bonus + 1
+    # 나머지 금액은 동일 분배이므로 잔액 1원 차이를 제외하면 첫 번째 금액이 가장 큼
+    assert amounts[0] + 1 >= max(amounts)
+
+def test_random_split_is_not_equal():
+    """랜덤 분배는 금액이 충분하면 균등하지 않은 분배를 만듦"""
+    amounts = random_split(total_amount=1_000_000, count=100)
+    assert len(set(amounts)) > 2
+
+@pytest.mark.parametrize("distribution_type", list(DistributionType))
+def test_strategy_invalid_input(distribution_type):
+    """모든 전략은 유효하지 않은 입력에 ValueError"""
+    strategy = get_strategy(distribution_type)
+
+    with pytest.raises(ValueError):
+        strategy(-1000, 3)
+
+    with pytest.raises(ValueError):
+        strategy(1000, 0)
+
+    with pytest.raises(ValueError):
+        strategy(2, 3)
+
+def test_unknown_strategy():
+    """등록되지 않은 분배 방식 조회 시 ValueError"""
+    with pytest.raises(ValueError):
+        get_strategy("UNKNOWN")
@@ -2,9 +2,9 @@ import asyncio
 import pytest
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, event
 from fastapi import HTTPException
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 
 from src.db.models import (
     MoneyDistribution,
@@ -15,6 +15,10 @@ from src.db.models import (
     UserWallet
 )
 from src.api.distribution.service.lookup_service import LookupService
+from src.api.distribution.service.receive_service import ReceiveService
+from src.utils.spray_status_cache.spray_status_cache import SprayStatusCache
+from src.utils.spray_status_stream.spray_status_stream import SprayStatusHub
+from fakeredis import aioredis as fakeredis
 
 pytestmark = pytest.mark.asyncio
 
@@ -78,7 +82,7 @@ def mock_token_service():
     """TokenService 모킹"""
     with patch('src.utils.token.token.TokenService') as mock:
         instance = mock.return_value
-        instance.validate_token.return_value = True
+        instance.validate_token = AsyncMock(return_value=True)
         yield instance
 
 async def test_get_spray_status_success(db_session: AsyncSession, setup_test_data: MoneyDistribution, mock_token_service):
@@ -108,6 +112,10 @@ async def test_get_spray_status_with_received(db_session: AsyncSession, setup_te
     detail = detail.scalar_one()
     detail.receiver_id = 2
     detail.claimed_at = datetime.utcnow()
+    # 받기 처리와 마찬가지로 받기 집계도 반영
+    setup_test_data.claimed_count = 1
+    setup_test_data.claimed_amount = 1000
+    setup_test_data.last_claimed_at = detail.claimed_at
     await db_session.commit()
 
     service = LookupService(db_session)
@@ -225,6 +233,10 @@ async def test_multiple_received_details(db_session: AsyncSession, setup_test_da
     details[1].allocated_amount = 1500
 
     # 세 번째 건은 미수령 상태로 둠 (1000원)
+    # 받기 처리와 마찬가지로 받기 집계도 반영
+    setup_test_data.claimed_count = 2
+    setup_test_data.claimed_amount = 2000
+    setup_test_data.last_claimed_at = details[1].claimed_at
     await db_session.commit()
 
     service = LookupService(db_session)
@@ -245,4 +257,157 @@ async def test_multiple_received_details(db_session: AsyncSession, setup_test_da
     assert received_list[0].user_id == 2
     assert received_list[0].amount == 500
     assert received_list[1].user_id == 3
-    assert received_list[1].amount == 1500 
\ No newline at end of file
+    assert received_list[1].amount == 1500
+
+async def test_get_spray_status_single_query(db_session: AsyncSession, setup_test_data: MoneyDistribution, mock_token_service):
+    """뿌리기 정보 / 받기 집계 / 받은 내역을 한 번의 쿼리로 조회하는지 테스트"""
+    details = (await db_session.execute(
+        select(MoneyDistributionDetail).where(MoneyDistributionDetail.distribution_id == setup_test_data.id)
+    )).scalars().all()
+    details[0].receiver_id = 2
+    details[0].claimed_at = datetime.utcnow()
+    setup_test_data.claimed_count = 1
+    setup_test_data.claimed_amount = 1000
+    await db_session.commit()
+
+    service = LookupService(db_session)
+    service._token_service = mock_token_service
+
+    statements = []
+    def _count(conn, cursor, statement, *args):
+        statements.append(statement)
+    event.listen(db_session.bind.sync_engine, "before_cursor_execute", _count)
+    try:
+        response = await service.get_spray_status(token=setup_test_data.token, user_id=1)
+    finally:
+        event.remove(db_session.bind.sync_engine, "before_cursor_execute", _count)
+
+    assert len(statements) == 1
+    assert response.received_amount == 1000
+    assert [(item.user_id, item.amount) for item in response.received_list] == [(2, 1000)]
+
+async def test_get_spray_status_expired_or_missing(db_session: AsyncSession, setup_test_data: MoneyDistribution, mock_token_service):
+    """상태 조회 시 만료 / 없는 토큰을 구분하는지 테스트"""
+    service = LookupService(db_session)
+    service._token_service = mock_token_service
+
+    with pytest.raises(ValueError) as exc_info:
+        await service.get_spray_status(token="XYZ", user_id=1)
+    assert "해당 토큰으로 분배된 내역이 없습니다" in str(exc_info.value)
+
+    setup_test_data.created_at = datetime.utcnow() - timedelta(days=8)
+    await db_session.commit()
+    with pytest.raises(ValueError) as exc_info:
+        await service.get_spray_status(token=setup_test_data.token, user_id=1)
+    assert "조회 가능 기간이 만료되었습니다" in str(exc_info.value)
+
+@pytest.fixture
+async def redis_client():
+    client = fakeredis.FakeRedis(decode_responses=True)
+    yield client
+    await client.aclose()
+
+async def test_get_spray_status_cached(db_session: AsyncSession, setup_test_data: MoneyDistribution, mock_token_service, redis_client):
+    """캐시된 응답은 DB 조회 없이 반환되고, If-None-Match 가 같으면 본문 없이 반환되는지 테스트"""
+    service = LookupService(db_session, redis_client)
+    service._token_service = mock_token_service
+
+    body, etag = await service.get_spray_status_cached(setup_test_data.token, 1)
+    assert etag == SprayStatusCache.etag(setup_test_data.token, "0")
+    assert '"received_amount":0' in body
+
+    statements = []
+    def _count(conn, cursor, statement, *args):
+        statements.append(statement)
+    event.listen(db_session.bind.sync_engine, "before_cursor_execute", _count)
+    try:
+        assert await service.get_spray_status_cached(setup_test_data.token, 1) == (body, etag)
+        assert await service.get_spray_status_cached(setup_test_data.token, 1, if_none_match=f'W/{etag}') == (None, etag)
+
+        # 권한 검증도 캐시된 정보로 수행
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_spray_status_cached(setup_test_data.token, 2)
+        assert exc_info.value.status_code == 403
+    finally:
+        event.remove(db_session.bind.sync_engine, "before_cursor_execute", _count)
+    assert statements == []
+
+async def test_get_spray_status_cache_invalidated_on_claim(db_session: AsyncSession, setup_test_data: MoneyDistribution, mock_token_service, redis_client):
+    """받기가 반영되면 버전이 바뀌어 새 응답과 새 ETag 가 반환되는지 테스트"""
+    token = setup_test_data.token
+    service = LookupService(db_session, redis_client)
+    service._token_service = mock_token_service
+    _, etag = await service.get_spray_status_cached(token, 1)
+
+    db_session.add(UserWallet(user_id=2, balance=0))
+    await db_session.commit()
+    await ReceiveService(db_session, redis_client).receive_money(token, 2, setup_test_data.chat_room_id)
+
+    body, new_etag = await service.get_spray_status_cached(token, 1, if_none_match=etag)
+    assert new_etag != etag
+    assert '"received_amount":1000' in body
+
+async def test_spray_status_cache_skips_stale_fill(redis_client):
+    """응답을 만드는 동안 버전이 바뀌었으면 이전 응답을 저장하지 않는지 테스트"""
+    cache = SprayStatusCache(redis_client)
+    version, entry = await cache.get("ABC")
+    assert (version, entry) == ("0", None)
+
+    await cache.bump("ABC", [{"user_id": 2, "amount": 100}])  # 조회 도중 받기 반영
+    assert not await cache.set("ABC", version, creator_id=1, created_at=datetime.utcnow().isoformat(), body="{}")
+    assert (await cache.get("ABC"))[1] is None
+
+async def _next_event(events) -> str:
+    return await asyncio.wait_for(events.__anext__(), timeout=1)
+
+async def test_spray_status_stream(db_session: AsyncSession, setup_test_data: MoneyDistribution, mock_token_service, redis_client):
+    """상태 스트림이 스냅샷 후 받기 내역을 전달하고, 연결이 끊기면 구독을 해제하는지 테스트"""
+    token = setup_test_data.token
+    hub = SprayStatusHub(redis_client)
+    await hub.start()
+    try:
+        service = LookupService(db_session, redis_client)
+        service._token_service = mock_token_service
+
+        # 권한 검증은 스트림 시작 전에 수행되고 구독도 남지 않음
+        with pytest.raises(HTTPException) as exc_info:
+            await service.open_status_stream(token, 2, hub=hub)
+        assert exc_info.value.status_code == 403
+        assert hub.watchers == 0
+
+        events = await service.open_status_stream(token, 1, hub=hub)
+        snapshot = await _next_event(events)
+        assert snapshot.startswith("id: 0\nevent: snapshot\n")
+        assert '"received_amount":0' in snapshot
+
+        db_session.add(UserWallet(user_id=2, balance=0))
+        await db_session.commit()
+        await ReceiveService(db_session, redis_client).receive_money(token, 2, setup_test_data.chat_room_id)
+
+        claim = await _next_event(events)
+        assert claim.startswith("id: 1\nevent: claim\n")
+        assert '"user_id": 2, "amount": 1000' in claim
+
+        # 클라이언트 연결 종료
+        await events.aclose()
+        assert hub.watchers == 0
+    finally:
+        await hub.stop()
+
+async def test_spray_status_stream_ends_after_receive_window(db_session: AsyncSession, setup_test_data: MoneyDistribution, mock_token_service, redis_client):
+    """받기 가능 기간이 지난 뿌리기 건은 스냅샷만 보내고 종료되는지 테스트"""
+    setup_test_data.created_at = datetime.utcnow() - timedelta(minutes=11)
+    await db_session.commit()
+    hub = SprayStatusHub(redis_client)
+    await hub.start()
+    try:
+        service = LookupService(db_session, redis_client)
+        service._token_service = mock_token_service
+        events = await service.open_status_stream(setup_test_data.token, 1, hub=hub)
+        assert "event: snapshot" in await _next_event(events)
+        assert await _next_event(events) == 'event: end\ndata: {}\n\n'
+        with pytest.raises(StopAsyncIteration):
+            await _next_event(events)
+        assert hub.watchers == 0
+    finally:
+        await hub.stop()
@@ -0,0 +1,149 @@
+import asyncio
+import pytest
+from fakeredis import FakeServer, aioredis as fakeredis
+import redis.asyncio as aioredis
+from sqlalchemy import delete, event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import ChatRoom, ChatRoomMember, User
+from src.db.redis import redis_circuit_breaker, PoolExhaustedError
+from src.utils.membership import membership_cache as membership_module
+from src.utils.membership.membership_cache import MembershipCache, membership_local_cache
+
+pytestmark = pytest.mark.asyncio
+
+@pytest.fixture
+async def redis_client(monkeypatch):
+    client = fakeredis.FakeRedis(decode_responses=True)
+    # 커밋 시 자동 무효화도 같은 fakeredis 를 사용하도록 교체
+    monkeypatch.setattr(membership_module, "get_redis_client", lambda: client)
+    membership_local_cache.clear()
+    yield client
+    membership_local_cache.clear()
+    await client.aclose()
+
+@pytest.fixture
+async def test_room(db_session: AsyncSession):
+    """멤버 2명(1, 2)인 대화방 생성"""
+    db_session.add_all([User(id=user_id, username=f"user{user_id}", password="dummy", email=f"user{user_id}@example.com") for user_id in (1, 2, 3)])
+    db_session.add(ChatRoom(id="room_a", room_name="Room A"))
+    db_session.add_all([ChatRoomMember(chat_room_id="room_a", user_id=user_id) for user_id in (1, 2)])
+    await db_session.commit()
+    await asyncio.gather(*membership_module._pending_invalidations)
+    return "room_a"
+
+async def test_miss_loads_from_db_and_fills_redis(db_session: AsyncSession, redis_client, test_room):
+    """최초 조회는 DB 에서 읽어 Redis / 프로세스 캐시를 채우고, 이후에는 DB 를 조회하지 않는지 테스트"""
+    cache = MembershipCache(redis_client)
+    assert await cache.is_member(db_session, test_room, 1)
+    assert not await cache.is_member(db_session, test_room, 3)
+    assert await redis_client.smembers(f"room_members:{{{test_room}}}") == {"-", "1", "2"}
+
+    # 벌크 DELETE 는 자동 무효화 대상이 아니므로 캐시된 결과가 유지됨 (DB 미조회)
+    await db_session.execute(delete(ChatRoomMember).where(ChatRoomMember.user_id == 1))
+    await db_session.commit()
+    assert await cache.is_member(db_session, test_room, 1)
+
+    # 프로세스 캐시가 비어도 Redis 에서 조회
+    membership_local_cache.clear()
+    assert await cache.is_member(db_session, test_room, 1)
+
+    await cache.invalidate([test_room])
+    assert not await cache.is_member(db_session, test_room, 1)
+
+async def test_commit_invalidates_changed_room(db_session: AsyncSession, redis_client, test_room):
+    """ChatRoomMember 추가 커밋 시 캐시가 무효화되는지 테스트"""
+    cache = MembershipCache(redis_client)
+    assert not await cache.is_member(db_session, test_room, 3)
+
+    db_session.add(ChatRoomMember(chat_room_id=test_room, user_id=3))
+    await db_session.commit()
+    await asyncio.gather(*membership_module._pending_invalidations)
+
+    assert await cache.is_member(db_session, test_room, 3)
+
+async def test_redis_hit_checks_single_member(db_session: AsyncSession, redis_client, test_room, monkeypatch):
+    """Redis 에서는 멤버 목록 전체(SMEMBERS) 대신 요청한 사용자만 확인하는지 테스트"""
+    cache = MembershipCache(redis_client)
+    assert await cache.is_member(db_session, test_room, 1)  # DB 에서 적재
+    membership_local_cache.clear()
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("SMEMBERS should not be used")
+
+    monkeypatch.setattr(aioredis.client.Pipeline, "smembers", _fail)
+    assert await cache.is_member(db_session, test_room, 2)
+    assert not await cache.is_member(db_session, test_room, 3)
+
+    # 프로세스 캐시에는 확인한 사용자의 결과만 보관
+    assert membership_local_cache.get(test_room) == {2: True, 3: False}
+
+async def test_commit_hooks_only_on_membership_writes(db_session: AsyncSession, redis_client, test_room):
+    """ChatRoomMember 를 변경하지 않은 세션에는 커밋 훅이 등록되지 않는지 테스트"""
+    async with AsyncSession(db_session.bind) as session:
+        session.add(User(id=4, username="user4", password="dummy", email="user4@example.com"))
+        await session.commit()
+        assert not event.contains(session.sync_session, "after_commit", membership_module._invalidate_changed_rooms)
+
+        session.add(ChatRoomMember(chat_room_id=test_room, user_id=4))
+        await session.commit()
+        assert event.contains(session.sync_session, "after_commit", membership_module._invalidate_changed_rooms)
+    await asyncio.gather(*membership_module._pending_invalidations)
+
+async def test_member_rooms(db_session: AsyncSession, redis_client, test_room):
+    """여러 대화방 중 멤버인 대화방만 반환하는지 테스트 (멤버가 없는 대화방 포함)"""
+    cache = MembershipCache(redis_client)
+    assert await cache.member_rooms(db_session, 1, [test_room, "room_b"]) == {test_room}
+    assert await redis_client.smembers("room_members:{room_b}") == {"-"}
+
+async def test_stale_fill_is_discarded(redis_client):
+    """적재 도중 무효화가 있었으면 이전 멤버 목록을 Redis 에 저장하지 않는지 테스트"""
+    cache = MembershipCache(redis_client)
+    await cache.invalidate(["room_a"])  # 조회 이후 멤버 변경
+    await cache._fill_redis({"room_a": frozenset({1})}, {"room_a": ""})
+    assert await redis_client.smembers("room_members:{room_a}") == set()
+
+async def test_redis_down_falls_back_to_db(db_session: AsyncSession, redis_client, test_room):
+    """Redis 장애 시 DB 로 조회하는지 테스트"""
+    server = FakeServer()
+    server.connected = False
+    cache = MembershipCache(fakeredis.FakeRedis(server=server, decode_responses=True))
+    try:
+        assert await cache.is_member(db_session, test_room, 2)
+        assert redis_circuit_breaker.stats()["consecutive_failures"] == 1
+    finally:
+        redis_circuit_breaker.reset()
+
+@pytest.fixture
+def half_open_breaker(monkeypatch):
+    """공유 서킷 브레이커를 half_open 상태로 전환 (다음 요청이 시험 요청)"""
+    monkeypatch.setattr(redis_circuit_breaker, "_state", redis_circuit_breaker.HALF_OPEN)
+    yield redis_circuit_breaker
+    redis_circuit_breaker.reset()
+
+async def test_half_open_trial_settled_on_response_error(db_session: AsyncSession, redis_client, test_room, half_open_breaker):
+    """시험 요청이 연결 오류가 아닌 Redis 오류(WRONGTYPE)로 끝나면 서킷을 닫고 DB 로 조회하는지 테스트"""
+    await redis_client.set(f"room_members:{{{test_room}}}", "not-a-set")
+    cache = MembershipCache(redis_client)
+
+    assert await cache.is_member(db_session, test_room, 1)
+    assert half_open_breaker.state == half_open_breaker.CLOSED
+    assert half_open_breaker.allow_request()
+
+@pytest.mark.parametrize("error", [asyncio.CancelledError(), PoolExhaustedError("No connection available.")])
+async def test_half_open_trial_released_without_verdict(db_session: AsyncSession, redis_client, test_room, half_open_breaker, monkeypatch, error):
+    """시험 요청이 취소 / 커넥션 풀 대기 시간 초과로 끝나면 다음 요청에 시험 기회를 넘기는지 테스트"""
+    cache = MembershipCache(redis_client)
+
+    async def _interrupted(*args):
+        raise error
+
+    monkeypatch.setattr(cache, "_check_in_redis", _interrupted)
+    if isinstance(error, asyncio.CancelledError):
+        with pytest.raises(asyncio.CancelledError):
+            await cache.is_member(db_session, test_room, 1)
+    else:
+        assert await cache.is_member(db_session, test_room, 1)  # DB 로 조회
+
+    assert half_open_breaker.state == half_open_breaker.HALF_OPEN
+    assert half_open_breaker.allow_request()
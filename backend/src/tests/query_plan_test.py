@@ -0,0 +1,175 @@
+import pytest
+from datetime import datetime
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from fakeredis import aioredis as fakeredis
+
+from src.db.models import (
+    MoneyDistribution,
+    MoneyDistributionDetail,
+    ChatRoom,
+    ChatRoomMember,
+    User,
+    UserWallet
+)
+from src.api.distribution.service.receive_service import ReceiveService
+from src.api.distribution.service.lookup_service import LookupService
+from src.utils.claim_queue.claim_queue import ClaimQueue
+from src.core.config import settings
+
+pytestmark = pytest.mark.asyncio
+
+# 받기 / 조회 경로에서 사용하는 테이블
+HOT_TABLES = ("money_distribution", "money_distribution_details", "user_wallet", "chat_room_members")
+
+@pytest.fixture
+async def redis_client():
+    client = fakeredis.FakeRedis(decode_responses=True)
+    yield client
+    await client.aclose()
+
+@pytest.fixture
+async def setup_test_data(db_session: AsyncSession):
+    """
+    뿌린 사람 1, 받을 사람 2~7 / 조회 대상 뿌리기 건(ABC) 외에 다른 뿌리기 건 200개(분배 내역 2000개)
+
+    행 수가 적으면 옵티마이저가 인덱스 대신 전체 스캔을 선택할 수 있으므로 다른 뿌리기 건을 함께 생성합니다.
+    """
+    db_session.add(ChatRoom(id="test_room", room_name="Test Room"))
+    for uid in range(1, 8):
+        db_session.add(User(id=uid, username=f"user{uid}", password="dummy", email=f"user{uid}@example.com"))
+        db_session.add(ChatRoomMember(chat_room_id="test_room", user_id=uid))
+        db_session.add(UserWallet(user_id=uid, balance=10000))
+    await db_session.flush()
+
+    now = datetime.utcnow()
+    await db_session.execute(insert(MoneyDistribution), [
+        {
+            "id": distribution_id,
+            "token": f"{distribution_id:03d}",
+            "creator_id": 1,
+            "chat_room_id": "test_room",
+            "total_amount": 10000,
+            "recipient_count": 10,
+            "created_at": now
+        }
+        for distribution_id in range(1, 201)
+    ])
+    await db_session.execute(insert(MoneyDistributionDetail), [
+        {"distribution_id": distribution_id, "allocated_amount": 1000}
+        for distribution_id in range(1, 201)
+        for _ in range(10)
+    ])
+
+    spray = MoneyDistribution(
+        id=201,
+        token="ABC",
+        creator_id=1,
+        chat_room_id="test_room",
+        total_amount=6000,
+        recipient_count=6,
+        created_at=now
+    )
+    db_session.add(spray)
+    await db_session.flush()
+    for _ in range(6):
+        db_session.add(MoneyDistributionDetail(distribution_id=spray.id, allocated_amount=1000))
+    await db_session.commit()
+    return spray
+
+async def capture_hot_path_queries(db_session: AsyncSession, redis_client, monkeypatch) -> list:
+    """받기(모든 처리 방식 / db_lock 배치) / 받기 검증 / 상태 조회를 실제로 실행하며 SELECT / UPDATE 문과 파라미터 수집"""
+    statements = []
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(("SELECT", "UPDATE")):
+            statements.append((statement, parameters))
+
+    event.listen(db_session.bind.sync_engine, "before_cursor_execute", _capture)
+    try:
+        service = ReceiveService(db_session, redis_client)
+        await service.validate_receive_request("ABC", 2, "test_room")
+
+        monkeypatch.setattr(settings, "RECEIVE_CLAIM_MODE", "db_lock")
+        await service.receive_money("ABC", 2, "test_room")
+        context = await service.validate_receive_request("ABC", 3, "test_room")
+        await service.receive_money("ABC", 3, "test_room", context=context)
+
+        await service.receive_money_batch("ABC", "test_room", [4, 5])
+
+        monkeypatch.setattr(settings, "RECEIVE_CLAIM_MODE", "conditional_update")
+        await service.receive_money("ABC", 6, "test_room")
+
+        monkeypatch.setattr(settings, "RECEIVE_CLAIM_MODE", "redis_queue")
+        await ClaimQueue(redis_client).push_shares({"ABC": [1000]})
+        await service.receive_money("ABC", 7, "test_room")
+
+        await LookupService(db_session, redis_client).get_spray_status_rows("ABC")
+    finally:
+        event.remove(db_session.bind.sync_engine, "before_cursor_execute", _capture)
+    return statements
+
+async def explain_problems(db_session: AsyncSession, statement: str, parameters) -> list[str]:
+    """실행 계획에서 전체 스캔 / 별도 정렬 단계 찾기"""
+    connection = await db_session.connection()
+    dialect = db_session.bind.dialect.name
+    problems = []
+    if dialect == "sqlite":
+        rows = (await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)).all()
+        for row in rows:
+            detail = row[-1]
+            # SCAN <table> 은 테이블 / 인덱스 전체 스캔, TEMP B-TREE 는 인덱스 순서를 쓰지 못한 정렬
+            if detail.startswith("SCAN ") and detail.split()[1] in HOT_TABLES:
+                problems.append(detail)
+            if "USE TEMP B-TREE FOR ORDER BY" in detail:
+                problems.append(detail)
+    else:
+        result = await connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        columns = list(result.keys())
+        for row in result.all():
+            plan = dict(zip(columns, row))
+            if plan.get("table") not in HOT_TABLES:
+                continue
+            # ALL: 테이블 전체 스캔, index: 인덱스 전체 스캔
+            if plan.get("type") in ("ALL", "index"):
+                problems.append(f"{plan['table']}: type={plan['type']}")
+            if "Using filesort" in (plan.get("Extra") or ""):
+                problems.append(f"{plan['table']}: Using filesort")
+    await db_session.rollback()
+    return problems
+
+async def test_hot_path_queries_use_indexes(db_session: AsyncSession, setup_test_data: MoneyDistribution, redis_client, monkeypatch):
+    """받기 / 상태 조회 경로의 쿼리가 전체 스캔이나 별도 정렬 없이 인덱스로 처리되는지 테스트"""
+    if db_session.bind.dialect.name == "mysql":
+        connection = await db_session.connection()
+        await connection.exec_driver_sql(f"ANALYZE TABLE {', '.join(HOT_TABLES)}")
+        await db_session.commit()
+
+    statements = await capture_hot_path_queries(db_session, redis_client, monkeypatch)
+    assert len(statements) >= 10
+
+    # 배치 처리(IN 조회 / 필요한 수만큼 잠그는 분배 내역 조회)와 redis_queue 분배 내역 조회도 검사 대상에 포함
+    # (SQLite 는 FOR UPDATE 를 생략하므로 MySQL 에서만 잠금 구문까지 확인)
+    is_mysql = db_session.bind.dialect.name == "mysql"
+    normalized = [(" ".join(statement.split()), parameters) for statement, parameters in statements]
+    assert any("money_distribution_details.receiver_id IN (" in statement for statement, _ in normalized)
+    assert any("user_wallet.user_id IN (" in statement for statement, _ in normalized)
+    assert any(
+        "money_distribution_details.receiver_id IS NULL ORDER BY money_distribution_details.id LIMIT" in statement
+        and "allocated_amount =" not in statement
+        and parameters[1] == 2
+        and (not is_mysql or statement.endswith("FOR UPDATE"))
+        for statement, parameters in normalized
+    )
+    assert any(
+        "money_distribution_details.allocated_amount =" in statement
+        and "money_distribution_details.receiver_id IS NULL" in statement
+        and (not is_mysql or statement.endswith("FOR UPDATE SKIP LOCKED"))
+        for statement, _ in normalized
+    )
+
+    failures = {}
+    for statement, parameters in statements:
+        problems = await explain_problems(db_session, statement, parameters)
+        if problems:
+            failures[" ".join(statement.split())] = problems
+    assert failures == {}
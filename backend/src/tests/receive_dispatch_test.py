@@ -0,0 +1,168 @@
+import asyncio
+import time
+
+import pytest
+
+from src.utils.receive_dispatch.receive_dispatch import ReceiveDispatcher, PATH_INLINE, PATH_CELERY
+
+pytestmark = pytest.mark.asyncio
+
+class FakeClock:
+    """테스트용 시계"""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class FakeProbe:
+    """큐 깊이 조회 횟수를 기록하는 테스트용 probe"""
+    def __init__(self, depth: int = 0):
+        self.depth = depth
+        self.calls = 0
+
+    def __call__(self, queue_name: str):
+        self.calls += 1
+        self.last_queue = queue_name
+        return self.depth
+
+def make_dispatcher(probe, clock, max_in_flight=2, max_queue_depth=10, serialize_queues=False):
+    return ReceiveDispatcher(
+        max_in_flight=max_in_flight,
+        max_queue_depth=max_queue_depth,
+        depth_ttl=1.0,
+        depth_probe=probe,
+        queue_for=lambda token: f"receive_requests.{token}",
+        serialize_queues=serialize_queues,
+        clock=clock
+    )
+
+async def test_inline_when_idle():
+    """큐가 비어 있고 처리 중인 요청이 없으면 inline"""
+    dispatcher = make_dispatcher(FakeProbe(0), FakeClock())
+    assert await dispatcher.choose_path("ABC") == PATH_INLINE
+
+async def test_celery_when_queue_is_deep():
+    """큐 깊이가 상한 이상이면 celery"""
+    dispatcher = make_dispatcher(FakeProbe(10), FakeClock())
+    assert await dispatcher.choose_path("ABC") == PATH_CELERY
+
+async def test_celery_when_token_is_hot():
+    """같은 토큰의 inline 처리 중 요청이 상한 이상이면 celery (다른 토큰은 inline)"""
+    dispatcher = make_dispatcher(FakeProbe(0), FakeClock(), max_in_flight=2)
+
+    with dispatcher.track("ABC"), dispatcher.track("ABC"):
+        assert await dispatcher.choose_path("ABC") == PATH_CELERY
+        assert await dispatcher.choose_path("XYZ") == PATH_INLINE
+
+    assert dispatcher.in_flight("ABC") == 0
+    assert await dispatcher.choose_path("ABC") == PATH_INLINE
+
+async def test_serialized_queue_inline_only_when_shard_is_idle():
+    """샤드 큐 직렬화 시 같은 큐로 처리 중인 요청(inline / celery)이 있으면 celery"""
+    dispatcher = make_dispatcher(FakeProbe(0), FakeClock(), max_in_flight=2, serialize_queues=True)
+
+    with dispatcher.track("ABC"):
+        assert await dispatcher.choose_path("ABC") == PATH_CELERY
+        assert await dispatcher.choose_path("XYZ") == PATH_INLINE
+
+    with dispatcher.track_dispatch("ABC"):
+        assert await dispatcher.choose_path("ABC") == PATH_CELERY
+    assert dispatcher.queue_in_flight("receive_requests.ABC") == 0
+
+    assert await dispatcher.choose_path("ABC") == PATH_INLINE
+
+async def test_serialized_queue_requires_empty_queue():
+    """샤드 큐 직렬화 시 큐에 메시지가 하나라도 있으면 celery"""
+    probe = FakeProbe(1)
+    dispatcher = make_dispatcher(probe, FakeClock(), max_queue_depth=10, serialize_queues=True)
+    assert await dispatcher.choose_path("ABC") == PATH_CELERY
+
+async def test_serialized_queue_rechecks_after_depth_probe():
+    """큐 깊이 확인 중 같은 큐로 위임된 요청이 생기면 inline 으로 앞지르지 않음"""
+    dispatcher = make_dispatcher(FakeProbe(0), FakeClock(), serialize_queues=True)
+    original = dispatcher.queue_depth
+
+    async def depth_with_concurrent_dispatch(queue_name):
+        depth = await original(queue_name)
+        dispatcher._queue_in_flight[queue_name] = 1  # 대기 중 다른 요청이 위임됨
+        return depth
+
+    dispatcher.queue_depth = depth_with_concurrent_dispatch
+    assert await dispatcher.choose_path("ABC") == PATH_CELERY
+
+async def test_in_flight_cap_holds_while_depth_probe_is_slow():
+    """큐 깊이 확인이 느린 동안 상한보다 많은 요청이 몰려도 inline 은 상한까지만 허용"""
+    class SlowProbe(FakeProbe):
+        def __call__(self, queue_name: str):
+            time.sleep(0.05)
+            return super().__call__(queue_name)
+
+    dispatcher = make_dispatcher(SlowProbe(0), FakeClock(), max_in_flight=2)
+    release = asyncio.Event()
+
+    async def receive():
+        path = await dispatcher.choose_path("ABC")
+        if path == PATH_INLINE:
+            # 호출자와 같이 await 없이 바로 처리 중 요청으로 등록
+            with dispatcher.track("ABC"):
+                await release.wait()
+        return path
+
+    requests = [asyncio.create_task(receive()) for _ in range(8)]
+    await asyncio.sleep(0.2)
+    assert dispatcher.in_flight("ABC") == 2
+    release.set()
+    paths = await asyncio.gather(*requests)
+
+    assert paths.count(PATH_INLINE) == 2
+    assert paths.count(PATH_CELERY) == 6
+
+async def test_queue_depth_is_cached():
+    """큐 깊이는 TTL 동안 캐시되어 브로커를 매번 조회하지 않음"""
+    probe = FakeProbe(3)
+    clock = FakeClock()
+    dispatcher = make_dispatcher(probe, clock)
+
+    assert await dispatcher.queue_depth("receive_requests.0") == 3
+    probe.depth = 20
+    assert await dispatcher.queue_depth("receive_requests.0") == 3
+    assert probe.calls == 1
+
+    # 다른 큐는 따로 조회
+    assert await dispatcher.queue_depth("receive_requests.1") == 20
+    assert probe.calls == 2
+
+    clock.now = 1.0
+    assert await dispatcher.queue_depth("receive_requests.0") == 20
+    assert probe.calls == 3
+
+async def test_choose_path_checks_token_queue():
+    """토큰이 배정되는 큐의 깊이를 확인하는지 테스트"""
+    probe = FakeProbe(0)
+    dispatcher = make_dispatcher(probe, FakeClock())
+
+    await dispatcher.choose_path("ABC")
+    assert probe.last_queue == "receive_requests.ABC"
+
+async def test_queue_depth_probe_failure_keeps_last_value():
+    """브로커 조회에 실패하면 마지막 값 유지"""
+    def failing_probe(queue_name):
+        raise ConnectionError("broker down")
+
+    dispatcher = make_dispatcher(failing_probe, FakeClock())
+    assert await dispatcher.queue_depth("receive_requests") == 0
+
+async def test_stats_per_path():
+    """경로별 처리 건수/실패 건수/지연 시간 집계"""
+    dispatcher = make_dispatcher(FakeProbe(0), FakeClock())
+    dispatcher.record(PATH_INLINE, 0.002, True)
+    dispatcher.record(PATH_INLINE, 0.004, False)
+    dispatcher.record(PATH_CELERY, 0.050, True)
+
+    stats = dispatcher.stats()
+    assert stats[PATH_INLINE]["requests"] == 2
+    assert stats[PATH_INLINE]["failures"] == 1
+    assert stats[PATH_INLINE]["latency_ms"]["max"] == 4.0
+    assert stats[PATH_CELERY]["requests"] == 1
+    assert stats[PATH_CELERY]["latency_ms"]["p50"] == 50.0
@@ -1,8 +1,9 @@
 import asyncio
+import threading
 import pytest
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, delete, event
 from fastapi import HTTPException
 from unittest.mock import patch, MagicMock
 from fastapi import status
@@ -18,7 +19,13 @@ from src.db.models import (
     TransactionTypeEnum,
     TransactionStatusEnum
 )
-from src.api.distribution.service.receive_service import ReceiveService
+from src.api.distribution.schema import ReceiveValidationContext
+from src.api.distribution.service import receive_service as receive_service_module
+from src.api.distribution.service.receive_service import ReceiveService, receive_dispatcher
+from src.core.config import settings
+from src.utils.claim_queue.claim_queue import ClaimQueue
+from src.utils.result_channel.result_channel import ResultChannel, publish_result
+from fakeredis import aioredis as fakeredis
 
 pytestmark = pytest.mark.asyncio
 
@@ -132,6 +139,148 @@ async def test_receive_money_success(db_session: AsyncSession, setup_test_data:
     assert transaction.status == TransactionStatusEnum.SUCCESS
     assert transaction.transaction_type == TransactionTypeEnum.RECEIVE
 
+@pytest.fixture
+async def redis_queue_mode(monkeypatch):
+    """redis_queue 받기 모드 + fakeredis 클라이언트"""
+    monkeypatch.setattr(settings, "RECEIVE_CLAIM_MODE", "redis_queue")
+    redis_client = fakeredis.FakeRedis(decode_responses=True)
+    yield redis_client
+    await redis_client.aclose()
+
+@pytest.mark.asyncio
+async def test_receive_money_from_queue(db_session: AsyncSession, setup_test_data: MoneyDistribution, redis_queue_mode):
+    """redis_queue 모드에서 큐의 금액으로 받기가 처리되는지 테스트"""
+    await ClaimQueue(redis_queue_mode).push_shares({setup_test_data.token: [1000, 1000, 1000]})
+    service = ReceiveService(db_session, redis_queue_mode)
+    room_id = setup_test_data.chat_room_id
+
+    assert await service.receive_money(setup_test_data.token, 2, room_id) == 1000
+
+    detail = (await db_session.execute(
+        select(MoneyDistributionDetail).where(MoneyDistributionDetail.receiver_id == 2)
+    )).scalar_one()
+    assert detail.claimed_at is not None
+
+    balance = (await db_session.execute(
+        select(UserWallet.balance).where(UserWallet.user_id == 2)
+    )).scalar_one()
+    assert balance == 11000
+
+    transaction = (await db_session.execute(
+        select(TransactionHistory).where(TransactionHistory.user_id == 2)
+    )).scalar_one()
+    assert transaction.balance_after == 11000
+    assert await ClaimQueue(redis_queue_mode).remaining(setup_test_data.token) == 2
+
+    # 같은 사용자는 다시 받을 수 없음
+    with pytest.raises(ValueError) as exc_info:
+        await service.receive_money(setup_test_data.token, 2, room_id)
+    assert "이미 받은 사용자입니다" in str(exc_info.value)
+
+@pytest.mark.asyncio
+async def test_receive_money_from_queue_releases_on_failure(db_session: AsyncSession, setup_test_data: MoneyDistribution, redis_queue_mode):
+    """DB 반영 실패 시 선점한 금액이 큐로 되돌려지는지 테스트"""
+    token = setup_test_data.token
+    room_id = setup_test_data.chat_room_id
+    claim_queue = ClaimQueue(redis_queue_mode)
+    await claim_queue.push_shares({token: [1000, 1000, 1000]})
+    await db_session.execute(delete(UserWallet).where(UserWallet.user_id == 2))
+    await db_session.commit()
+
+    service = ReceiveService(db_session, redis_queue_mode)
+    with pytest.raises(ValueError) as exc_info:
+        await service.receive_money(token, 2, room_id)
+    assert "사용자 지갑을 찾을 수 없습니다" in str(exc_info.value)
+
+    assert await claim_queue.remaining(token) == 3
+    unclaimed = (await db_session.execute(
+        select(MoneyDistributionDetail).where(MoneyDistributionDetail.receiver_id.is_(None))
+    )).scalars().all()
+    assert len(unclaimed) == 3
+
+@pytest.mark.asyncio
+async def test_receive_money_without_queue_falls_back_to_lock(db_session: AsyncSession, setup_test_data: MoneyDistribution, redis_queue_mode):
+    """큐가 없는 뿌리기 건은 DB 락 방식으로 처리되는지 테스트"""
+    service = ReceiveService(db_session, redis_queue_mode)
+    received_amount = await service.receive_money(setup_test_data.token, 2, setup_test_data.chat_room_id)
+    assert received_amount == 1000
+
+@pytest.mark.asyncio
+async def test_receive_money_with_conditional_update(db_session: AsyncSession, setup_test_data: MoneyDistribution, monkeypatch):
+    """conditional_update 모드에서 분배 내역 선점 / 중복 / 소진 처리 테스트"""
+    monkeypatch.setattr(settings, "RECEIVE_CLAIM_MODE", "conditional_update")
+    token = setup_test_data.token
+    room_id = setup_test_data.chat_room_id
+    service = ReceiveService(db_session)
+
+    for user_id in (2, 3, 4):
+        assert await service.receive_money(token, user_id, room_id) == 1000
+
+    balance = (await db_session.execute(
+        select(UserWallet.balance).where(UserWallet.user_id == 2)
+    )).scalar_one()
+    assert balance == 11000
+
+    # 유니크 제약으로 중복 받기 차단
+    with pytest.raises(ValueError) as exc_info:
+        await service.receive_money(token, 2, room_id)
+    assert "이미 받은 사용자입니다" in str(exc_info.value)
+
+    # 미할당 분배 내역 없음
+    with pytest.raises(ValueError) as exc_info:
+        await service.receive_money(token, 5, room_id)
+    assert "받을 수 있는 금액이 없습니다" in str(exc_info.value)
+
+    receivers = (await db_session.execute(
+        select(MoneyDistributionDetail.receiver_id).order_by(MoneyDistributionDetail.id)
+    )).scalars().all()
+    assert receivers == [2, 3, 4]
+
+@pytest.mark.asyncio
+async def test_receive_money_with_validation_context(db_session: AsyncSession, setup_test_data: MoneyDistribution):
+    """API 단계 검증 결과를 넘기면 뿌리기 건 / 이미 받은 사용자 재조회 없이 처리되는지 테스트"""
+    token, room_id = setup_test_data.token, setup_test_data.chat_room_id
+    service = ReceiveService(db_session)
+    context = await service.validate_receive_request(token, 2, room_id)
+    assert context.distribution_id == setup_test_data.id
+    assert context.creator_id == 1
+
+    # 태스크 payload 로 전달되는 형태 (JSON) 에서 복원
+    context = ReceiveValidationContext.model_validate(context.model_dump(mode="json"))
+
+    statements = []
+    def _count(conn, cursor, statement, *args):
+        statements.append(statement)
+    event.listen(db_session.bind.sync_engine, "before_cursor_execute", _count)
+    try:
+        assert await service.receive_money(token, 2, room_id, context) == 1000
+    finally:
+        event.remove(db_session.bind.sync_engine, "before_cursor_execute", _count)
+
+    assert not any("money_distribution.token" in statement for statement in statements)
+    assert not any(
+        "FROM money_distribution_details" in statement and "receiver_id = ?" in statement
+        for statement in statements
+    )
+
+    # 중복 받기는 유니크 제약으로 확인
+    with pytest.raises(ValueError) as exc_info:
+        await service.receive_money(token, 2, room_id, context)
+    assert "이미 받은 사용자입니다" in str(exc_info.value)
+
+@pytest.mark.asyncio
+async def test_receive_money_with_context_rechecks_window(db_session: AsyncSession, setup_test_data: MoneyDistribution):
+    """검증 결과를 넘겨도 받기 가능 시간은 다시 확인하는지 테스트"""
+    context = ReceiveValidationContext(
+        distribution_id=setup_test_data.id,
+        creator_id=1,
+        created_at=datetime.utcnow() - timedelta(minutes=11)
+    )
+    service = ReceiveService(db_session)
+    with pytest.raises(ValueError) as exc_info:
+        await service.receive_money(setup_test_data.token, 2, setup_test_data.chat_room_id, context)
+    assert "뿌린지 10분이 지나 받을 수 없습니다" in str(exc_info.value)
+
 @pytest.mark.asyncio
 async def test_receive_money_creator_cannot_receive(db_session: AsyncSession, setup_test_data: MoneyDistribution):
     """뿌린 사람이 받으려고 할 때 실패하는 케이스 테스트"""
@@ -275,6 +424,187 @@ async def test_process_receive_request_timeout(db_session: AsyncSession, setup_t
         assert exc_info.value.status_code == 408
         assert "요청 처리 시간이 초과되었습니다" in str(exc_info.value.detail)
 
+@pytest.mark.asyncio
+async def test_process_receive_request_async(db_session: AsyncSession, setup_test_data: MoneyDistribution):
+    """비동기 받기 요청은 결과를 기다리지 않고 claim ID 를 반환하고, 요청자만 상태를 조회할 수 있는지 테스트"""
+    redis_client = fakeredis.FakeRedis(decode_responses=True)
+    publish_threads = []
+    with patch('src.worker.tasks.process_receive_money.apply_async') as mock_task:
+        mock_task.side_effect = lambda **kwargs: publish_threads.append(threading.current_thread())
+        service = ReceiveService(db_session, redis_client)
+        claim_id = await service.process_receive_request_async(
+            token=setup_test_data.token,
+            user_id=2,
+            room_id=setup_test_data.chat_room_id
+        )
+
+        # 브로커 발행은 이벤트 루프 스레드가 아닌 별도 스레드에서 수행
+        assert publish_threads and publish_threads[0] is not threading.main_thread()
+        assert mock_task.call_args.kwargs["task_id"] == claim_id
+        assert mock_task.call_args.kwargs["kwargs"]["store_result"] is True
+        mock_task.return_value.get.assert_not_called()
+
+    result = await service.get_claim_status(claim_id, user_id=2)
+    assert result["status"] == "PENDING"
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.get_claim_status(claim_id, user_id=3)
+    assert exc_info.value.status_code == 404
+    await redis_client.aclose()
+
+@pytest.mark.asyncio
+async def test_process_receive_request_inline(db_session: AsyncSession, setup_test_data: MoneyDistribution, monkeypatch):
+    """큐가 한가하면 Celery 를 거치지 않고 요청 세션으로 바로 처리되는지 테스트"""
+    monkeypatch.setattr(settings, "RECEIVE_INLINE_ENABLED", True)
+    receive_dispatcher.reset()
+    monkeypatch.setattr(receive_dispatcher, "_depth_probe", lambda queue_name: 0)
+
+    with patch('src.worker.tasks.process_receive_money.apply_async') as mock_task:
+        service = ReceiveService(db_session)
+        result = await service.process_receive_request(
+            token=setup_test_data.token,
+            user_id=2,
+            room_id=setup_test_data.chat_room_id
+        )
+        mock_task.assert_not_called()
+
+    assert result == {"received_amount": 1000}
+    assert receive_dispatcher.stats()["inline"]["requests"] == 1
+    receive_dispatcher.reset()
+
+@pytest.mark.asyncio
+async def test_process_receive_request_falls_back_to_celery(db_session: AsyncSession, setup_test_data: MoneyDistribution, monkeypatch):
+    """큐가 밀려 있으면 Celery 태스크로 위임되는지 테스트"""
+    monkeypatch.setattr(settings, "RECEIVE_INLINE_ENABLED", True)
+    receive_dispatcher.reset()
+    monkeypatch.setattr(receive_dispatcher, "_depth_probe", lambda queue_name: settings.RECEIVE_INLINE_MAX_QUEUE_DEPTH)
+
+    with patch('src.worker.tasks.process_receive_money.apply_async') as mock_task:
+        mock_task.return_value.get.return_value = {"received_amount": 1000}
+        service = ReceiveService(db_session)
+        result = await service.process_receive_request(
+            token=setup_test_data.token,
+            user_id=2,
+            room_id=setup_test_data.chat_room_id
+        )
+        mock_task.assert_called_once()
+
+    assert result == {"received_amount": 1000}
+    assert receive_dispatcher.stats()["celery"]["requests"] == 1
+    receive_dispatcher.reset()
+
+@pytest.mark.asyncio
+async def test_process_receive_request_redis_result_channel(db_session: AsyncSession, setup_test_data: MoneyDistribution, monkeypatch):
+    """redis 결과 채널 모드에서 결과 백엔드 없이 pub/sub 으로 결과를 받는지 테스트"""
+    monkeypatch.setattr(settings, "RECEIVE_RESULT_CHANNEL", "redis")
+    redis_client = fakeredis.FakeRedis(decode_responses=True)
+    channel = ResultChannel(redis_client)
+    await channel.start()
+
+    async def _get_result_channel():
+        return channel
+    monkeypatch.setattr(receive_service_module, "get_result_channel", _get_result_channel)
+
+    loop = asyncio.get_running_loop()
+
+    def _worker(*args, **kwargs):
+        # 워커 대신 결과 채널로 결과 발행
+        asyncio.run_coroutine_threadsafe(
+            publish_result(redis_client, kwargs["kwargs"]["reply_channel"], kwargs["task_id"], received_amount=1000),
+            loop
+        )
+
+    with patch('src.worker.tasks.process_receive_money.apply_async', side_effect=_worker) as mock_task:
+        service = ReceiveService(db_session)
+        result = await service.process_receive_request(
+            token=setup_test_data.token,
+            user_id=2,
+            room_id=setup_test_data.chat_room_id
+        )
+        assert mock_task.call_args.kwargs["ignore_result"] is True
+        assert mock_task.call_args.kwargs["kwargs"]["reply_channel"] == channel.name
+
+    assert result == {"received_amount": 1000}
+    await channel.stop()
+    await redis_client.aclose()
+
+@pytest.mark.asyncio
+async def test_receive_money_batch(db_session: AsyncSession, setup_test_data: MoneyDistribution):
+    """여러 받기 요청을 한 트랜잭션으로 처리하고 요청별 결과를 순서대로 반환하는지 테스트"""
+    token = setup_test_data.token
+    room_id = setup_test_data.chat_room_id
+    service = ReceiveService(db_session)
+
+    # 2: 성공, 1: 뿌린 사람, 3: 성공, 2: 같은 배치 내 중복, 5: 지갑 없음
+    outcomes = await service.receive_money_batch(token, room_id, [2, 1, 3, 2, 5])
+
+    assert outcomes[0] == 1000
+    assert "자신이 뿌린 건은 받을 수 없습니다" in str(outcomes[1])
+    assert outcomes[2] == 1000
+    assert "이미 받은 사용자입니다" in str(outcomes[3])
+    assert "사용자 지갑을 찾을 수 없습니다" in str(outcomes[4])
+
+    # 다음 배치: 4 는 마지막 금액을 받고, 이미 받은 3 은 실패
+    outcomes = await service.receive_money_batch(token, room_id, [4, 3])
+    assert outcomes[0] == 1000
+    assert "이미 받은 사용자입니다" in str(outcomes[1])
+
+    balances = dict((await db_session.execute(
+        select(UserWallet.user_id, UserWallet.balance).where(UserWallet.user_id.in_([2, 3, 4]))
+    )).all())
+    assert balances == {2: 11000, 3: 11000, 4: 11000}
+
+    transactions = (await db_session.execute(
+        select(TransactionHistory).where(TransactionHistory.token == token)
+    )).scalars().all()
+    assert sorted(t.user_id for t in transactions) == [2, 3, 4]
+    assert all(t.balance_after == 11000 for t in transactions)
+
+@pytest.mark.asyncio
+async def test_receive_money_batch_exhausted(db_session: AsyncSession, setup_test_data: MoneyDistribution):
+    """남은 분배 내역보다 요청이 많으면 초과 요청은 실패하는지 테스트"""
+    token = setup_test_data.token
+    room_id = setup_test_data.chat_room_id
+    db_session.add(User(id=5, username="user5", password="dummy", email="user5@example.com"))
+    db_session.add(UserWallet(user_id=5, balance=10000))
+    await db_session.commit()
+
+    outcomes = await ReceiveService(db_session).receive_money_batch(token, room_id, [2, 3, 4, 5])
+
+    assert outcomes[:3] == [1000, 1000, 1000]
+    assert "받을 수 있는 금액이 없습니다" in str(outcomes[3])
+
+@pytest.mark.asyncio
+async def test_receive_money_batch_invalid_token(db_session: AsyncSession, setup_test_data: MoneyDistribution):
+    """존재하지 않는 토큰이면 모든 요청 실패"""
+    outcomes = await ReceiveService(db_session).receive_money_batch("ZZZ", setup_test_data.chat_room_id, [2, 3])
+    assert all("유효하지 않은 뿌리기 토큰입니다" in str(outcome) for outcome in outcomes)
+
+@pytest.mark.asyncio
+async def test_receive_money_batch_with_context(db_session: AsyncSession, setup_test_data: MoneyDistribution):
+    """API 단계 검증 결과가 주어지면 토큰 조회 없이 PK 로 잠그고 처리하는지 테스트"""
+    service = ReceiveService(db_session)
+    context = ReceiveValidationContext.from_distribution(setup_test_data)
+
+    # 토큰이 달라도 검증 결과의 뿌리기 건 ID 로 처리
+    outcomes = await service.receive_money_batch("ZZZ", setup_test_data.chat_room_id, [2, 3], context=context)
+    assert outcomes == [1000, 1000]
+
+@pytest.mark.asyncio
+async def test_receive_money_batch_uses_claim_mode(db_session: AsyncSession, setup_test_data: MoneyDistribution, redis_queue_mode):
+    """redis_queue 모드에서는 배치도 분배 금액 큐에서 받아 큐와 DB 가 어긋나지 않는지 테스트"""
+    token = setup_test_data.token
+    claim_queue = ClaimQueue(redis_queue_mode)
+    await claim_queue.push_shares({token: [1000, 1000, 1000]})
+    service = ReceiveService(db_session, redis_queue_mode)
+
+    outcomes = await service.receive_money_batch(token, setup_test_data.chat_room_id, [2, 1, 3])
+
+    assert outcomes[0] == 1000
+    assert "자신이 뿌린 건은 받을 수 없습니다" in str(outcomes[1])
+    assert outcomes[2] == 1000
+    assert await claim_queue.remaining(token) == 1
+
 @pytest.mark.asyncio
 async def test_receive_money_concurrent(db_session: AsyncSession, setup_test_data: MoneyDistribution):
     """동시에 여러 사용자가 받기를 시도할 때 동시성 제어 테스트"""
@@ -0,0 +1,76 @@
+import asyncio
+import pytest
+import redis.asyncio as redis
+from unittest.mock import AsyncMock, MagicMock
+
+from src.db import redis as redis_module
+from src.utils.token.token import TokenService
+
+pytestmark = pytest.mark.asyncio
+
+@pytest.fixture(autouse=True)
+async def reset_redis_pool():
+    """테스트마다 애플리케이션 Redis 풀 초기화"""
+    await redis_module.close_redis_pool()
+    yield
+    await redis_module.close_redis_pool()
+
+async def test_redis_pool_lifecycle():
+    """startup 에서 생성한 풀을 모든 클라이언트가 공유하고, shutdown 에서 정리되는지 테스트"""
+    pool = redis_module.init_redis_pool()
+
+    assert redis_module.init_redis_pool() is pool
+    assert redis_module.get_redis_client().connection_pool is pool
+    assert TokenService()._redis.connection_pool is pool
+
+    await redis_module.close_redis_pool()
+    assert redis_module.redis_pool is None
+
+async def test_get_redis_dependency_uses_shared_pool():
+    """의존성 주입으로 받은 클라이언트가 공유 풀을 사용하는지 테스트"""
+    pool = redis_module.init_redis_pool()
+
+    async for client in redis_module.get_redis():
+        assert isinstance(client, redis.Redis)
+        assert client.connection_pool is pool
+
+async def test_redis_pool_stats():
+    """풀 사용 현황(in_use, idle, created) 조회 테스트"""
+    stats = redis_module.get_redis_pool_stats()
+    assert stats["initialized"] is False
+
+    redis_module.init_redis_pool()
+    stats = redis_module.get_redis_pool_stats()
+
+    assert stats["initialized"] is True
+    assert stats["in_use"] == 0
+    assert stats["idle"] == 0
+    assert stats["created"] == 0
+    assert stats["max_connections"] > 0
+
+async def test_redis_pool_waits_then_raises_pool_exhausted(monkeypatch):
+    """풀의 커넥션이 모두 사용 중이면 대기 후 PoolExhaustedError 가 발생하는지 테스트"""
+    pool = redis_module.init_redis_pool()
+    monkeypatch.setattr(pool, "timeout", 0.05)
+    monkeypatch.setattr(pool, "_exhausted", lambda: True)
+
+    with pytest.raises(redis_module.PoolExhaustedError):
+        await pool.get_connection("GET")
+    assert not pool._release_waiters
+
+async def test_redis_pool_release_wakes_waiter(monkeypatch):
+    """커넥션이 반환되면 대기 중인 요청이 커넥션을 가져가는지 테스트"""
+    pool = redis_module.init_redis_pool()
+    exhausted = [True]
+    connection = object()
+    monkeypatch.setattr(pool, "_exhausted", lambda: exhausted[0])
+    monkeypatch.setattr(redis.ConnectionPool, "get_connection", AsyncMock(return_value=connection))
+    monkeypatch.setattr(redis.ConnectionPool, "release", AsyncMock())
+
+    waiting = asyncio.create_task(pool.get_connection("GET"))
+    await asyncio.sleep(0.01)
+    assert not waiting.done()
+
+    exhausted[0] = False
+    await pool.release(MagicMock())
+    assert await asyncio.wait_for(waiting, timeout=1) is connection
@@ -0,0 +1,75 @@
+import asyncio
+import pytest
+from fakeredis import aioredis as fakeredis
+
+from src.utils.result_channel.result_channel import (
+    ResultChannel,
+    publish_result,
+    RESULT_SUCCESS,
+    RESULT_FAILED
+)
+
+pytestmark = pytest.mark.asyncio
+
+@pytest.fixture
+async def redis_client():
+    client = fakeredis.FakeRedis(decode_responses=True)
+    yield client
+    await client.aclose()
+
+@pytest.fixture
+async def channel(redis_client):
+    result_channel = ResultChannel(redis_client)
+    await result_channel.start()
+    yield result_channel
+    await result_channel.stop()
+
+async def test_result_delivered_to_waiting_request(channel, redis_client):
+    """워커가 발행한 결과가 task_id 로 대기 중인 요청에 전달되는지 테스트"""
+    channel.expect("task-1")
+    channel.expect("task-2")
+    await publish_result(redis_client, channel.name, "task-2", received_amount=500)
+    await publish_result(redis_client, channel.name, "task-1", received_amount=1000)
+
+    first = await channel.wait("task-1", timeout=1)
+    second = await channel.wait("task-2", timeout=1)
+    assert first["status"] == RESULT_SUCCESS
+    assert first["received_amount"] == 1000
+    assert second["received_amount"] == 500
+    assert channel.pending == 0
+
+async def test_failure_hides_unexpected_error(channel, redis_client):
+    """검증 실패는 사유를 전달하고, 그 외 오류는 사유를 감추는지 테스트"""
+    channel.expect("task-1")
+    channel.expect("task-2")
+    await publish_result(redis_client, channel.name, "task-1", error=ValueError("이미 받은 사용자입니다."))
+    await publish_result(redis_client, channel.name, "task-2", error=RuntimeError("db down"))
+
+    validation = await channel.wait("task-1", timeout=1)
+    assert validation["status"] == RESULT_FAILED
+    assert validation["validation_error"] is True
+    assert validation["error"] == "이미 받은 사용자입니다."
+
+    unexpected = await channel.wait("task-2", timeout=1)
+    assert unexpected["validation_error"] is False
+    assert unexpected["error"] == "Internal server error"
+
+async def test_wait_timeout_discards_request(channel, redis_client):
+    """시간 초과 시 TimeoutError 가 발생하고 늦게 도착한 결과는 버려지는지 테스트"""
+    channel.expect("task-1")
+    with pytest.raises(asyncio.TimeoutError):
+        await channel.wait("task-1", timeout=0.05)
+    assert channel.pending == 0
+
+    await publish_result(redis_client, channel.name, "task-1", received_amount=1000)
+    await asyncio.sleep(0.05)
+    assert channel.pending == 0
+
+async def test_stop_cancels_pending(redis_client):
+    """채널 정리 시 대기 중인 요청이 취소되는지 테스트"""
+    result_channel = ResultChannel(redis_client)
+    await result_channel.start()
+    future = result_channel.expect("task-1")
+    await result_channel.stop()
+    assert future.cancelled()
+    assert not result_channel.started
@@ -0,0 +1,60 @@
+import itertools
+
+import pytest
+
+from src.core.config import settings
+from src.utils.token.token import TOKEN_CHARSET, TOKEN_LENGTH
+from src.worker.routing import (
+    MAINTENANCE_QUEUE,
+    jump_consistent_hash,
+    receive_queue_for,
+    receive_queues,
+    token_shard
+)
+
+ALL_TOKENS = [''.join(chars) for chars in itertools.product(TOKEN_CHARSET, repeat=TOKEN_LENGTH)]
+
+def test_jump_consistent_hash_range():
+    """반환값이 항상 0 <= bucket < num_buckets"""
+    for key in range(1000):
+        assert 0 <= jump_consistent_hash(key, 7) < 7
+
+    with pytest.raises(ValueError):
+        jump_consistent_hash(1, 0)
+
+def test_token_shard_is_stable():
+    """같은 토큰은 항상 같은 샤드"""
+    assert all(token_shard(token, 8) == token_shard(token, 8) for token in ALL_TOKENS[:500])
+
+def test_token_shard_is_balanced():
+    """전체 토큰이 샤드에 고르게 분산되는지 테스트 (평균 대비 ±10%)"""
+    counts = [0] * 8
+    for token in ALL_TOKENS:
+        counts[token_shard(token, 8)] += 1
+
+    expected = len(ALL_TOKENS) / 8
+    assert all(abs(count - expected) / expected < 0.1 for count in counts)
+
+def test_adding_shard_moves_few_tokens():
+    """샤드를 하나 늘리면 약 1/N 의 토큰만 새 샤드로 이동하는지 테스트"""
+    moved = [token for token in ALL_TOKENS if token_shard(token, 8) != token_shard(token, 9)]
+
+    assert all(token_shard(token, 9) == 8 for token in moved)
+    assert len(moved) / len(ALL_TOKENS) < 0.15
+
+def test_receive_queue_for(monkeypatch):
+    """샤드 설정에 따른 큐 이름"""
+    monkeypatch.setattr(settings, "RECEIVE_QUEUE_SHARDS", 1)
+    assert receive_queue_for("ABC") == "receive_requests"
+    assert receive_queues() == ["receive_requests"]
+
+    monkeypatch.setattr(settings, "RECEIVE_QUEUE_SHARDS", 4)
+    assert receive_queue_for("ABC") == f"receive_requests.{token_shard('ABC', 4)}"
+    assert receive_queues() == [f"receive_requests.{shard}" for shard in range(4)]
+
+def test_reconcile_task_routed_to_maintenance_queue():
+    """정합성 점검 태스크는 받기 큐가 아닌 maintenance 큐로 발행"""
+    from src.worker.celery_app import celery_app
+
+    route = celery_app.amqp.router.route({}, "reconcile_distribution_summaries")
+    assert route["queue"].name == MAINTENANCE_QUEUE
@@ -0,0 +1,69 @@
+import asyncio
+import pytest
+from fakeredis import aioredis as fakeredis
+
+from src.core.config import settings
+from src.utils.spray_status_cache.spray_status_cache import SprayStatusCache, status_channel
+from src.utils.spray_status_stream.spray_status_stream import SprayStatusHub, RESYNC
+
+pytestmark = pytest.mark.asyncio
+
+@pytest.fixture
+async def redis_client():
+    client = fakeredis.FakeRedis(decode_responses=True)
+    yield client
+    await client.aclose()
+
+@pytest.fixture
+async def hub(redis_client):
+    status_hub = SprayStatusHub(redis_client)
+    await status_hub.start()
+    yield status_hub
+    await status_hub.stop()
+
+async def test_claims_fanned_out_to_token_watchers(hub, redis_client):
+    """받기 반영 시 발행된 내역이 같은 토큰의 구독자에게만 전달되는지 테스트"""
+    first = await hub.subscribe("ABC")
+    second = await hub.subscribe("ABC")
+    other = await hub.subscribe("XYZ")
+    assert (hub.watchers, hub.channels) == (3, 2)
+
+    version = await SprayStatusCache(redis_client).bump("ABC", [{"user_id": 2, "amount": 300}])
+    item = await asyncio.wait_for(first.get(), timeout=1)
+    assert item == await asyncio.wait_for(second.get(), timeout=1)  # 같은 프레임 공유
+
+    item_version, claims, frame = item
+    assert item_version == version == 1
+    assert claims == [{"user_id": 2, "amount": 300}]
+    assert frame == 'id: 1\nevent: claim\ndata: {"version":1,"claims":[{"user_id": 2, "amount": 300}]}\n\n'
+    assert other.empty()
+
+async def test_last_watcher_unsubscribes_channel(hub, redis_client):
+    """마지막 구독자가 나가면 토큰 채널 구독도 해제되는지 테스트"""
+    first = await hub.subscribe("ABC")
+    second = await hub.subscribe("ABC")
+    await hub.unsubscribe("ABC", first)
+    assert (await redis_client.pubsub_numsub(status_channel("ABC")))[0][1] == 1
+
+    await hub.unsubscribe("ABC", second)
+    assert (hub.watchers, hub.channels) == (0, 0)
+    assert (await redis_client.pubsub_numsub(status_channel("ABC")))[0][1] == 0
+
+async def test_slow_watcher_gets_resync(redis_client, monkeypatch):
+    """구독자 큐가 가득 차면 밀린 내역 대신 RESYNC 를 받는지 테스트"""
+    monkeypatch.setattr(settings, "SPRAY_STREAM_QUEUE_SIZE", 2)
+    hub = SprayStatusHub(redis_client)
+    await hub.start()
+    try:
+        queue = await hub.subscribe("ABC")
+        cache = SprayStatusCache(redis_client)
+        for user_id in range(2, 5):
+            await cache.bump("ABC", [{"user_id": user_id, "amount": 100}])
+
+        for _ in range(50):  # 세 번째 메시지 처리 대기
+            if queue.qsize() == 1:
+                break
+            await asyncio.sleep(0.02)
+        assert queue.get_nowait() is RESYNC
+    finally:
+        await hub.stop()
@@ -3,7 +3,7 @@ from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from fastapi import HTTPException
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 
 from src.db.models import (
     MoneyDistribution,
@@ -17,6 +17,10 @@ from src.db.models import (
     TransactionStatusEnum
 )
 from src.api.distribution.service.spray_service import SprayService
+from src.api.distribution.schema import BulkSprayItem
+from src.common.enums import DistributionType
+from src.core.config import settings
+from fakeredis import aioredis as fakeredis
 
 pytestmark = pytest.mark.asyncio
 
@@ -62,7 +66,11 @@ def mock_token_service():
     """TokenService 모킹"""
     with patch('src.utils.token.token.TokenService') as mock:
         instance = mock.return_value
-        instance.generate_token.return_value = "ABC"
+        instance.generate_token = AsyncMock(return_value="ABC")
+        instance.generate_tokens = AsyncMock(
+            side_effect=lambda count: [f"T{i:02d}" for i in range(count)]
+        )
+        instance.release_tokens = AsyncMock()
         yield instance
 
 async def test_create_spray_success(db_session: AsyncSession, setup_test_data: User, test_chat_room: ChatRoom, mock_token_service):
@@ -201,6 +209,49 @@ def test_distribute_amount_invalid_input():
     with pytest.raises(ValueError):
         service.distribute_amount(total_amount=2, count=3)
 
+async def test_create_spray_first_come_bonus(db_session: AsyncSession, setup_test_data: User, test_chat_room: ChatRoom, mock_token_service):
+    """선착순 보너스 분배 방식으로 뿌리기 생성 시 첫 번째 분배 내역에 보너스가 들어가는지 테스트"""
+    service = SprayService(db_session)
+    service._token_service = mock_token_service
+
+    token = await service.create_spray(
+        user_id=setup_test_data.id,
+        room_id=test_chat_room.id,
+        total_amount=3003,
+        recipient_count=3,
+        distribution_type=DistributionType.FIRST_COME_BONUS
+    )
+
+    details = await db_session.execute(
+        select(MoneyDistributionDetail)
+        .join(MoneyDistribution)
+        .where(MoneyDistribution.token == token)
+        .order_by(MoneyDistributionDetail.id)
+    )
+    amounts = [detail.allocated_amount for detail in details.scalars().all()]
+    bonus = (3003 - 3) * settings.FIRST_COME_BONUS_PERCENT // 100
+    assert sum(amounts) == 3003
+    assert amounts[0] >= bonus + 1
+    assert amounts[0] == max(amounts)
+
+async def test_create_spray_pushes_claim_queue(db_session: AsyncSession, setup_test_data: User, test_chat_room: ChatRoom, mock_token_service, monkeypatch):
+    """redis_queue 받기 모드에서 뿌리기 생성 시 분배 금액 큐가 만들어지는지 테스트"""
+    monkeypatch.setattr(settings, "RECEIVE_CLAIM_MODE", "redis_queue")
+    redis_client = fakeredis.FakeRedis(decode_responses=True)
+    service = SprayService(db_session, redis_client)
+    service._token_service = mock_token_service
+
+    token = await service.create_spray(
+        user_id=setup_test_data.id,
+        room_id=test_chat_room.id,
+        total_amount=3001,
+        recipient_count=3
+    )
+
+    shares = await redis_client.lrange(f"claim_queue:{{{token}}}", 0, -1)
+    assert sorted(int(share) for share in shares) == [1000, 1000, 1001]
+    await redis_client.aclose()
+
 async def test_create_spray_rollback(db_session: AsyncSession, setup_test_data: User, test_chat_room: ChatRoom, mock_token_service):
     """오류 발생 시 롤백이 정상적으로 동작하는지 테스트"""
     service = SprayService(db_session)
@@ -232,4 +283,76 @@ async def test_create_spray_rollback(db_session: AsyncSession, setup_test_data:
     stmt = select(UserWallet).where(UserWallet.user_id == setup_test_data.id)
     result = await db_session.execute(stmt)
     wallet = result.scalar_one()
-    assert wallet.balance == 10000  # 초기 금액 그대로 
\ No newline at end of file
+    assert wallet.balance == 10000  # 초기 금액 그대로
+
+async def test_create_sprays_chunk_failure_releases_tokens(db_session: AsyncSession, setup_test_data: User, test_chat_room: ChatRoom, mock_token_service, monkeypatch):
+    """대량 뿌리기 묶음 저장이 실패하면 발급한 토큰의 사용 처리를 취소하는지 테스트"""
+    service = SprayService(db_session)
+    service._token_service = mock_token_service
+    monkeypatch.setattr(service, "_bulk_insert_details", AsyncMock(side_effect=Exception("insert failed")))
+    user_id = setup_test_data.id
+
+    items = [
+        BulkSprayItem(room_id=test_chat_room.id, total_amount=3000, recipient_count=3),
+        BulkSprayItem(room_id=test_chat_room.id, total_amount=2000, recipient_count=2),
+    ]
+    results = await service.create_sprays(user_id=user_id, items=items)
+
+    assert [result.success for result in results] == [False, False]
+    mock_token_service.release_tokens.assert_awaited_once_with(["T00", "T01"])
+    distribution = (await db_session.execute(
+        select(MoneyDistribution).where(MoneyDistribution.creator_id == user_id)
+    )).scalar_one_or_none()
+    assert distribution is None
+
+async def test_create_sprays_bulk(db_session: AsyncSession, setup_test_data: User, test_chat_room: ChatRoom, mock_token_service):
+    """대량 뿌리기 시 항목별 결과와 저장 내역을 확인하는 테스트"""
+    service = SprayService(db_session)
+    service._token_service = mock_token_service
+
+    items = [
+        BulkSprayItem(room_id=test_chat_room.id, total_amount=3000, recipient_count=3),
+        BulkSprayItem(room_id="other_room", total_amount=1000, recipient_count=2),  # 멤버가 아닌 대화방
+        BulkSprayItem(room_id=test_chat_room.id, total_amount=5000, recipient_count=4),
+        BulkSprayItem(room_id=test_chat_room.id, total_amount=5000, recipient_count=5),  # 잔액 부족
+    ]
+
+    results = await service.create_sprays(user_id=setup_test_data.id, items=items)
+
+    # 1. 항목별 결과 확인 (요청 순서 유지)
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    assert [result.success for result in results] == [True, False, True, False]
+    assert results[1].error == "해당 대화방의 멤버가 아닙니다."
+    assert results[3].error == "잔액이 부족합니다."
+
+    # 2. 토큰은 한 번에 일괄 발급
+    mock_token_service.generate_tokens.assert_awaited_once_with(2)
+
+    # 3. 뿌리기 건 및 분배 내역 확인
+    for result, item in ((results[0], items[0]), (results[2], items[2])):
+        distribution = (await db_session.execute(
+            select(MoneyDistribution).where(MoneyDistribution.token == result.token)
+        )).scalar_one()
+        assert distribution.total_amount == item.total_amount
+        assert distribution.chat_room_id == test_chat_room.id
+
+        details = (await db_session.execute(
+            select(MoneyDistributionDetail)
+            .where(MoneyDistributionDetail.distribution_id == distribution.id)
+        )).scalars().all()
+        assert len(details) == item.recipient_count
+        assert sum(detail.allocated_amount for detail in details) == item.total_amount
+
+    # 4. 거래 내역 및 잔액 확인
+    transactions = (await db_session.execute(
+        select(TransactionHistory)
+        .where(TransactionHistory.user_id == setup_test_data.id)
+        .order_by(TransactionHistory.id)
+    )).scalars().all()
+    assert [transaction.balance_after for transaction in transactions] == [7000, 2000]
+
+    wallet = (await db_session.execute(
+        select(UserWallet).where(UserWallet.user_id == setup_test_data.id)
+    )).scalar_one()
+    await db_session.refresh(wallet)
+    assert wallet.balance == 2000  # 10000 - 3000 - 5000
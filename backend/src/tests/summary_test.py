@@ -0,0 +1,122 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import event, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import (
+    MoneyDistribution,
+    MoneyDistributionDetail,
+    ChatRoom,
+    ChatRoomMember,
+    User,
+    UserWallet
+)
+from src.api.distribution.service.receive_service import ReceiveService
+from src.api.distribution.service.summary_service import SummaryService
+from src.core.config import settings
+
+pytestmark = pytest.mark.asyncio
+
+@pytest.fixture
+async def setup_test_data(db_session: AsyncSession):
+    """뿌린 사람 1, 받을 사람 2~4, 3000원을 3명에게 (1000 / 1500 / 500)"""
+    db_session.add(ChatRoom(id="test_room", room_name="Test Room"))
+    for uid in range(1, 5):
+        db_session.add(User(id=uid, username=f"user{uid}", password="dummy", email=f"user{uid}@example.com"))
+        db_session.add(ChatRoomMember(chat_room_id="test_room", user_id=uid))
+        db_session.add(UserWallet(user_id=uid, balance=10000))
+
+    spray = MoneyDistribution(
+        token="ABC",
+        creator_id=1,
+        chat_room_id="test_room",
+        total_amount=3000,
+        recipient_count=3,
+        created_at=datetime.utcnow()
+    )
+    db_session.add(spray)
+    await db_session.flush()
+    for amount in (1000, 1500, 500):
+        db_session.add(MoneyDistributionDetail(distribution_id=spray.id, allocated_amount=amount))
+    await db_session.commit()
+    return spray
+
+async def get_summary(db_session: AsyncSession, distribution_id: int):
+    query = select(
+        MoneyDistribution.claimed_count,
+        MoneyDistribution.claimed_amount,
+        MoneyDistribution.last_claimed_at
+    ).where(MoneyDistribution.id == distribution_id)
+    return (await db_session.execute(query)).one()
+
+@pytest.mark.parametrize("claim_mode", ["db_lock", "conditional_update"])
+async def test_receive_updates_summary(db_session: AsyncSession, setup_test_data: MoneyDistribution, monkeypatch, claim_mode):
+    """받기 처리와 같은 트랜잭션에서 받기 집계가 갱신되는지 테스트"""
+    monkeypatch.setattr(settings, "RECEIVE_CLAIM_MODE", claim_mode)
+    distribution_id = setup_test_data.id
+    service = ReceiveService(db_session)
+
+    await service.receive_money("ABC", 2, "test_room")
+    await service.receive_money("ABC", 3, "test_room")
+
+    claimed_count, claimed_amount, last_claimed_at = await get_summary(db_session, distribution_id)
+    assert claimed_count == 2
+    assert claimed_amount == 2500
+    assert last_claimed_at is not None
+
+    # 실패한 받기는 집계에 반영되지 않음
+    with pytest.raises(ValueError):
+        await service.receive_money("ABC", 2, "test_room")
+    assert (await get_summary(db_session, distribution_id))[:2] == (2, 2500)
+    assert await SummaryService(db_session).find_mismatches() == []
+
+async def test_batch_receive_updates_summary(db_session: AsyncSession, setup_test_data: MoneyDistribution):
+    """배치 받기도 받기 집계를 한 번에 갱신하는지 테스트"""
+    distribution_id = setup_test_data.id
+    outcomes = await ReceiveService(db_session).receive_money_batch("ABC", "test_room", [2, 3, 2])
+
+    assert outcomes[:2] == [1000, 1500]
+    assert (await get_summary(db_session, distribution_id))[:2] == (2, 2500)
+    assert await SummaryService(db_session).find_mismatches() == []
+
+async def test_reconcile_fixes_mismatch(db_session: AsyncSession, setup_test_data: MoneyDistribution):
+    """분배 내역과 어긋난 집계를 찾아 보정하는지 테스트"""
+    distribution_id = setup_test_data.id
+    await ReceiveService(db_session).receive_money("ABC", 2, "test_room")
+
+    # 집계를 거치지 않고 분배 내역을 직접 수정한 경우
+    claimed_at = datetime.utcnow() + timedelta(seconds=1)
+    await db_session.execute(
+        update(MoneyDistributionDetail)
+        .where(MoneyDistributionDetail.distribution_id == distribution_id, MoneyDistributionDetail.allocated_amount == 500)
+        .values(receiver_id=4, claimed_at=claimed_at)
+    )
+    await db_session.commit()
+
+    service = SummaryService(db_session)
+    mismatches = await service.find_mismatches()
+    assert len(mismatches) == 1
+    assert mismatches[0]["distribution_id"] == distribution_id
+    assert (mismatches[0]["claimed_count"], mismatches[0]["actual_count"]) == (1, 2)
+
+    # 점검 기간 밖의 건은 대상이 아님
+    assert await service.find_mismatches(since=datetime.utcnow() + timedelta(days=1)) == []
+
+    await service.reconcile()
+    assert await get_summary(db_session, distribution_id) == (2, 1500, claimed_at)
+    assert await service.find_mismatches() == []
+
+async def test_find_mismatches_limits_grouping_to_since(db_session: AsyncSession, setup_test_data: MoneyDistribution):
+    """since 가 주어지면 분배 내역 집계 서브쿼리에도 생성 시각 조건이 들어가는지 테스트"""
+    statements = []
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_session.bind.sync_engine, "before_cursor_execute", _capture)
+    try:
+        await SummaryService(db_session).find_mismatches(since=datetime.utcnow() - timedelta(days=1))
+    finally:
+        event.remove(db_session.bind.sync_engine, "before_cursor_execute", _capture)
+
+    grouped = statements[-1].split("GROUP BY")[0]
+    assert "created_at >=" in grouped.split("JOIN (", 1)[1]
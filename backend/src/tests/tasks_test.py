@@ -0,0 +1,131 @@
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from celery_batches import SimpleRequest
+
+from src.api.distribution.service.receive_service import ReceiveService
+from src.worker import runtime
+from src.worker import tasks
+
+def make_request(
+    request_id: str,
+    token: str,
+    user_id: int,
+    store_result: bool = False,
+    reply_channel: Optional[str] = None
+) -> SimpleRequest:
+    kwargs = {"token": token, "user_id": user_id, "room_id": "test_room", "store_result": store_result}
+    if reply_channel:
+        kwargs["reply_channel"] = reply_channel
+    return SimpleRequest(
+        id=request_id,
+        name="process_receive_money_batch",
+        args=(),
+        kwargs=kwargs,
+        delivery_info={},
+        hostname="test",
+        ignore_result=store_result or bool(reply_channel),
+        reply_to="reply",
+        correlation_id=request_id,
+        request_dict=None
+    )
+
+@pytest.fixture
+def worker_env(monkeypatch):
+    """DB 세션 / 결과 백엔드 / 결과 저장소를 대역으로 교체"""
+    @asynccontextmanager
+    async def fake_session():
+        yield MagicMock()
+
+    monkeypatch.setattr(tasks, "get_session_maker", lambda: fake_session)
+    backend = tasks.celery_app.backend
+    monkeypatch.setattr(backend, "mark_as_done", MagicMock())
+    monkeypatch.setattr(backend, "mark_as_failure", MagicMock())
+    claim_results = MagicMock(save_success=AsyncMock(), save_failure=AsyncMock())
+    monkeypatch.setattr("src.utils.claim_result.claim_result_store.ClaimResultStore", lambda: claim_results)
+    yield backend, claim_results
+    runtime.shutdown_worker_runtime()
+
+def test_batch_groups_requests_by_token(worker_env, monkeypatch):
+    """토큰별로 묶어서 한 번씩 처리하고 요청별 결과를 전달하는지 테스트"""
+    backend, claim_results = worker_env
+    receive_money_batch = AsyncMock(side_effect=lambda token, room_id, user_ids, context: (
+        [1000, ValueError("이미 받은 사용자입니다.")] if token == "ABC" else [500]
+    ))
+    monkeypatch.setattr(ReceiveService, "receive_money_batch", lambda self, **kwargs: receive_money_batch(**kwargs))
+
+    requests = [
+        make_request("r1", "ABC", 2),
+        make_request("r2", "XYZ", 3, store_result=True),
+        make_request("r3", "ABC", 2),
+    ]
+    tasks.process_receive_money_batch.run(requests)
+
+    assert receive_money_batch.await_count == 2
+    assert receive_money_batch.await_args_list[0].kwargs["user_ids"] == [2, 2]
+    assert receive_money_batch.await_args_list[0].kwargs["context"] is None
+
+    # 동기 요청은 결과 백엔드로, 비동기 요청은 ClaimResultStore 로 전달
+    backend.mark_as_done.assert_called_once()
+    assert backend.mark_as_done.call_args.args == ("r1", {"received_amount": 1000})
+    backend.mark_as_failure.assert_called_once()
+    assert backend.mark_as_failure.call_args.args[0] == "r3"
+    claim_results.save_success.assert_awaited_once_with("r2", 500)
+
+def test_batch_publishes_to_reply_channel(worker_env, monkeypatch):
+    """결과 채널을 지정한 요청은 결과 백엔드 대신 Redis 결과 채널로 전달되는지 테스트"""
+    backend, _ = worker_env
+    receive_money_batch = AsyncMock(return_value=[1000, ValueError("이미 받은 사용자입니다.")])
+    monkeypatch.setattr(ReceiveService, "receive_money_batch", lambda self, **kwargs: receive_money_batch(**kwargs))
+    publish_result = AsyncMock()
+    monkeypatch.setattr("src.utils.result_channel.result_channel.publish_result", publish_result)
+    monkeypatch.setattr(tasks, "get_redis_client", MagicMock)
+
+    requests = [
+        make_request("r1", "ABC", 2, reply_channel="receive_result:api-1"),
+        make_request("r2", "ABC", 2, reply_channel="receive_result:api-1"),
+    ]
+    tasks.process_receive_money_batch.run(requests)
+
+    backend.mark_as_done.assert_not_called()
+    backend.mark_as_failure.assert_not_called()
+    assert publish_result.await_count == 2
+    first, second = publish_result.await_args_list
+    assert first.args[1:] == ("receive_result:api-1", "r1")
+    assert first.kwargs == {"received_amount": 1000}
+    assert isinstance(second.kwargs["error"], ValueError)
+
+def test_single_delivery_failure_keeps_success(worker_env, monkeypatch):
+    """받기가 커밋된 뒤 결과 전달이 실패해도 실패로 바뀌지 않는지 테스트"""
+    _, claim_results = worker_env
+    monkeypatch.setattr(ReceiveService, "receive_money", AsyncMock(return_value=1000))
+    claim_results.save_success.side_effect = ConnectionError("Redis unavailable")
+    publish_result = AsyncMock(side_effect=ConnectionError("Redis unavailable"))
+    monkeypatch.setattr("src.utils.result_channel.result_channel.publish_result", publish_result)
+    monkeypatch.setattr(tasks, "get_redis_client", MagicMock)
+
+    result = tasks.process_receive_money.apply(
+        kwargs={"token": "ABC", "user_id": 2, "room_id": "test_room", "store_result": True, "reply_channel": "receive_result:api-1"},
+        task_id="t1",
+        throw=True
+    )
+
+    assert result.get() == {"received_amount": 1000}
+    claim_results.save_success.assert_awaited_once_with("t1", 1000)
+    claim_results.save_failure.assert_not_awaited()
+    publish_result.assert_awaited_once()
+    assert publish_result.await_args.kwargs == {"received_amount": 1000}
+
+def test_reconcile_task_uses_lookback(worker_env, monkeypatch):
+    """집계 정합성 점검 태스크가 점검 기간 이후 생성된 건만 보정하고 보정 건수를 반환하는지 테스트"""
+    from src.api.distribution.service.summary_service import SummaryService
+
+    reconcile = AsyncMock(return_value=[{"distribution_id": 1}])
+    monkeypatch.setattr(SummaryService, "reconcile", lambda self, since: reconcile(since=since))
+
+    assert tasks.reconcile_distribution_summaries.run(lookback_days=1) == 1
+    since = reconcile.await_args.kwargs["since"]
+    assert timedelta(hours=23) < datetime.utcnow() - since < timedelta(hours=25)
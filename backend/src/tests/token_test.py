@@ -1,8 +1,22 @@
 import pytest
 import redis
 from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
-from src.utils.token.token import TokenService
+from unittest.mock import patch, MagicMock, AsyncMock
+from src.db.redis import redis_circuit_breaker, PoolExhaustedError, REDIS_UNAVAILABLE_MESSAGE
+from src.utils.token.token import (
+    TokenService,
+    TOKEN_SPACE,
+    token_validation_cache,
+    _CLAIM_TOKEN_SCRIPT,
+    _POOL_POP_SCRIPT,
+    _POOL_RECYCLE_SCRIPT,
+    _RELEASE_LOCK_SCRIPT
+)
+
+async def async_iter(items):
+    """sscan_iter mock 용 비동기 이터레이터"""
+    for item in items:
+        yield item
 
 class TestTokenService:
     @pytest.fixture
@@ -13,43 +27,79 @@ class TestTokenService:
     def redis_client(self):
         """Redis 클라이언트 mock 생성"""
         mock_redis = MagicMock()
-        mock_redis.ping.return_value = True
-        mock_redis.sismember.return_value = False
-        mock_redis.ttl.return_value = -2  # 기본적으로 만료된 토큰 가정
-        mock_redis.hgetall.return_value = {}
+        mock_redis.ping = AsyncMock(return_value=True)
+        mock_redis.sismember = AsyncMock(return_value=False)
+        mock_redis.ttl = AsyncMock(return_value=-2)  # 기본적으로 만료된 토큰 가정
+        mock_redis.hgetall = AsyncMock(return_value={})
+        mock_redis.set = AsyncMock(return_value=True)
+        mock_redis.delete = AsyncMock(return_value=1)
 
-        # Pipeline Mock 설정
+        # Pipeline Mock 설정 (async with 로 사용)
         mock_pipeline = MagicMock()
-        mock_pipeline.watch.return_value = None
+        mock_pipeline.__aenter__.return_value = mock_pipeline
+        mock_pipeline.watch = AsyncMock(return_value=None)
+        mock_pipeline.sismember = AsyncMock(return_value=False)
         mock_pipeline.multi.return_value = None
-        mock_pipeline.execute.return_value = None
+        mock_pipeline.execute = AsyncMock(return_value=None)
         mock_redis.pipeline.return_value = mock_pipeline
 
         return mock_redis
 
+    @pytest.fixture
+    def redis_scripts(self, redis_client):
+        """Lua 스크립트별 mock 생성"""
+        scripts = {
+            "claim": AsyncMock(),
+            "pool_pop": AsyncMock(),
+            "pool_recycle": AsyncMock(),
+            "release_lock": AsyncMock(return_value=1),
+        }
+        script_by_source = {
+            _CLAIM_TOKEN_SCRIPT: scripts["claim"],
+            _POOL_POP_SCRIPT: scripts["pool_pop"],
+            _POOL_RECYCLE_SCRIPT: scripts["pool_recycle"],
+            _RELEASE_LOCK_SCRIPT: scripts["release_lock"],
+        }
+        redis_client.register_script.side_effect = lambda source: script_by_source[source]
+        return scripts
+
     @pytest.fixture(autouse=True)
     def setup_redis_mock(self, monkeypatch, redis_client):
         """Redis 연결 mock"""
-        monkeypatch.setattr("redis.Redis", lambda *args, **kwargs: redis_client)
+        monkeypatch.setattr("src.utils.token.token.get_redis_client", lambda: redis_client)
 
-    def test_generate_token_format(self, token_service):
+    @pytest.fixture(autouse=True)
+    def clear_validation_cache(self):
+        """테스트마다 토큰 검증 캐시 초기화"""
+        token_validation_cache.clear()
+        yield
+        token_validation_cache.clear()
+
+    @pytest.fixture(autouse=True)
+    def reset_circuit_breaker(self):
+        """테스트마다 Redis 서킷 브레이커 초기화"""
+        redis_circuit_breaker.reset()
+        yield
+        redis_circuit_breaker.reset()
+
+    async def test_generate_token_format(self, token_service):
         """생성된 토큰이 올바른 형식(3자리 영문대문자+숫자)인지 테스트"""
-        token = token_service.generate_token()
+        token = await token_service.generate_token()
         assert len(token) == 3
         assert token.isalnum()
         assert token.isupper()
 
-    def test_token_uniqueness(self, token_service):
+    async def test_token_uniqueness(self, token_service):
         """여러 번 생성된 토큰의 중복 여부 테스트"""
         tokens = set()
         for _ in range(100):  # 100개 토큰 생성
-            token = token_service.generate_token()
+            token = await token_service.generate_token()
             tokens.add(token)
         assert len(tokens) == 100  # 모든 토큰이 유니크해야 함
 
-    def test_token_validation(self, token_service, redis_client):
+    async def test_token_validation(self, token_service, redis_client):
         """토큰 유효성 검증 테스트"""
-        token = token_service.generate_token()
+        token = await token_service.generate_token()
         token_key = f"token:{token}"
 
         # ✅ Redis에서 해당 토큰이 존재하는 상태를 모의(Mock)
@@ -59,9 +109,9 @@ class TestTokenService:
         }
         redis_client.ttl.return_value = 600  # 10분 남은 상태
 
-        assert token_service.validate_token(token) is True
+        assert await token_service.validate_token(token) is True
 
-    def test_token_expiration_and_reuse(self, token_service, redis_client):
+    async def test_token_expiration_and_reuse(self, token_service, redis_client):
         """만료된 토큰 검증 후 재사용 테스트"""
         
         # 1️⃣ 토큰 생성 및 Redis 저장
@@ -79,7 +129,7 @@ class TestTokenService:
         redis_client.hgetall.return_value = {}  # 만료된 경우 Redis에서 빈 값 반환
 
         # 3️⃣ 만료된 토큰이 유효하지 않은지 확인
-        assert token_service.validate_token(token1) is False  # ✅ 만료된 상태 확인
+        assert await token_service.validate_token(token1) is False  # ✅ 만료된 상태 확인
 
         # 4️⃣ `generate_token()`을 호출하면 만료된 토큰을 재사용해야 함
         redis_client.sismember.return_value = True  # ✅ 만료된 토큰이 존재한다고 설정
@@ -100,25 +150,254 @@ class TestTokenService:
         # 5️⃣ 재사용 확인
         assert token2 is not None
         assert token2 == token1  # ✅ 재사용 확인
-        assert token_service.validate_token(token2) is True
+        assert await token_service.validate_token(token2) is True
 
         # 6️⃣ Redis에서 재생성된 토큰 데이터 확인
-        token_data = redis_client.hgetall(token_key)
+        token_data = await redis_client.hgetall(token_key)
         assert token_data["status"] == "active"
 
 
-    def test_concurrent_token_generation(self, token_service):
+    async def test_concurrent_token_generation(self, token_service):
         """동시에 여러 토큰 생성 시 race condition 테스트"""
-        import concurrent.futures
-        
-        def generate_token():
-            return token_service.generate_token()
-        
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            tokens = list(executor.map(lambda _: generate_token(), range(10)))
+        import asyncio
+
+        tokens = await asyncio.gather(*(token_service.generate_token() for _ in range(10)))
         
         assert len(set(tokens)) == len(tokens)
 
+    async def test_generate_token_without_ping(self, token_service, redis_client):
+        """토큰 생성 시 매번 PING 하지 않는지 테스트"""
+        await token_service.generate_token()
+
+        redis_client.ping.assert_not_called()
+
+    async def test_generate_token_redis_outage_fails_fast(self, token_service, redis_client):
+        """Redis 장애가 반복되면 서킷이 열려 Redis 호출 없이 즉시 실패하는지 테스트"""
+        mock_pipeline = redis_client.pipeline.return_value
+        mock_pipeline.watch.side_effect = redis.ConnectionError("connection refused")
+
+        for _ in range(5):  # 기본 실패 임계치
+            with pytest.raises(redis.ConnectionError) as exc_info:
+                await token_service.generate_token()
+            assert str(exc_info.value) == REDIS_UNAVAILABLE_MESSAGE
+
+        calls_before = mock_pipeline.watch.await_count
+        with pytest.raises(redis.ConnectionError) as exc_info:
+            await token_service.generate_token()
+
+        assert str(exc_info.value) == REDIS_UNAVAILABLE_MESSAGE
+        assert mock_pipeline.watch.await_count == calls_before
+
+    async def test_pool_exhaustion_does_not_open_circuit(self, token_service, redis_client):
+        """커넥션 풀 대기 시간 초과(부하)는 Redis 장애로 집계되지 않는지 테스트"""
+        mock_pipeline = redis_client.pipeline.return_value
+        mock_pipeline.watch.side_effect = PoolExhaustedError("No connection available.")
+
+        for _ in range(10):
+            with pytest.raises(PoolExhaustedError):
+                await token_service.generate_token()
+
+        assert redis_circuit_breaker.stats()["consecutive_failures"] == 0
+        assert redis_circuit_breaker.allow_request() is True
+
+    async def test_redis_guard_records_success_only_on_normal_exit(self, token_service, redis_client):
+        """Redis 와 무관한 예외로 끝난 요청은 성공으로 집계되지 않는지 테스트"""
+        redis_circuit_breaker.record_failure()
+        redis_client.hgetall = AsyncMock(side_effect=redis.ResponseError("WRONGTYPE"))
+
+        with pytest.raises(redis.ResponseError):
+            await token_service.validate_token("ABC")
+        assert redis_circuit_breaker.stats()["consecutive_failures"] == 1
+
+        redis_client.hgetall = AsyncMock(return_value={})
+        assert await token_service.validate_token("ABC") is False
+        assert redis_circuit_breaker.stats()["consecutive_failures"] == 0
+
+    async def test_validate_token_uses_cache(self, token_service, redis_client):
+        """유효한 토큰은 캐시되어 재검증 시 Redis 를 조회하지 않는지 테스트"""
+        redis_client.hgetall.return_value = {
+            "created_at": datetime.now().isoformat(),
+            "status": "active"
+        }
+
+        assert await token_service.validate_token("ABC") is True
+        assert await token_service.validate_token("ABC") is True
+
+        redis_client.hgetall.assert_awaited_once()
+        assert token_validation_cache.stats()["hits"] == 1
+
+    async def test_validate_token_does_not_cache_invalid(self, token_service, redis_client):
+        """유효하지 않은 토큰은 캐시하지 않고 매번 Redis 를 조회하는지 테스트"""
+        redis_client.hgetall.return_value = {}
+
+        assert await token_service.validate_token("ABC") is False
+        assert await token_service.validate_token("ABC") is False
+
+        assert redis_client.hgetall.await_count == 2
+
+    async def test_validate_token_cache_bounded_by_token_expiry(self, token_service, redis_client):
+        """만료 직전 토큰은 실제 만료 시각까지만 캐시되는지 테스트"""
+        redis_client.hgetall.return_value = {
+            "created_at": (datetime.now() - timedelta(days=7) + timedelta(seconds=1)).isoformat(),
+            "status": "active"
+        }
+
+        assert await token_service.validate_token("ABC") is True
+
+        cached_until = token_validation_cache._entries["ABC"][1]
+        assert cached_until - token_validation_cache._clock() <= 1
+
+    async def test_generate_token_invalidates_cache(self, redis_scripts):
+        """토큰이 재발급되면 이전 검증 캐시가 제거되는지 테스트"""
+        token_validation_cache.set("8I2", True)
+        redis_scripts["pool_pop"].return_value = ["8I2"]
+
+        token_service = TokenService(use_token_pool=True)
+        assert await token_service.generate_token() == "8I2"
+
+        assert token_validation_cache.get("8I2") is None
+
+    async def test_generate_token_with_script(self, redis_client, redis_scripts):
+        """스크립트 방식은 WATCH/PING 없이 EVALSHA 한 번으로 토큰을 선점하는지 테스트"""
+        claim_script = redis_scripts["claim"]
+        claim_script.side_effect = lambda keys, args: args[4:5]  # 첫 번째 후보 선점
+
+        token_service = TokenService(use_claim_script=True, use_token_pool=False)
+        token = await token_service.generate_token()
+
+        assert token_service._token_pattern.match(token)
+        claim_script.assert_called_once()
+        assert claim_script.call_args.kwargs["keys"] == ["used_tokens"]
+        redis_client.ping.assert_not_called()
+        redis_client.pipeline.assert_not_called()
+
+    async def test_generate_token_with_script_retries_candidates(self, redis_client, redis_scripts):
+        """후보가 모두 사용 중이면 새 후보로 다시 시도하고, 끝내 실패하면 예외가 발생하는지 테스트"""
+        claim_script = redis_scripts["claim"]
+        claim_script.side_effect = [[], ["Z9Z"]]
+
+        token_service = TokenService(use_claim_script=True, use_token_pool=False)
+        assert await token_service.generate_token() == "Z9Z"
+        assert claim_script.call_count == 2
+
+        claim_script.side_effect = None
+        claim_script.return_value = []
+        with pytest.raises(redis.ResponseError):
+            await token_service.generate_token()
+
+    async def test_generate_token_from_pool(self, redis_client, redis_scripts):
+        """토큰 풀 모드에서는 스크립트 한 번으로 토큰을 꺼내는지 테스트"""
+        pop_script, recycle_script = redis_scripts["pool_pop"], redis_scripts["pool_recycle"]
+        pop_script.return_value = ["P0L"]
+
+        token_service = TokenService(use_token_pool=True)
+
+        assert await token_service.generate_token() == "P0L"
+        pop_script.assert_called_once()
+        redis_client.ping.assert_not_called()
+        redis_client.pipeline.assert_not_called()
+
+    async def test_generate_token_from_pool_recycles_expired(self, redis_client, redis_scripts):
+        """토큰 풀이 비어 있으면 만료된 토큰을 회수한 뒤 다시 꺼내는지 테스트"""
+        pop_script, recycle_script = redis_scripts["pool_pop"], redis_scripts["pool_recycle"]
+        pop_script.side_effect = [[], ["8I2"]]
+        recycle_script.return_value = 1
+        redis_client.sscan_iter.return_value = async_iter(["8I2"])
+
+        token_service = TokenService(use_token_pool=True)
+
+        assert await token_service.generate_token() == "8I2"
+        assert pop_script.call_count == 2
+        recycle_script.assert_called_once()
+        assert recycle_script.call_args.kwargs["args"][1:] == ["8I2"]
+
+    async def test_generate_token_from_pool_exhausted(self, redis_client, redis_scripts):
+        """토큰 풀이 비어 있고 회수할 토큰도 없으면 예외가 발생하는지 테스트"""
+        pop_script, recycle_script = redis_scripts["pool_pop"], redis_scripts["pool_recycle"]
+        pop_script.return_value = []
+        redis_client.sscan_iter.return_value = async_iter([])
+
+        token_service = TokenService(use_token_pool=True)
+
+        with pytest.raises(redis.ResponseError):
+            await token_service.generate_token()
+
+    async def test_generate_token_from_pool_waits_for_recycle(self, redis_client, redis_scripts):
+        """다른 프로세스가 회수 중이면 바로 실패하지 않고 회수가 끝난 뒤 다시 꺼내는지 테스트"""
+        pop_script, recycle_script = redis_scripts["pool_pop"], redis_scripts["pool_recycle"]
+        pop_script.side_effect = [[], ["8I2"]]
+        redis_client.set = AsyncMock(return_value=False)  # 락을 다른 프로세스가 보유
+        redis_client.exists = AsyncMock(side_effect=[1, 0])  # 두 번째 확인에서 락 해제
+
+        token_service = TokenService(use_token_pool=True)
+
+        assert await token_service.generate_token() == "8I2"
+        assert pop_script.call_count == 2
+        recycle_script.assert_not_called()
+        redis_scripts["release_lock"].assert_not_called()  # 잡지 않은 락은 해제하지 않음
+
+    async def test_pool_lock_released_by_owner_only(self, redis_client, redis_scripts):
+        """풀 작업 락은 획득 시 저장한 소유자 값으로만 해제하는지 테스트"""
+        redis_client.sscan_iter.return_value = async_iter([])
+        token_service = TokenService(use_token_pool=True)
+
+        await token_service.recycle_expired_tokens()
+
+        owner = redis_client.set.call_args.args[1]
+        assert redis_client.set.call_args.kwargs["nx"] is True
+        redis_scripts["release_lock"].assert_called_once_with(keys=["token_pool:lock"], args=[owner])
+        redis_client.delete.assert_not_called()
+
+    async def test_generate_tokens_with_script(self, redis_client, redis_scripts):
+        """대량 발급 시 스크립트 한 번으로 여러 토큰을 선점하는지 테스트"""
+        claim_script = redis_scripts["claim"]
+        claim_script.side_effect = lambda keys, args: args[4:4 + args[3]]  # 앞에서부터 count 개 선점
+
+        token_service = TokenService(use_claim_script=False, use_token_pool=False)
+        tokens = await token_service.generate_tokens(50)
+
+        assert len(tokens) == 50
+        assert len(set(tokens)) == 50
+        claim_script.assert_called_once()
+        redis_client.pipeline.assert_not_called()
+
+    async def test_generate_tokens_with_script_caps_candidates(self, redis_client, redis_scripts):
+        """후보 수가 토큰 공간을 넘지 않고, 발급에 실패하면 선점한 토큰을 취소하는지 테스트"""
+        claim_script = redis_scripts["claim"]
+        claim_script.side_effect = lambda keys, args: args[4:5]  # 호출마다 1개만 선점
+        pipeline = redis_client.pipeline.return_value
+
+        token_service = TokenService(use_claim_script=False, use_token_pool=False)
+        with pytest.raises(redis.ResponseError):
+            await token_service.generate_tokens(TOKEN_SPACE - 10)
+
+        assert claim_script.call_count == token_service._claim_max_attempts
+        for call in claim_script.call_args_list:
+            assert len(call.kwargs["args"]) - 4 <= TOKEN_SPACE
+        claimed = [call.kwargs["args"][4] for call in claim_script.call_args_list]
+        pipeline.srem.assert_called_once_with("used_tokens", *claimed)
+        pipeline.execute.assert_awaited_once()
+
+    async def test_generate_tokens_rejects_count_over_token_space(self, redis_client, redis_scripts):
+        """토큰 공간보다 많은 토큰은 스크립트 호출 없이 거부하는지 테스트"""
+        token_service = TokenService(use_claim_script=False, use_token_pool=False)
+
+        with pytest.raises(redis.ResponseError):
+            await token_service.generate_tokens(TOKEN_SPACE + 1)
+        redis_scripts["claim"].assert_not_called()
+
+    async def test_generate_tokens_from_pool_partial(self, redis_client, redis_scripts):
+        """토큰 풀에 남은 토큰이 부족하면 회수 후 나머지를 다시 꺼내는지 테스트"""
+        pop_script, recycle_script = redis_scripts["pool_pop"], redis_scripts["pool_recycle"]
+        pop_script.side_effect = [["AAA", "BBB"], ["CCC"]]
+        recycle_script.return_value = 1
+        redis_client.sscan_iter.return_value = async_iter(["CCC"])
+
+        token_service = TokenService(use_token_pool=True)
+
+        assert await token_service.generate_tokens(3) == ["AAA", "BBB", "CCC"]
+        assert pop_script.call_args_list[1].kwargs["args"][3] == 1  # 부족한 1개만 다시 요청
+
     @pytest.mark.parametrize("token,expected", [
         ("ABC", True), ("123", True), ("A1B", True), ("abc", False),
         ("AB!", False), ("ABCD", False), ("AB", False)
@@ -0,0 +1,52 @@
+import asyncio
+import pytest
+
+from src.db import redis as redis_db
+from src.worker import runtime
+
+@pytest.fixture
+def worker_runtime():
+    """테스트마다 워커 런타임을 새로 만들고 정리"""
+    runtime.init_worker_runtime()
+    yield runtime
+    runtime.shutdown_worker_runtime()
+
+def test_tasks_share_one_event_loop(worker_runtime):
+    """여러 태스크가 같은 이벤트 루프에서 실행되는지 테스트"""
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    first = worker_runtime.run_in_worker_loop(current_loop())
+    second = worker_runtime.run_in_worker_loop(current_loop())
+
+    assert first is second
+    assert not first.is_closed()
+
+def test_session_maker_is_reused(worker_runtime):
+    """세션 팩토리(엔진)가 프로세스 단위로 재사용되는지 테스트"""
+    assert worker_runtime.get_session_maker() is worker_runtime.get_session_maker()
+
+def test_init_is_idempotent(worker_runtime):
+    """중복 초기화 시 기존 루프 / Redis 풀 유지"""
+    session_maker = worker_runtime.get_session_maker()
+    pool = redis_db.redis_pool
+
+    worker_runtime.init_worker_runtime()
+
+    assert worker_runtime.get_session_maker() is session_maker
+    assert redis_db.redis_pool is pool
+
+def test_shutdown_closes_runtime():
+    """종료 시 이벤트 루프와 Redis 풀이 정리되는지 테스트"""
+    runtime.init_worker_runtime()
+    loop = runtime._loop
+
+    runtime.shutdown_worker_runtime()
+
+    assert loop.is_closed()
+    assert runtime._loop is None
+    assert redis_db.redis_pool is None
+
+def test_engine_echo_follows_setting(worker_runtime):
+    """워커 DB 엔진은 WORKER_DB_ECHO 설정(기본 비활성화)에 따라 SQL 로그를 출력"""
+    assert worker_runtime._engine.echo is False
@@ -0,0 +1,81 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable, Optional
+
+class LRUTTLCache:
+    """
+    크기 제한(LRU)과 만료 시간(TTL)을 함께 적용하는 프로세스 내 캐시
+
+    - maxsize 를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    - 항목별 만료 시간은 기본 TTL 과 set() 에 전달한 ttl 중 짧은 쪽을 사용
+    - hit/miss 카운터로 캐시 효과를 확인할 수 있음
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+        self._maxsize = maxsize
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시된 값을 반환하고, 없거나 만료되었으면 None 을 반환"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """값을 저장 (ttl 이 주어지면 기본 TTL 보다 먼저 만료될 수 있음)"""
+        ttl = self._ttl_seconds if ttl is None else min(ttl, self._ttl_seconds)
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (value, self._clock() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """특정 항목을 즉시 제거"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """모든 항목과 카운터 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict:
+        """캐시 사용 현황"""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self._maxsize,
+                "ttl_seconds": self._ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
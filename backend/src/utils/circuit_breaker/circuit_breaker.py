@@ -0,0 +1,88 @@
+import time
+from threading import Lock
+from typing import Callable
+
+class CircuitBreaker:
+    """
+    연속 실패 횟수 기반 서킷 브레이커
+
+    - closed: 정상 상태, 모든 요청 허용
+    - open: 연속 실패가 failure_threshold 에 도달한 상태, reset_timeout 동안 요청을 즉시 거절
+    - half_open: reset_timeout 이 지난 뒤 시험 요청 1건만 허용, 성공하면 closed / 실패하면 다시 open
+      (시험 요청이 성공/실패를 판단할 수 없이 끝나면 release_trial 로 다음 요청에 시험 기회를 넘김)
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float, clock: Callable[[], float] = time.monotonic):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_progress = False
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self._reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> bool:
+        """요청 허용 여부 (open 상태면 False)"""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self._reset_timeout:
+                self._state = self.HALF_OPEN
+                self._trial_in_progress = False
+
+            if self._state == self.HALF_OPEN and not self._trial_in_progress:
+                self._trial_in_progress = True
+                return True
+
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_progress = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self._failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._trial_in_progress = False
+
+    def release_trial(self) -> None:
+        """성공/실패 어느 쪽으로도 집계하지 않고 요청 종료 (half_open 이면 다음 요청을 시험 요청으로 허용)"""
+        with self._lock:
+            self._trial_in_progress = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._opened_at = 0.0
+            self._trial_in_progress = False
+            self.rejected = 0
+
+    def stats(self) -> dict:
+        state = self.state
+        with self._lock:
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "rejected": self.rejected,
+            }
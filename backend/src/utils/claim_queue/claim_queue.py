@@ -0,0 +1,94 @@
+from typing import Optional, Tuple
+import redis.asyncio as aioredis
+from src.core.config import settings
+from src.db.redis import get_redis_client
+
+# 받기 결과 상태
+CLAIM_OK = "ok"
+CLAIM_DUPLICATE = "duplicate"  # 이미 받은 사용자
+CLAIM_EXHAUSTED = "exhausted"  # 남은 금액 없음
+CLAIM_MISSING = "missing"  # 큐가 없는 뿌리기 건 (큐 모드 이전 생성 / 만료)
+
+# 받은 사용자 확인 + 분배 금액 pop 을 원자적으로 수행하는 스크립트
+# KEYS[1]: 분배 금액 List, KEYS[2]: 받은 사용자 Set, KEYS[3]: 큐 생성 완료 플래그
+# ARGV[1]: user_id
+_CLAIM_SCRIPT = """
+local ttl = redis.call('TTL', KEYS[3])
+if ttl < 0 then
+    return {'missing'}
+end
+if redis.call('SISMEMBER', KEYS[2], ARGV[1]) == 1 then
+    return {'duplicate'}
+end
+local amount = redis.call('LPOP', KEYS[1])
+if not amount then
+    return {'exhausted'}
+end
+redis.call('SADD', KEYS[2], ARGV[1])
+redis.call('EXPIRE', KEYS[2], ttl)
+return {'ok', amount}
+"""
+
+# DB 반영 실패 시 받기를 되돌리는 스크립트 (보상 처리)
+# KEYS[1]: 분배 금액 List, KEYS[2]: 받은 사용자 Set, KEYS[3]: 큐 생성 완료 플래그
+# ARGV[1]: user_id, ARGV[2]: 되돌릴 금액
+_RELEASE_SCRIPT = """
+if redis.call('EXISTS', KEYS[3]) == 0 then
+    return 0
+end
+if redis.call('SREM', KEYS[2], ARGV[1]) == 0 then
+    return 0
+end
+redis.call('LPUSH', KEYS[1], ARGV[2])
+redis.call('EXPIRE', KEYS[1], redis.call('TTL', KEYS[3]))
+return 1
+"""
+
+
+class ClaimQueue:
+    """
+    뿌리기 건별 분배 금액 큐
+
+    뿌리기 생성 시 분배 금액을 토큰별 Redis List 에 넣어두고, 받기 요청은 스크립트 한 번으로
+    '이미 받은 사용자인지 확인 + 금액 pop' 을 수행합니다. 같은 뿌리기 건의 받기 요청이
+    MySQL 행 락에서 줄을 서지 않도록 하기 위한 용도입니다.
+    """
+
+    def __init__(self, redis_client: Optional[aioredis.Redis] = None):
+        self._redis = redis_client or get_redis_client()  # 공유 커넥션 풀 사용
+        self._ttl_seconds = settings.CLAIM_QUEUE_TTL_SECONDS
+        self._push_batch_size = 10000  # RPUSH 1회당 금액 수
+        self._claim_script = self._redis.register_script(_CLAIM_SCRIPT)
+        self._release_script = self._redis.register_script(_RELEASE_SCRIPT)
+
+    @staticmethod
+    def _keys(token: str) -> list[str]:
+        # 같은 토큰의 키가 클러스터에서 같은 슬롯에 위치하도록 해시 태그 사용
+        return [f"claim_queue:{{{token}}}", f"claim_queue:{{{token}}}:claimed", f"claim_queue:{{{token}}}:ready"]
+
+    async def push_shares(self, shares: dict[str, list[int]]) -> None:
+        """토큰별 분배 금액을 큐에 저장 (토큰이 재사용된 경우 이전 큐는 제거)"""
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for token, amounts in shares.items():
+                queue_key, claimed_key, ready_key = self._keys(token)
+                pipe.delete(queue_key, claimed_key)
+                for start in range(0, len(amounts), self._push_batch_size):
+                    pipe.rpush(queue_key, *amounts[start:start + self._push_batch_size])
+                pipe.expire(queue_key, self._ttl_seconds)
+                pipe.set(ready_key, 1, ex=self._ttl_seconds)
+            await pipe.execute()
+
+    async def claim(self, token: str, user_id: int) -> Tuple[str, Optional[int]]:
+        """분배 금액 하나를 받음. (상태, 금액) 반환, 금액은 CLAIM_OK 인 경우에만 존재"""
+        result = await self._claim_script(keys=self._keys(token), args=[user_id])
+        if result[0] == CLAIM_OK:
+            return CLAIM_OK, int(result[1])
+        return result[0], None
+
+    async def release(self, token: str, user_id: int, amount: int) -> bool:
+        """DB 반영에 실패한 받기를 되돌림 (금액은 큐 맨 앞으로 복귀)"""
+        return bool(await self._release_script(keys=self._keys(token), args=[user_id, amount]))
+
+    async def remaining(self, token: str) -> int:
+        """큐에 남은 분배 금액 수"""
+        return await self._redis.llen(self._keys(token)[0])
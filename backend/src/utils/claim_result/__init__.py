@@ -0,0 +1 @@
+# 비어있어도 됩니다
@@ -0,0 +1,94 @@
+import asyncio
+import json
+from typing import Optional
+import redis.asyncio as aioredis
+from src.core.config import settings
+from src.db.redis import get_redis_client
+from src.utils.result_channel.result_channel import CLAIM_RESULT_CHANNEL, ResultChannel, get_result_channel
+
+# 받기 요청 처리 상태
+CLAIM_PENDING = "PENDING"
+CLAIM_SUCCESS = "SUCCESS"
+CLAIM_FAILED = "FAILED"
+
+
+class ClaimResultStore:
+    """
+    비동기 받기 요청(claim)의 처리 결과 저장소
+
+    API 는 요청을 큐에 넣으면서 PENDING 상태를 기록하고, 워커는 처리 후 결과를 기록합니다.
+    결과는 Redis Hash(receive_claim:{claim_id}) 에 RECEIVE_CLAIM_RESULT_TTL_SECONDS 동안 보관하고,
+    처리 완료 시 CLAIM_RESULT_CHANNEL 로 알려 long-poll 대기 중인 요청을 깨웁니다.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[aioredis.Redis] = None,
+        result_channel: Optional[ResultChannel] = None
+    ):
+        self._redis = redis_client or get_redis_client()  # 공유 커넥션 풀 사용
+        self._ttl_seconds = settings.RECEIVE_CLAIM_RESULT_TTL_SECONDS
+        self._result_channel = result_channel  # 없으면 프로세스 단위 결과 채널 사용
+
+    @staticmethod
+    def _key(claim_id: str) -> str:
+        return f"receive_claim:{claim_id}"
+
+    async def _save(self, claim_id: str, mapping: dict, notify: bool = False) -> None:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self._key(claim_id), mapping=mapping)
+            pipe.expire(self._key(claim_id), self._ttl_seconds)
+            if notify:
+                pipe.publish(CLAIM_RESULT_CHANNEL, json.dumps({"claim_id": claim_id, "status": mapping["status"]}))
+            await pipe.execute()
+
+    async def create(self, claim_id: str, user_id: int) -> None:
+        """요청 접수 (PENDING) 기록"""
+        await self._save(claim_id, {"status": CLAIM_PENDING, "user_id": user_id})
+
+    async def save_success(self, claim_id: str, received_amount: int) -> None:
+        """처리 성공 결과 기록"""
+        await self._save(claim_id, {"status": CLAIM_SUCCESS, "received_amount": received_amount}, notify=True)
+
+    async def save_failure(self, claim_id: str, error: str) -> None:
+        """처리 실패 결과 기록"""
+        await self._save(claim_id, {"status": CLAIM_FAILED, "error": error}, notify=True)
+
+    async def get(self, claim_id: str) -> Optional[dict]:
+        """처리 결과 조회 (없거나 만료되었으면 None)"""
+        data = await self._redis.hgetall(self._key(claim_id))
+        if not data:
+            return None
+        return {
+            "claim_id": claim_id,
+            "status": data["status"],
+            "user_id": int(data["user_id"]) if "user_id" in data else None,
+            "received_amount": int(data["received_amount"]) if "received_amount" in data else None,
+            "error": data.get("error"),
+        }
+
+    async def wait(self, claim_id: str, timeout: float) -> Optional[dict]:
+        """
+        처리가 끝날 때까지 최대 timeout 초 대기 후 결과 반환 (long-poll)
+
+        Redis 를 반복 조회하지 않고 결과 채널의 처리 완료 알림을 기다립니다.
+        알림을 놓쳐도(구독 재연결 등) 대기 시간이 끝나면 저장된 상태를 다시 조회해 반환합니다.
+        """
+        result = await self.get(claim_id)
+        if result is None or result["status"] != CLAIM_PENDING or timeout <= 0:
+            return result
+
+        channel = self._result_channel or await get_result_channel()
+        completed = channel.watch_claim(claim_id)
+        try:
+            # 대기 등록 전에 처리가 끝났을 수 있으므로 등록 후 다시 확인
+            result = await self.get(claim_id)
+            if result is None or result["status"] != CLAIM_PENDING:
+                return result
+            try:
+                await asyncio.wait_for(completed, timeout)
+            except asyncio.TimeoutError:
+                pass
+        finally:
+            channel.unwatch_claim(claim_id, completed)
+        return await self.get(claim_id)
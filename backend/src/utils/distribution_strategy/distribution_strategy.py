@@ -0,0 +1,102 @@
+import random
+from typing import Callable, Dict
+
+from src.common.enums import DistributionType
+from src.core.config import settings
+
+# (총액, 인원 수) -> 인원별 분배 금액 목록
+DistributionStrategy = Callable[[int, int], list[int]]
+
+_strategies: Dict[DistributionType, DistributionStrategy] = {}
+
+
+def register_strategy(distribution_type: DistributionType):
+    """분배 방식별 전략 함수를 등록하는 데코레이터"""
+    def decorator(func: DistributionStrategy) -> DistributionStrategy:
+        _strategies[distribution_type] = func
+        return func
+    return decorator
+
+
+def get_strategy(distribution_type: DistributionType) -> DistributionStrategy:
+    """분배 방식에 해당하는 전략 함수 조회"""
+    try:
+        return _strategies[DistributionType(distribution_type)]
+    except (KeyError, ValueError):
+        raise ValueError(f"Unsupported distribution type: {distribution_type}")
+
+
+def validate_split_input(total_amount: int, count: int) -> None:
+    """모든 전략 공통 입력 검증 (인원별 최소 1원 보장)"""
+    if count <= 0 or total_amount <= 0:
+        raise ValueError("Invalid input values")
+
+    if total_amount < count:
+        raise ValueError("Total amount must be greater than recipient count")
+
+
+def _spread_remainder(amounts: list[int], remainder: int) -> None:
+    """remainder 원을 서로 다른 인원에게 1원씩 랜덤 분배 (remainder < len(amounts))"""
+    for idx in random.sample(range(len(amounts)), remainder):
+        amounts[idx] += 1
+
+
+@register_strategy(DistributionType.EQUAL)
+def equal_split(total_amount: int, count: int) -> list[int]:
+    """
+    동일 분배: 모두 같은 금액을 받고 나누어 떨어지지 않는 잔액은 랜덤하게 1원씩 분배
+
+    잔액을 받을 인원을 비복원 균등 추출하므로 별도의 셔플이 필요 없습니다.
+    """
+    validate_split_input(total_amount, count)
+
+    base_amount, remaining = divmod(total_amount, count)
+    amounts = [base_amount] * count
+    _spread_remainder(amounts, remaining)
+    return amounts
+
+
+@register_strategy(DistributionType.RANDOM)
+def random_split(total_amount: int, count: int) -> list[int]:
+    """
+    랜덤 분배: 최소 1원을 제외한 금액을 랜덤 비율로 분배
+
+    지수분포 가중치를 정규화하면 가능한 분배 비율 전체에서 균등하게 뽑은 것과 같습니다.
+    가중치 목록을 그대로 금액 목록으로 재사용하고, 내림으로 생긴 차액(인원 수 미만)은
+    랜덤하게 1원씩 채워 합계를 정확히 맞춥니다.
+    """
+    validate_split_input(total_amount, count)
+
+    extra = total_amount - count
+    amounts = [random.expovariate(1.0) for _ in range(count)]
+    scale = extra / sum(amounts)
+
+    allocated = 0
+    for idx, weight in enumerate(amounts):
+        share = int(weight * scale)
+        amounts[idx] = 1 + share
+        allocated += share
+
+    # 부동소수점 오차로 차액이 범위를 벗어나는 극단적인 경우에도 합계는 정확히 맞춤
+    quotient, remainder = divmod(extra - allocated, count)
+    if quotient:
+        for idx in range(count):
+            amounts[idx] += quotient
+    _spread_remainder(amounts, remainder)
+    return amounts
+
+
+@register_strategy(DistributionType.FIRST_COME_BONUS)
+def first_come_bonus_split(total_amount: int, count: int) -> list[int]:
+    """
+    선착순 보너스 분배: 최소 1원을 제외한 금액의 FIRST_COME_BONUS_PERCENT 를 첫 번째 수령자에게
+    보너스로 주고 나머지는 동일 분배
+
+    받기는 분배 내역 ID 순서로 배정되므로 목록의 첫 번째 금액이 첫 수령자에게 돌아갑니다.
+    """
+    validate_split_input(total_amount, count)
+
+    bonus = (total_amount - count) * settings.FIRST_COME_BONUS_PERCENT // 100
+    amounts = equal_split(total_amount - bonus, count)
+    amounts[0] += bonus
+    return amounts
@@ -0,0 +1,236 @@
+import asyncio
+import logging
+from typing import Iterable, Optional
+import redis
+import redis.asyncio as aioredis
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+from src.core.config import settings
+from src.db.models import ChatRoomMember
+from src.db.redis import get_redis_client, redis_circuit_breaker, PoolExhaustedError
+from src.utils.cache.lru_ttl_cache import LRUTTLCache
+
+logger = logging.getLogger(__name__)
+
+# 대화방 멤버십 캐시 (프로세스 단위, room_id -> 멤버 user_id frozenset 또는 {user_id: 멤버 여부})
+# DB 에서 적재한 대화방은 전체 멤버 목록을, Redis 로 확인한 대화방은 확인한 사용자의 결과만 보관
+# 다른 프로세스의 변경은 Redis 에서만 무효화되므로 짧은 TTL 을 사용
+membership_local_cache = LRUTTLCache(
+    maxsize=settings.MEMBERSHIP_LOCAL_CACHE_SIZE,
+    ttl_seconds=settings.MEMBERSHIP_LOCAL_CACHE_TTL_SECONDS
+)
+
+# 멤버가 없는 대화방도 '적재됨' 으로 구분하기 위해 항상 넣어두는 값
+_LOADED_MARKER = "-"
+
+# 적재 도중 멤버 변경(무효화)이 있었으면 이전 멤버 목록을 저장하지 않는 스크립트
+# KEYS[1]: 멤버 Set, KEYS[2]: 버전 키
+# ARGV[1]: 조회 시점의 버전, ARGV[2]: 만료 시간(초), ARGV[3..]: 멤버
+_FILL_SCRIPT = """
+local version = redis.call('GET', KEYS[2]) or ''
+if version ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+for i = 3, #ARGV, 1000 do
+    redis.call('SADD', KEYS[1], unpack(ARGV, i, math.min(i + 999, #ARGV)))
+end
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[2]))
+return 1
+"""
+
+
+class MembershipCache:
+    """
+    대화방 멤버십 캐시
+
+    프로세스 내 LRU -> Redis Set -> DB 순서로 조회하고, 없으면 DB 조회 결과로 채웁니다.
+    Redis 에서는 멤버 목록 전체를 읽지 않고 요청한 사용자만 SISMEMBER 로 확인합니다.
+    ChatRoomMember 변경은 해당 행을 flush 한 세션의 커밋 시 자동으로 무효화되며(ORM 단위 변경만 감지),
+    벌크 UPDATE/DELETE 로 멤버를 바꾼 경우에는 invalidate() 를 직접 호출해야 합니다.
+    Redis 장애 시에는 서킷 브레이커를 통해 Redis 를 건너뛰고 DB 로 조회합니다.
+    """
+
+    def __init__(self, redis_client: Optional[aioredis.Redis] = None):
+        self._redis = redis_client or get_redis_client()  # 공유 커넥션 풀 사용
+        self._local_cache = membership_local_cache
+        self._circuit_breaker = redis_circuit_breaker
+        self._ttl_seconds = settings.MEMBERSHIP_CACHE_TTL_SECONDS
+        self._fill_script = self._redis.register_script(_FILL_SCRIPT)
+
+    @staticmethod
+    def _keys(room_id: str) -> list[str]:
+        return [f"room_members:{{{room_id}}}", f"room_members:{{{room_id}}}:version"]
+
+    async def is_member(self, db: AsyncSession, room_id: str, user_id: int) -> bool:
+        """대화방 멤버 여부"""
+        return room_id in await self.member_rooms(db, user_id, [room_id])
+
+    async def member_rooms(self, db: AsyncSession, user_id: int, room_ids: Iterable[str]) -> set[str]:
+        """room_ids 중 user_id 가 멤버인 대화방 (캐시에 없는 대화방만 Redis / DB 에서 한 번에 조회)"""
+        result = {}
+        missing = []
+        for room_id in dict.fromkeys(room_ids):
+            members = self._local_cache.get(room_id)
+            if members is not None and user_id in members:
+                # frozenset 이면 멤버 여부, dict 이면 이전에 Redis 로 확인한 결과
+                result[room_id] = True if isinstance(members, frozenset) else members[user_id]
+            elif isinstance(members, frozenset):
+                result[room_id] = False
+            else:
+                missing.append(room_id)
+
+        if missing:
+            versions = {}
+            if self._circuit_breaker.allow_request():
+                try:
+                    versions = await self._check_in_redis(missing, user_id, result)
+                    self._circuit_breaker.record_success()
+                except PoolExhaustedError as e:
+                    self._circuit_breaker.release_trial()  # 부하로 인한 대기 시간 초과는 장애로 집계하지 않음
+                    logger.warning(f"Membership cache busy, falling back to DB: {str(e)}")
+                except (redis.ConnectionError, redis.TimeoutError) as e:
+                    self._circuit_breaker.record_failure()
+                    logger.warning(f"Membership cache unavailable, falling back to DB: {str(e)}")
+                except redis.RedisError as e:
+                    self._circuit_breaker.record_success()  # Redis 는 응답함
+                    logger.warning(f"Membership cache error, falling back to DB: {str(e)}")
+                except BaseException:
+                    self._circuit_breaker.release_trial()
+                    raise
+                missing = [room_id for room_id in missing if room_id not in result]
+
+            if missing:
+                loaded = await self._load_from_db(db, missing)
+                for room_id, members in loaded.items():
+                    result[room_id] = user_id in members
+                    self._local_cache.set(room_id, members)
+                if versions:
+                    await self._fill_redis(loaded, versions)
+
+        return {room_id for room_id, is_member in result.items() if is_member}
+
+    async def _check_in_redis(self, room_ids: list[str], user_id: int, result: dict) -> dict[str, str]:
+        """
+        Redis 에 적재된 대화방의 멤버 여부를 result 에 채우고, 적재되지 않은 대화방의 현재 버전 반환
+
+        대화방마다 적재 표시 / 사용자 SISMEMBER 와 버전 조회를 한 번의 round trip 으로 보냅니다.
+        """
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for room_id in room_ids:
+                members_key, version_key = self._keys(room_id)
+                pipe.sismember(members_key, _LOADED_MARKER)
+                pipe.sismember(members_key, user_id)
+                pipe.get(version_key)
+            replies = await pipe.execute()
+
+        versions = {}
+        for index, room_id in enumerate(room_ids):
+            loaded, is_member, version = replies[index * 3:index * 3 + 3]
+            if loaded:
+                result[room_id] = bool(is_member)
+                self._remember(room_id, user_id, result[room_id])
+            else:
+                versions[room_id] = version or ""
+        return versions
+
+    def _remember(self, room_id: str, user_id: int, is_member: bool) -> None:
+        """Redis 로 확인한 사용자별 멤버 여부를 프로세스 캐시에 보관"""
+        members = self._local_cache.get(room_id)
+        if isinstance(members, dict):
+            members[user_id] = is_member
+        elif members is None:
+            self._local_cache.set(room_id, {user_id: is_member})
+
+    @staticmethod
+    async def _load_from_db(db: AsyncSession, room_ids: list[str]) -> dict[str, frozenset]:
+        query = select(ChatRoomMember.chat_room_id, ChatRoomMember.user_id).where(
+            ChatRoomMember.chat_room_id.in_(room_ids)
+        )
+        members = {room_id: set() for room_id in room_ids}
+        for room_id, user_id in (await db.execute(query)).all():
+            members[room_id].add(user_id)
+        return {room_id: frozenset(user_ids) for room_id, user_ids in members.items()}
+
+    async def _fill_redis(self, loaded: dict[str, frozenset], versions: dict[str, str]) -> None:
+        """DB 조회 결과를 Redis 에 저장 (실패해도 조회 결과에는 영향 없음)"""
+        try:
+            for room_id, members in loaded.items():
+                await self._fill_script(
+                    keys=self._keys(room_id),
+                    args=[versions.get(room_id, ""), self._ttl_seconds, _LOADED_MARKER, *members]
+                )
+        except redis.RedisError as e:
+            logger.warning(f"Failed to fill membership cache: {str(e)}")
+
+    async def invalidate(self, room_ids: Iterable[str]) -> None:
+        """대화방 멤버 캐시 무효화 (적재 중인 이전 멤버 목록도 저장되지 않도록 버전 증가)"""
+        room_ids = list(room_ids)
+        for room_id in room_ids:
+            self._local_cache.invalidate(room_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for room_id in room_ids:
+                members_key, version_key = self._keys(room_id)
+                pipe.delete(members_key)
+                pipe.incr(version_key)
+                pipe.expire(version_key, self._ttl_seconds * 2)
+            await pipe.execute()
+        # Redis 무효화 전에 같은 프로세스에서 다시 채워진 항목 제거
+        for room_id in room_ids:
+            self._local_cache.invalidate(room_id)
+
+
+# -----------------------------------------------------------------
+# ChatRoomMember 변경 시 자동 무효화
+# -----------------------------------------------------------------
+# 모든 세션에 훅을 거는 대신 ChatRoomMember 행을 flush 할 때만 해당 세션에 커밋/롤백 훅을 등록
+_CHANGED_ROOMS_KEY = "membership_changed_rooms"
+_HOOKED_KEY = "membership_hooks_registered"
+_pending_invalidations: set[asyncio.Task] = set()
+
+
+@event.listens_for(ChatRoomMember, "after_insert")
+@event.listens_for(ChatRoomMember, "after_update")
+@event.listens_for(ChatRoomMember, "after_delete")
+def _collect_changed_room(mapper, connection, target: ChatRoomMember) -> None:
+    session = object_session(target)
+    if session is None:
+        return
+    if not session.info.get(_HOOKED_KEY):
+        # 세션 인스턴스에만 등록되므로 세션이 정리되면 함께 사라짐
+        session.info[_HOOKED_KEY] = True
+        event.listen(session, "after_commit", _invalidate_changed_rooms)
+        event.listen(session, "after_rollback", _discard_changed_rooms)
+    rooms = session.info.setdefault(_CHANGED_ROOMS_KEY, set())
+    rooms.add(target.chat_room_id)
+    # 다른 대화방으로 옮겨진 경우 이전 대화방도 무효화
+    rooms.update(room_id for room_id in inspect(target).attrs.chat_room_id.history.deleted if room_id)
+
+
+def _discard_changed_rooms(session: Session) -> None:
+    session.info.pop(_CHANGED_ROOMS_KEY, None)
+
+
+def _invalidate_changed_rooms(session: Session) -> None:
+    rooms = session.info.pop(_CHANGED_ROOMS_KEY, None)
+    if not rooms:
+        return
+    for room_id in rooms:
+        membership_local_cache.invalidate(room_id)
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # 이벤트 루프 밖(동기 세션)에서는 Redis 항목이 TTL 로 만료될 때까지 유지됨
+        logger.warning(f"Membership changed outside event loop, Redis cache not invalidated: {rooms}")
+        return
+    task = loop.create_task(_invalidate_rooms(rooms))
+    _pending_invalidations.add(task)
+    task.add_done_callback(_pending_invalidations.discard)
+
+
+async def _invalidate_rooms(room_ids: set[str]) -> None:
+    try:
+        await MembershipCache().invalidate(room_ids)
+    except redis.RedisError as e:
+        logger.error(f"Failed to invalidate membership cache for {room_ids}: {str(e)}")
@@ -0,0 +1,167 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+# 받기 처리 경로
+PATH_INLINE = "inline"  # API 프로세스에서 요청 세션으로 바로 처리
+PATH_CELERY = "celery"  # Celery 워커에 위임
+
+
+class ReceiveDispatcher:
+    """
+    받기 요청 처리 경로(inline / celery) 선택기
+
+    - 같은 토큰으로 이 프로세스에서 처리 중인 inline 받기 수가 max_in_flight 미만이고
+    - 토큰이 배정되는 Celery 받기 큐에 쌓인 메시지 수가 max_queue_depth 미만이면 inline 으로 처리합니다.
+    큐 깊이는 브로커 조회 비용을 줄이기 위해 큐별로 depth_ttl 초 동안 캐시합니다.
+    경로별 처리 건수/성공 여부/지연 시간을 집계합니다.
+
+    serialize_queues=True (샤드 큐마다 단일 워커가 토큰별 받기를 순서대로 처리하는 경우)이면
+    inline 처리가 샤드의 순서를 앞지르지 않도록, 이 프로세스에서 같은 큐로 처리 중인 요청
+    (inline / celery 모두)이 없고 큐가 비어 있을 때만 inline 으로 처리합니다.
+    다른 API 프로세스의 inline 요청과 워커가 이미 가져간 메시지는 보이지 않으므로
+    프로세스 간 순서는 보장하지 않습니다 (받기 정합성은 DB 락 / 조건부 UPDATE 로 보장).
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        max_queue_depth: int,
+        depth_ttl: float,
+        depth_probe: Callable[[str], int],
+        queue_for: Callable[[str], str],
+        serialize_queues: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+        latency_window: int = 1000
+    ):
+        self._max_in_flight = max_in_flight
+        self._max_queue_depth = max_queue_depth
+        self._depth_ttl = depth_ttl
+        self._depth_probe = depth_probe
+        self._queue_for = queue_for
+        self._serialize_queues = serialize_queues
+        self._clock = clock
+        self._in_flight: dict[str, int] = {}  # 토큰 -> inline 처리 중 요청 수
+        self._queue_in_flight: dict[str, int] = {}  # 큐 이름 -> 처리 중 요청 수 (inline / celery)
+        self._queue_depths: dict[str, tuple[int, float]] = {}  # 큐 이름 -> (깊이, 확인 시각)
+        self._depth_lock = asyncio.Lock()
+        self._latency_window = latency_window
+        self._metrics = {path: self._empty_metrics() for path in (PATH_INLINE, PATH_CELERY)}
+
+    def _empty_metrics(self) -> dict:
+        return {"requests": 0, "failures": 0, "latencies": deque(maxlen=self._latency_window)}
+
+    def in_flight(self, token: str) -> int:
+        return self._in_flight.get(token, 0)
+
+    def queue_in_flight(self, queue_name: str) -> int:
+        return self._queue_in_flight.get(queue_name, 0)
+
+    @contextmanager
+    def track(self, token: str):
+        """inline 으로 처리 중인 받기 요청 수 집계"""
+        with self._count(self._in_flight, token), self._count(self._queue_in_flight, self._queue_for(token)):
+            yield
+
+    @contextmanager
+    def track_dispatch(self, token: str):
+        """Celery 로 위임해 결과를 기다리는 받기 요청 수 집계 (큐 단위)"""
+        with self._count(self._queue_in_flight, self._queue_for(token)):
+            yield
+
+    @staticmethod
+    @contextmanager
+    def _count(counts: dict[str, int], key: str):
+        counts[key] = counts.get(key, 0) + 1
+        try:
+            yield
+        finally:
+            remaining = counts[key] - 1
+            if remaining:
+                counts[key] = remaining
+            else:
+                del counts[key]
+
+    async def queue_depth(self, queue_name: str) -> int:
+        """Celery 받기 큐 깊이 (depth_ttl 동안 캐시, 조회 실패 시 마지막 값 유지)"""
+        async with self._depth_lock:
+            now = self._clock()
+            depth, checked_at = self._queue_depths.get(queue_name, (0, None))
+            if checked_at is None or now - checked_at >= self._depth_ttl:
+                try:
+                    loop = asyncio.get_running_loop()
+                    depth = await loop.run_in_executor(None, self._depth_probe, queue_name)
+                except Exception as e:
+                    logger.warning(f"Failed to check receive queue depth ({queue_name}): {e}")
+                self._queue_depths[queue_name] = (depth, now)
+            return depth
+
+    async def choose_path(self, token: str) -> str:
+        """
+        토큰별 처리 중 요청 수와 토큰이 배정되는 큐의 깊이로 처리 경로 선택
+
+        inline 으로 결정되면 호출자는 await 없이 바로 track() 으로 처리 중 요청에 등록해야 합니다.
+        """
+        queue_name = self._queue_for(token)
+        if self._serialize_queues:
+            if self.queue_in_flight(queue_name):
+                return PATH_CELERY
+            depth = await self.queue_depth(queue_name)
+            # 큐 깊이를 확인하는 동안 같은 큐로 들어온 요청이 있으면 그 뒤에 줄을 섬
+            if depth or self.queue_in_flight(queue_name):
+                return PATH_CELERY
+            return PATH_INLINE
+
+        if self.in_flight(token) >= self._max_in_flight:
+            return PATH_CELERY
+        if await self.queue_depth(queue_name) >= self._max_queue_depth:
+            return PATH_CELERY
+        # 큐 깊이를 확인하는 동안 같은 토큰의 요청이 inline 으로 들어왔으면 상한을 다시 확인
+        if self.in_flight(token) >= self._max_in_flight:
+            return PATH_CELERY
+        return PATH_INLINE
+
+    def record(self, path: str, latency_seconds: float, success: bool) -> None:
+        """경로별 처리 결과 집계"""
+        metrics = self._metrics[path]
+        metrics["requests"] += 1
+        if not success:
+            metrics["failures"] += 1
+        metrics["latencies"].append(latency_seconds)
+
+    def stats(self) -> dict:
+        result = {
+            "in_flight_tokens": len(self._in_flight),
+            "in_flight_queues": dict(self._queue_in_flight),
+            "queue_depths": {queue_name: depth for queue_name, (depth, _) in self._queue_depths.items()},
+        }
+        for path, metrics in self._metrics.items():
+            latencies = sorted(metrics["latencies"])
+            result[path] = {
+                "requests": metrics["requests"],
+                "failures": metrics["failures"],
+                "latency_ms": {
+                    "p50": self._percentile(latencies, 50),
+                    "p95": self._percentile(latencies, 95),
+                    "max": round(latencies[-1] * 1000, 2) if latencies else None,
+                },
+            }
+        return result
+
+    @staticmethod
+    def _percentile(sorted_values: list[float], percent: int):
+        if not sorted_values:
+            return None
+        index = min(len(sorted_values) - 1, int(len(sorted_values) * percent / 100))
+        return round(sorted_values[index] * 1000, 2)
+
+    def reset(self) -> None:
+        self._in_flight.clear()
+        self._queue_in_flight.clear()
+        self._queue_depths.clear()
+        self._metrics = {path: self._empty_metrics() for path in (PATH_INLINE, PATH_CELERY)}
@@ -0,0 +1,201 @@
+import asyncio
+import json
+import logging
+import os
+from typing import Optional
+from uuid import uuid4
+import redis.asyncio as aioredis
+from redis.exceptions import ConnectionError, TimeoutError as RedisTimeoutError
+from src.db.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# 결과 상태
+RESULT_SUCCESS = "SUCCESS"
+RESULT_FAILED = "FAILED"
+
+# 비동기 받기 요청(claim) 처리 완료 알림 채널 (모든 API 프로세스가 구독)
+# 상태를 조회하는 프로세스가 요청을 접수한 프로세스와 다를 수 있으므로 프로세스별 채널 대신 공용 채널 사용
+CLAIM_RESULT_CHANNEL = "receive_claim_result"
+
+
+async def publish_result(
+    redis_client: aioredis.Redis,
+    reply_channel: str,
+    task_id: str,
+    received_amount: Optional[int] = None,
+    error: Optional[Exception] = None
+) -> None:
+    """
+    워커에서 처리 결과를 요청한 API 프로세스의 채널로 발행
+
+    검증 실패(ValueError)만 사유를 그대로 전달하고, 그 외 오류는 사유를 감춥니다.
+    """
+    if error is None:
+        message = {"task_id": task_id, "status": RESULT_SUCCESS, "received_amount": received_amount}
+    else:
+        message = {
+            "task_id": task_id,
+            "status": RESULT_FAILED,
+            "error": str(error) if isinstance(error, ValueError) else "Internal server error",
+            "validation_error": isinstance(error, ValueError)
+        }
+    await redis_client.publish(reply_channel, json.dumps(message))
+
+
+class ResultChannel:
+    """
+    프로세스 단위 Redis pub/sub 결과 수신 채널
+
+    API 프로세스마다 고유 채널 하나를 구독하고, 태스크 발행 시 이 채널 이름을 함께 넘기면
+    워커가 처리 결과를 이 채널로 발행합니다. 수신 루프 하나가 메시지를 task_id 별 Future 로
+    나눠주므로 요청마다 구독 커넥션이나 대기 스레드를 점유하지 않습니다.
+    pub/sub 은 구독 전에 발행된 메시지를 보관하지 않으므로 반드시 expect() 로 먼저 등록한 뒤
+    태스크를 발행해야 합니다.
+
+    공용 CLAIM_RESULT_CHANNEL 도 함께 구독해, 비동기 받기 요청의 처리 완료를 claim_id 로
+    기다리는 요청(watch)에 알립니다.
+    """
+
+    def __init__(self, redis_client: Optional[aioredis.Redis] = None):
+        self._redis = redis_client or get_redis_client()  # 공유 커넥션 풀 사용
+        self.name = f"receive_result:{os.getpid()}:{uuid4().hex}"
+        self._pending: dict[str, asyncio.Future] = {}
+        self._claim_watchers: dict[str, set[asyncio.Future]] = {}  # claim_id -> 완료 대기 Future
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+        self._reconnect_delay = 0.5  # 구독 커넥션이 끊어졌을 때 재연결 대기 시간(초)
+
+    @property
+    def started(self) -> bool:
+        return self._reader is not None and not self._reader.done()
+
+    async def start(self) -> None:
+        """채널 구독 및 수신 루프 시작 (구독이 완료된 뒤 반환)"""
+        if self.started:
+            return
+        self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.subscribe(self.name, CLAIM_RESULT_CHANNEL)
+        self._reader = asyncio.create_task(self._read_loop())
+
+    async def stop(self) -> None:
+        """수신 루프 중지 및 대기 중인 요청 취소"""
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+            self._reader = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        for future in self._pending.values():
+            if not future.done():
+                future.cancel()
+        self._pending.clear()
+        for futures in self._claim_watchers.values():
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+        self._claim_watchers.clear()
+
+    def expect(self, task_id: str) -> asyncio.Future:
+        """결과를 기다릴 태스크 등록 (태스크 발행 전에 호출)"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending[task_id] = future
+        return future
+
+    def discard(self, task_id: str) -> None:
+        """등록한 태스크 대기 취소 (발행 실패 등)"""
+        future = self._pending.pop(task_id, None)
+        if future is not None and not future.done():
+            future.cancel()
+
+    async def wait(self, task_id: str, timeout: float) -> dict:
+        """등록한 태스크의 결과 대기 (시간 초과 시 TimeoutError)"""
+        future = self._pending.get(task_id)
+        if future is None:
+            raise KeyError(task_id)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(task_id, None)
+
+    def watch_claim(self, claim_id: str) -> asyncio.Future:
+        """비동기 받기 요청의 처리 완료 알림 대기 등록 (같은 claim 을 여러 요청이 기다릴 수 있음)"""
+        future = asyncio.get_running_loop().create_future()
+        self._claim_watchers.setdefault(claim_id, set()).add(future)
+        return future
+
+    def unwatch_claim(self, claim_id: str, future: asyncio.Future) -> None:
+        """처리 완료 알림 대기 해제"""
+        futures = self._claim_watchers.get(claim_id)
+        if futures is None:
+            return
+        futures.discard(future)
+        if not futures:
+            del self._claim_watchers[claim_id]
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def _deliver(self, data: str) -> None:
+        try:
+            message = json.loads(data)
+        except ValueError:
+            logger.warning(f"Malformed result message on {self.name}: {data!r}")
+            return
+        if "claim_id" in message:
+            for future in self._claim_watchers.get(message["claim_id"], ()):
+                if not future.done():
+                    future.set_result(message)
+            return
+        future = self._pending.get(message.get("task_id"))
+        # 이미 시간 초과된 요청의 결과는 버림
+        if future is not None and not future.done():
+            future.set_result(message)
+
+    async def _read_loop(self) -> None:
+        while True:
+            try:
+                message = await self._pubsub.get_message(timeout=1.0)
+                if message is not None and message["type"] == "message":
+                    self._deliver(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except (ConnectionError, RedisTimeoutError) as e:
+                # 재연결 시 redis-py 가 구독 채널을 다시 등록함
+                logger.error(f"Result channel connection lost: {str(e)}")
+                await asyncio.sleep(self._reconnect_delay)
+            except Exception as e:
+                logger.error(f"Result channel reader error: {str(e)}", exc_info=True)
+                await asyncio.sleep(self._reconnect_delay)
+
+
+# 프로세스 단위 결과 채널 (최초 사용 시 구독 시작, shutdown 에서 정리)
+_result_channel: Optional[ResultChannel] = None
+_start_lock: Optional[asyncio.Lock] = None
+
+
+async def get_result_channel() -> ResultChannel:
+    global _result_channel, _start_lock
+    if _result_channel is not None and _result_channel.started:
+        return _result_channel
+    if _start_lock is None:
+        _start_lock = asyncio.Lock()
+    async with _start_lock:
+        if _result_channel is None:
+            _result_channel = ResultChannel()
+        if not _result_channel.started:
+            await _result_channel.start()
+    return _result_channel
+
+
+async def close_result_channel() -> None:
+    global _result_channel, _start_lock
+    if _result_channel is not None:
+        await _result_channel.stop()
+        _result_channel = None
+    _start_lock = None
@@ -0,0 +1,97 @@
+import json
+from typing import Optional, Tuple
+import redis.asyncio as aioredis
+from src.core.config import settings
+from src.db.redis import get_redis_client
+
+# 캐시를 채우는 동안 받기가 반영(버전 증가)되었으면 이전 응답을 저장하지 않는 스크립트
+# KEYS[1]: 응답 Hash, KEYS[2]: 버전 키
+# ARGV[1]: 조회 시점의 버전, ARGV[2]: 만료 시간(초), ARGV[3]: 뿌린 사용자 ID, ARGV[4]: 뿌린 시각, ARGV[5]: 응답 본문
+_FILL_SCRIPT = """
+local version = redis.call('GET', KEYS[2]) or '0'
+if version ~= ARGV[1] then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'version', version, 'creator_id', ARGV[3], 'created_at', ARGV[4], 'body', ARGV[5])
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[2]))
+return 1
+"""
+
+# 받기 반영 시 버전 증가 + 증가된 버전과 받기 내역(delta)을 토큰별 채널로 발행하는 스크립트
+# KEYS[1]: 버전 키
+# ARGV[1]: 버전 유지 시간(초), ARGV[2]: 채널, ARGV[3]: 받기 내역 JSON 배열
+_BUMP_SCRIPT = """
+local version = redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[1]))
+redis.call('PUBLISH', ARGV[2], '{"version":' .. version .. ',"claims":' .. ARGV[3] .. '}')
+return version
+"""
+
+
+def status_channel(token: str) -> str:
+    """받기 반영 내역이 발행되는 토큰별 채널"""
+    return f"spray_status:{{{token}}}:events"
+
+
+class SprayStatusCache:
+    """
+    뿌리기 상태 조회 응답 캐시 (토큰별)
+
+    받기가 반영될 때마다 토큰별 버전을 증가시키고, 캐시된 응답은 저장 당시 버전이
+    현재 버전과 같을 때만 사용합니다. 버전은 ETag 로도 사용되어 변경이 없으면
+    DB 조회 없이 304 를 응답할 수 있습니다. 버전 증가와 함께 받기 내역을 토큰별 채널로
+    발행하여 상태 스트림(SSE)에 전달합니다.
+    """
+
+    def __init__(self, redis_client: Optional[aioredis.Redis] = None):
+        self._redis = redis_client or get_redis_client()  # 공유 커넥션 풀 사용
+        self._ttl_seconds = settings.SPRAY_STATUS_CACHE_TTL_SECONDS
+        self._version_ttl_seconds = 7 * 24 * 60 * 60  # 조회 가능 기간 동안 유지
+        self._fill_script = self._redis.register_script(_FILL_SCRIPT)
+        self._bump_script = self._redis.register_script(_BUMP_SCRIPT)
+
+    @staticmethod
+    def _keys(token: str) -> list[str]:
+        return [f"spray_status:{{{token}}}", f"spray_status:{{{token}}}:version"]
+
+    @staticmethod
+    def etag(token: str, version: str) -> str:
+        return f'"{token}-{version}"'
+
+    async def get(self, token: str) -> Tuple[str, Optional[dict]]:
+        """(현재 버전, 현재 버전의 캐시 항목) 반환 - 캐시가 없거나 이전 버전이면 항목은 None"""
+        cache_key, version_key = self._keys(token)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.get(version_key)
+            pipe.hgetall(cache_key)
+            version, entry = await pipe.execute()
+
+        version = version or "0"
+        if not entry or entry.get("version") != version:
+            return version, None
+        return version, entry
+
+    async def set(self, token: str, version: str, creator_id: int, created_at: str, body: str, ttl: Optional[int] = None) -> bool:
+        """조회 시점 버전의 응답 저장 (그 사이 버전이 바뀌었으면 저장하지 않고 False)"""
+        ttl = self._ttl_seconds if ttl is None else min(ttl, self._ttl_seconds)
+        if ttl <= 0:
+            return False
+        return bool(await self._fill_script(
+            keys=self._keys(token),
+            args=[version, ttl, creator_id, created_at, body]
+        ))
+
+    async def bump(self, token: str, claims: list[dict]) -> int:
+        """
+        받기 반영 후 버전 증가 및 받기 내역 발행 (이전 버전으로 캐시된 응답과 ETag 무효화)
+
+        Args:
+            claims: 이번에 반영된 받기 내역 [{"user_id": int, "amount": int}, ...]
+
+        Returns:
+            int: 증가된 버전
+        """
+        return await self._bump_script(
+            keys=[self._keys(token)[1]],
+            args=[self._version_ttl_seconds, status_channel(token), json.dumps(claims)]
+        )
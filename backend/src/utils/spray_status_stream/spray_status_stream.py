@@ -0,0 +1,202 @@
+import asyncio
+import json
+import logging
+import os
+from typing import Optional
+from uuid import uuid4
+import redis.asyncio as aioredis
+from redis.exceptions import ConnectionError, TimeoutError as RedisTimeoutError
+from src.core.config import settings
+from src.db.redis import get_redis_client
+from src.utils.spray_status_cache.spray_status_cache import status_channel
+
+logger = logging.getLogger(__name__)
+
+# 구독자가 밀린 내역을 잃었으므로 전체 상태를 다시 조회해야 함을 알리는 항목
+RESYNC = object()
+
+
+def sse_event(event: str, data: str, event_id: Optional[int] = None) -> str:
+    """SSE 이벤트 프레임 (data 는 줄바꿈 없는 한 줄 JSON)"""
+    frame = f"event: {event}\ndata: {data}\n\n"
+    if event_id is not None:
+        frame = f"id: {event_id}\n{frame}"
+    return frame
+
+
+class SprayStatusHub:
+    """
+    프로세스 단위 뿌리기 상태 스트림 구독 허브
+
+    받기 처리 경로가 토큰별 채널로 발행한 받기 내역을 구독 커넥션 하나로 받아
+    같은 토큰을 보고 있는 스트림 구독자들의 큐로 나눠줍니다. 토큰 채널은 첫 구독자가 생길 때
+    SUBSCRIBE, 마지막 구독자가 나갈 때 UNSUBSCRIBE 하므로 구독자 수와 관계없이
+    Redis 커넥션은 프로세스당 하나입니다. SSE 프레임은 메시지당 한 번만 만들어 공유합니다.
+
+    구독자 큐가 가득 차면(느린 클라이언트) 밀린 내역을 버리고 RESYNC 를 넣으며,
+    구독 커넥션이 끊겼다가 복구된 경우에도 모든 구독자에게 RESYNC 를 보냅니다.
+    """
+
+    def __init__(self, redis_client: Optional[aioredis.Redis] = None):
+        self._redis = redis_client or get_redis_client()  # 공유 커넥션 풀 사용
+        # 구독 토큰이 없을 때도 수신 루프가 동작하도록 프로세스 고유 채널을 항상 구독
+        self._control_channel = f"spray_status_hub:{os.getpid()}:{uuid4().hex}"
+        self._queue_size = settings.SPRAY_STREAM_QUEUE_SIZE
+        self._watchers: dict[str, set[asyncio.Queue]] = {}  # 채널별 구독자 큐
+        self._subscribe_lock = asyncio.Lock()
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+        self._reconnect_delay = 0.5  # 구독 커넥션이 끊어졌을 때 재연결 대기 시간(초)
+        self._connection_lost = False
+        self._running = False
+
+    @property
+    def started(self) -> bool:
+        return self._reader is not None and not self._reader.done()
+
+    @property
+    def watchers(self) -> int:
+        return sum(len(queues) for queues in self._watchers.values())
+
+    @property
+    def channels(self) -> int:
+        return len(self._watchers)
+
+    async def start(self) -> None:
+        """구독 커넥션 생성 및 수신 루프 시작"""
+        if self.started:
+            return
+        self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.subscribe(self._control_channel)
+        self._running = True
+        self._reader = asyncio.create_task(self._read_loop())
+
+    async def stop(self) -> None:
+        """수신 루프 중지 및 구독 해제 (남은 구독자 큐에는 더 이상 전달되지 않음)"""
+        # 취소가 수신 대기 완료와 겹쳐 무시되더라도 다음 수신 대기(최대 1초) 후 종료되도록 플래그도 해제
+        self._running = False
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+            self._reader = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        self._watchers.clear()
+
+    async def subscribe(self, token: str) -> asyncio.Queue:
+        """
+        토큰의 받기 내역 구독 (구독이 완료된 뒤 반환)
+
+        큐에는 (버전, 받기 내역, SSE 프레임) 또는 RESYNC 가 들어옵니다. 사용이 끝나면 반드시
+        unsubscribe() 를 호출해야 합니다.
+        """
+        channel = status_channel(token)
+        queue = asyncio.Queue(maxsize=self._queue_size)
+        async with self._subscribe_lock:
+            queues = self._watchers.get(channel)
+            if queues is None:
+                await self._pubsub.subscribe(channel)
+                queues = self._watchers[channel] = set()
+            queues.add(queue)
+        return queue
+
+    async def unsubscribe(self, token: str, queue: asyncio.Queue) -> None:
+        """토큰 구독 해제 (마지막 구독자면 채널 구독도 해제)"""
+        channel = status_channel(token)
+        async with self._subscribe_lock:
+            queues = self._watchers.get(channel)
+            if queues is None:
+                return
+            queues.discard(queue)
+            if queues:
+                return
+            del self._watchers[channel]
+            if self._pubsub is None:
+                return
+            try:
+                await self._pubsub.unsubscribe(channel)
+            except (ConnectionError, RedisTimeoutError) as e:
+                # 재연결 시에는 남아 있는 구독 채널만 다시 등록되므로 무시
+                logger.warning(f"Failed to unsubscribe {channel}: {str(e)}")
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, item) -> None:
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            # 느린 구독자: 밀린 내역을 버리고 전체 상태를 다시 조회하도록 알림
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(RESYNC)
+
+    def _resync_all(self) -> None:
+        for queues in self._watchers.values():
+            for queue in queues:
+                self._offer(queue, RESYNC)
+
+    def _deliver(self, channel: str, data: str) -> None:
+        queues = self._watchers.get(channel)
+        if not queues:
+            return
+        try:
+            message = json.loads(data)
+            version = int(message["version"])
+            claims = message["claims"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Malformed status message on {channel}: {data!r}")
+            return
+        item = (version, claims, sse_event("claim", data, version))
+        for queue in list(queues):
+            self._offer(queue, item)
+
+    async def _read_loop(self) -> None:
+        while self._running:
+            try:
+                message = await self._pubsub.get_message(timeout=1.0)
+                if self._connection_lost:
+                    # 끊긴 동안 발행된 내역은 받을 수 없으므로 전체 상태를 다시 조회하도록 알림
+                    self._connection_lost = False
+                    self._resync_all()
+                if message is not None and message["type"] == "message":
+                    self._deliver(message["channel"], message["data"])
+            except asyncio.CancelledError:
+                raise
+            except (ConnectionError, RedisTimeoutError) as e:
+                # 재연결 시 redis-py 가 구독 채널을 다시 등록함
+                logger.error(f"Spray status hub connection lost: {str(e)}")
+                self._connection_lost = True
+                await asyncio.sleep(self._reconnect_delay)
+            except Exception as e:
+                logger.error(f"Spray status hub reader error: {str(e)}", exc_info=True)
+                await asyncio.sleep(self._reconnect_delay)
+
+
+# 프로세스 단위 구독 허브 (최초 사용 시 시작, shutdown 에서 정리)
+_hub: Optional[SprayStatusHub] = None
+_start_lock: Optional[asyncio.Lock] = None
+
+
+async def get_spray_status_hub() -> SprayStatusHub:
+    global _hub, _start_lock
+    if _hub is not None and _hub.started:
+        return _hub
+    if _start_lock is None:
+        _start_lock = asyncio.Lock()
+    async with _start_lock:
+        if _hub is None:
+            _hub = SprayStatusHub()
+        if not _hub.started:
+            await _hub.start()
+    return _hub
+
+
+async def close_spray_status_hub() -> None:
+    global _hub, _start_lock
+    if _hub is not None:
+        await _hub.stop()
+        _hub = None
+    _start_lock = None
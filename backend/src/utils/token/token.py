@@ -1,28 +1,168 @@
+import asyncio
 import random
 import string
 import re
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
+from itertools import product
 from typing import Optional
+from uuid import uuid4
 import redis
+import redis.asyncio as aioredis
 from src.core.config import settings  # Redis 설정을 위한 import
+from src.db.redis import get_redis_client, redis_circuit_breaker, PoolExhaustedError, REDIS_UNAVAILABLE_MESSAGE
+from src.utils.cache.lru_ttl_cache import LRUTTLCache
+
+# 토큰에 사용되는 문자 집합 (영문 대문자 + 숫자, 36^3 = 46,656개)
+TOKEN_CHARSET = string.ascii_uppercase + string.digits
+TOKEN_LENGTH = 3
+TOKEN_SPACE = len(TOKEN_CHARSET) ** TOKEN_LENGTH
+
+
+def _random_tokens(k: int) -> list[str]:
+    """토큰 공간에서 서로 다른 토큰 k 개를 무작위로 선택 (k 는 TOKEN_SPACE 이하)"""
+    tokens = []
+    for index in random.sample(range(TOKEN_SPACE), k):
+        chars = []
+        for _ in range(TOKEN_LENGTH):
+            index, digit = divmod(index, len(TOKEN_CHARSET))
+            chars.append(TOKEN_CHARSET[digit])
+        tokens.append(''.join(chars))
+    return tokens
+
+# 토큰 검증 결과 캐시 (프로세스 단위, 유효한 토큰만 캐싱)
+token_validation_cache = LRUTTLCache(
+    maxsize=settings.TOKEN_VALIDATION_CACHE_SIZE,
+    ttl_seconds=settings.TOKEN_VALIDATION_CACHE_TTL_SECONDS
+)
+
+# 후보 토큰 중 사용 가능한 토큰을 최대 count 개까지 확인/선점/TTL 설정까지 한 번에 수행하는 스크립트
+# (used_tokens / token:{token} 키 구조는 WATCH 방식과 동일하게 유지)
+# KEYS[1]: used_tokens
+# ARGV[1]: token key prefix, ARGV[2]: created_at, ARGV[3]: 만료 시간(초), ARGV[4]: count, ARGV[5..]: 후보 토큰
+_CLAIM_TOKEN_SCRIPT = """
+local expiry_seconds = tonumber(ARGV[3])
+local count = tonumber(ARGV[4])
+local claimed = {}
+local has_new = false
+for i = 5, #ARGV do
+    if #claimed >= count then
+        break
+    end
+    local token = ARGV[i]
+    local token_key = ARGV[1] .. token
+    if redis.call('EXISTS', token_key) == 0 then
+        if redis.call('SADD', KEYS[1], token) == 1 then
+            has_new = true
+        end
+        redis.call('HSET', token_key, 'created_at', ARGV[2], 'status', 'active')
+        redis.call('EXPIRE', token_key, expiry_seconds)
+        claimed[#claimed + 1] = token
+    end
+end
+if has_new then
+    redis.call('EXPIRE', KEYS[1], expiry_seconds + 60)
+end
+return claimed
+"""
+
+# 토큰 풀에서 토큰을 최대 count 개 꺼내 사용 처리까지 한 번에 수행하는 스크립트 (Redis 6.2+)
+# KEYS[1]: token_pool, KEYS[2]: used_tokens
+# ARGV[1]: token key prefix, ARGV[2]: created_at, ARGV[3]: 만료 시간(초), ARGV[4]: count
+_POOL_POP_SCRIPT = """
+local tokens = redis.call('LPOP', KEYS[1], tonumber(ARGV[4]))
+if not tokens then
+    return {}
+end
+for _, token in ipairs(tokens) do
+    local token_key = ARGV[1] .. token
+    redis.call('SADD', KEYS[2], token)
+    redis.call('HSET', token_key, 'created_at', ARGV[2], 'status', 'active')
+    redis.call('EXPIRE', token_key, tonumber(ARGV[3]))
+end
+return tokens
+"""
+
+# 만료된 토큰(token:{token} 키가 사라진 토큰)을 풀로 되돌리는 스크립트
+# KEYS[1]: token_pool, KEYS[2]: used_tokens
+# ARGV[1]: token key prefix, ARGV[2..]: 회수 후보 토큰
+_POOL_RECYCLE_SCRIPT = """
+local recycled = 0
+for i = 2, #ARGV do
+    local token = ARGV[i]
+    if redis.call('EXISTS', ARGV[1] .. token) == 0
+        and redis.call('SREM', KEYS[2], token) == 1 then
+        redis.call('RPUSH', KEYS[1], token)
+        recycled = recycled + 1
+    end
+end
+return recycled
+"""
+
+# 락을 잡은 프로세스일 때만 락을 삭제하는 스크립트
+# (작업이 락 만료 시간보다 오래 걸린 경우 그 사이 다른 프로세스가 잡은 락을 지우지 않도록 함)
+# KEYS[1]: 락 키, ARGV[1]: 락을 잡을 때 저장한 소유자 값
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
 
 class TokenService:
-    def __init__(self):
+    def __init__(
+        self,
+        redis_client: Optional[aioredis.Redis] = None,
+        use_token_pool: Optional[bool] = None,
+        use_claim_script: Optional[bool] = None
+    ):
         self._token_pattern = re.compile(r'^[A-Z0-9]{3}$')
         self._token_expiry_days = 7
-        self._redis = redis.Redis(
-            host=settings.REDIS_HOST,
-            port=settings.REDIS_PORT,
-            db=0,
-            decode_responses=True
-        )
+        self._redis = redis_client or get_redis_client()  # 공유 커넥션 풀 사용
         self._token_prefix = "token:"  # Redis key prefix
         self._used_tokens_key = "used_tokens"  # Set of all used tokens
+        self._validation_cache = token_validation_cache
+        self._circuit_breaker = redis_circuit_breaker
+
+        # 스크립트 방식 설정 (후보 토큰을 서버 측 스크립트로 한 번에 확인/선점)
+        self._use_claim_script = settings.TOKEN_SCRIPT_ENABLED if use_claim_script is None else use_claim_script
+        self._claim_candidates = 16  # 스크립트 호출 1회당 후보 토큰 수
+        self._claim_max_attempts = 8
+        self._claim_token_script = self._redis.register_script(_CLAIM_TOKEN_SCRIPT)
+
+        # 토큰 풀 모드 설정 (미사용 토큰을 미리 섞어서 List에 보관)
+        self._use_token_pool = settings.TOKEN_POOL_ENABLED if use_token_pool is None else use_token_pool
+        self._token_pool_key = "token_pool"  # 미사용 토큰 List
+        self._token_pool_ready_key = "token_pool:ready"  # 풀 초기화 완료 플래그
+        self._token_pool_lock_key = "token_pool:lock"  # 풀 초기화/회수 작업 락
+        self._token_pool_lock_seconds = 60
+        self._token_pool_lock_wait_seconds = 3.0  # 다른 프로세스의 회수 작업을 기다리는 최대 시간
+        self._token_pool_lock_poll_seconds = 0.05
+        self._token_pool_pop_attempts = 3
+        self._token_pool_batch_size = 1000
+        self._pool_pop_script = self._redis.register_script(_POOL_POP_SCRIPT)
+        self._pool_recycle_script = self._redis.register_script(_POOL_RECYCLE_SCRIPT)
+        self._release_lock_script = self._redis.register_script(_RELEASE_LOCK_SCRIPT)
 
-    def generate_token(self) -> str:
+    async def generate_token(self) -> str:
         """중복되지 않는 3자리 랜덤 토큰 생성"""
+        async with self._redis_guard():
+            if self._use_token_pool:
+                token = await self._generate_token_from_pool()
+            elif self._use_claim_script:
+                token = await self._generate_token_with_script()
+            else:
+                token = await self._generate_token_with_watch()
+
+        # 재발급된 토큰의 이전 검증 결과 제거
+        self._validation_cache.invalidate(token)
+        return token
+
+    async def _generate_token_with_watch(self) -> str:
+        """WATCH/MULTI 낙관적 락으로 랜덤 토큰 생성 (충돌 시 재시도)"""
         while True:
-            token = ''.join(random.choices(string.ascii_uppercase + string.digits, k=3))
+            token = ''.join(random.choices(TOKEN_CHARSET, k=TOKEN_LENGTH))
             token_key = f"{self._token_prefix}{token}"
             
             # 테스트를 위한 하드코딩 (지우지말것)
@@ -31,16 +171,13 @@ class TokenService:
             # token_key = f"{self._token_prefix}{token}"
 
             try:
-                if not self._redis.ping():
-                    raise redis.ConnectionError("Redis connection failed, 현재 서비스를 이용할 수 없습니다. 관리자에게 문의하세요.")
-
-                with self._redis.pipeline() as pipe:
+                async with self._redis.pipeline() as pipe:
                     try:
-                        pipe.watch(self._used_tokens_key, token_key)
+                        await pipe.watch(self._used_tokens_key, token_key)
                         
                         # Redis에서 중복 토큰 체크
-                        if pipe.sismember(self._used_tokens_key, token):
-                            token_ttl = self._redis.ttl(token_key)
+                        if await pipe.sismember(self._used_tokens_key, token):
+                            token_ttl = await self._redis.ttl(token_key)
                             if token_ttl > 0:  # 유효한 토큰이면 새로운 토큰 생성
                                 continue
                             elif token_ttl == -2:  # 만료된 토큰이면 상태만 변경하여 재사용
@@ -51,7 +188,7 @@ class TokenService:
                                 })
                                 expiry_seconds = int(timedelta(days=self._token_expiry_days).total_seconds())
                                 pipe.expire(token_key, expiry_seconds)
-                                pipe.execute()
+                                await pipe.execute()
                                 return token
                         else:  # 새로운 토큰인 경우에만 저장
                             pipe.multi()
@@ -63,7 +200,7 @@ class TokenService:
                             expiry_seconds = int(timedelta(days=self._token_expiry_days).total_seconds())
                             pipe.expire(token_key, expiry_seconds)
                             pipe.expire(self._used_tokens_key, expiry_seconds + 60)
-                            pipe.execute()
+                            await pipe.execute()
                             
                             return token
 
@@ -73,15 +210,252 @@ class TokenService:
             except redis.RedisError as e:
                 raise
 
-    def validate_token(self, token: str) -> bool:
+    async def generate_tokens(self, count: int) -> list[str]:
+        """
+        중복되지 않는 토큰 count 개를 한 번에 발급 (대량 뿌리기용)
+
+        토큰 풀 모드가 아니면 WATCH 방식 대신 스크립트 방식으로 발급하며,
+        일반적인 경우 Redis round trip 한 번으로 처리됩니다.
+        """
+        async with self._redis_guard():
+            if self._use_token_pool:
+                tokens = await self._generate_tokens_from_pool(count)
+            else:
+                tokens = await self._generate_tokens_with_script(count)
+
+        for token in tokens:
+            self._validation_cache.invalidate(token)
+        return tokens
+
+    async def _generate_token_with_script(self) -> str:
+        """
+        후보 토큰 묶음을 스크립트(EVALSHA) 한 번으로 확인/선점/TTL 설정
+
+        WATCH/MULTI 방식과 달리 충돌 시 트랜잭션을 재시작하지 않고,
+        후보가 모두 사용 중인 경우에만 새 후보로 다시 호출합니다.
+        """
+        return (await self._generate_tokens_with_script(1))[0]
+
+    async def _generate_tokens_with_script(self, count: int) -> list[str]:
+        """후보 토큰 묶음을 스크립트로 보내 사용 가능한 토큰을 count 개까지 선점"""
+        if count > TOKEN_SPACE:
+            raise redis.ResponseError("사용 가능한 토큰이 없습니다. 잠시 후 다시 시도해주세요.")
+
+        expiry_seconds = int(timedelta(days=self._token_expiry_days).total_seconds())
+        tokens = []
+        for _ in range(self._claim_max_attempts):
+            needed = count - len(tokens)
+            # 후보 수는 토큰 공간 크기를 넘지 않음 (이미 선점한 토큰은 스크립트에서 걸러짐)
+            candidates = _random_tokens(min(needed * 2 + self._claim_candidates, TOKEN_SPACE))
+            tokens.extend(await self._claim_token_script(
+                keys=[self._used_tokens_key],
+                args=[self._token_prefix, datetime.now().isoformat(), expiry_seconds, needed, *candidates]
+            ))
+            if len(tokens) >= count:
+                return tokens
+
+        # 발급하지 못한 만큼이 남으면 이미 선점한 토큰은 사용 처리를 취소
+        if tokens:
+            await self._release_claimed_tokens(tokens)
+        raise redis.ResponseError("사용 가능한 토큰이 없습니다. 잠시 후 다시 시도해주세요.")
+
+    async def _generate_token_from_pool(self) -> str:
+        """
+        토큰 풀에서 토큰을 꺼내 사용 처리 (단일 round trip)
+
+        풀이 비어 있으면 만료된 토큰을 회수한 뒤 다시 시도합니다.
+        다른 프로세스가 회수 중이면 회수가 끝날 때까지 기다렸다가 다시 시도합니다.
+        """
+        return (await self._generate_tokens_from_pool(1))[0]
+
+    async def _generate_tokens_from_pool(self, count: int) -> list[str]:
+        """토큰 풀에서 토큰 count 개를 꺼내 사용 처리"""
+        tokens = []
+        for attempt in range(self._token_pool_pop_attempts):
+            tokens.extend(await self._pool_pop_script(
+                keys=[self._token_pool_key, self._used_tokens_key],
+                args=[
+                    self._token_prefix,
+                    datetime.now().isoformat(),
+                    int(timedelta(days=self._token_expiry_days).total_seconds()),
+                    count - len(tokens)
+                ]
+            ))
+            if len(tokens) >= count:
+                return tokens
+
+            if attempt == self._token_pool_pop_attempts - 1 or not await self._refill_pool():
+                break
+
+        # 발급하지 못한 만큼이 남으면 이미 꺼낸 토큰은 풀로 되돌림
+        if tokens:
+            await self._release_pool_tokens(tokens)
+        raise redis.ResponseError("사용 가능한 토큰이 없습니다. 잠시 후 다시 시도해주세요.")
+
+    async def _refill_pool(self) -> bool:
+        """
+        비어 있는 풀 보충 - 다시 꺼내볼 만하면 True
+
+        직접 회수한 경우에는 회수된 토큰이 있을 때, 다른 프로세스가 회수/초기화 중인 경우에는
+        그 작업이 대기 시간 안에 끝났을 때 True 를 반환합니다.
+        """
+        owner = await self._acquire_pool_lock()
+        if owner is None:
+            return await self._wait_for_pool_lock()
+        try:
+            return await self._recycle_all() > 0
+        finally:
+            await self._release_pool_lock(owner)
+
+    async def _acquire_pool_lock(self) -> Optional[str]:
+        """풀 초기화/회수 작업 락 획득 - 성공하면 소유자 값, 다른 프로세스가 잡고 있으면 None"""
+        owner = uuid4().hex
+        if await self._redis.set(self._token_pool_lock_key, owner, nx=True, ex=self._token_pool_lock_seconds):
+            return owner
+        return None
+
+    async def _release_pool_lock(self, owner: str) -> None:
+        """직접 잡은 락만 해제 (만료 후 다른 프로세스가 잡은 락은 유지)"""
+        await self._release_lock_script(keys=[self._token_pool_lock_key], args=[owner])
+
+    async def _wait_for_pool_lock(self) -> bool:
+        """다른 프로세스의 풀 초기화/회수 작업이 끝날 때까지 대기 (대기 시간 안에 끝나면 True)"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._token_pool_lock_wait_seconds
+        while loop.time() < deadline:
+            await asyncio.sleep(self._token_pool_lock_poll_seconds)
+            if not await self._redis.exists(self._token_pool_lock_key):
+                return True
+        return False
+
+    async def release_tokens(self, tokens: list[str]) -> None:
+        """
+        발급했지만 사용하지 못한 토큰의 사용 처리를 취소 (뿌리기 저장 실패 시)
+
+        토큰 풀 모드에서는 풀로 되돌립니다.
+        """
+        if not tokens:
+            return
+        async with self._redis_guard():
+            if self._use_token_pool:
+                await self._release_pool_tokens(tokens)
+            else:
+                await self._release_claimed_tokens(tokens)
+        for token in tokens:
+            self._validation_cache.invalidate(token)
+
+    async def _release_claimed_tokens(self, tokens: list[str]) -> None:
+        """사용 처리한 토큰을 취소"""
+        async with self._redis.pipeline() as pipe:
+            pipe.delete(*(f"{self._token_prefix}{token}" for token in tokens))
+            pipe.srem(self._used_tokens_key, *tokens)
+            await pipe.execute()
+
+    async def _release_pool_tokens(self, tokens: list[str]) -> None:
+        """사용 처리한 토큰을 취소하고 풀로 되돌림"""
+        async with self._redis.pipeline() as pipe:
+            pipe.delete(*(f"{self._token_prefix}{token}" for token in tokens))
+            pipe.srem(self._used_tokens_key, *tokens)
+            pipe.rpush(self._token_pool_key, *tokens)
+            await pipe.execute()
+
+    async def init_token_pool(self, force: bool = False) -> int:
+        """
+        전체 토큰 공간에서 현재 사용 중인 토큰을 제외하고 섞어서 풀에 적재합니다.
+        이미 초기화된 풀은 force=True 인 경우에만 다시 만듭니다.
+
+        Returns:
+            int: 풀에 적재된 토큰 수
+        """
+        if not force and await self._redis.exists(self._token_pool_ready_key):
+            return 0
+
+        owner = await self._acquire_pool_lock()
+        if owner is None:
+            return 0  # 다른 프로세스가 초기화 중
+
+        try:
+            all_tokens = [''.join(chars) for chars in product(TOKEN_CHARSET, repeat=TOKEN_LENGTH)]
+
+            # 현재 유효한(token:{token} 키가 남아있는) 토큰은 제외
+            free_tokens = []
+            for start in range(0, len(all_tokens), self._token_pool_batch_size):
+                batch = all_tokens[start:start + self._token_pool_batch_size]
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    for token in batch:
+                        pipe.exists(f"{self._token_prefix}{token}")
+                    live_flags = await pipe.execute()
+                free_tokens.extend(token for token, live in zip(batch, live_flags) if not live)
+
+            random.shuffle(free_tokens)
+
+            async with self._redis.pipeline() as pipe:
+                pipe.delete(self._token_pool_key)
+                for start in range(0, len(free_tokens), self._token_pool_batch_size):
+                    pipe.rpush(self._token_pool_key, *free_tokens[start:start + self._token_pool_batch_size])
+                pipe.srem(self._used_tokens_key, *all_tokens)
+                live_tokens = set(all_tokens).difference(free_tokens)
+                if live_tokens:
+                    pipe.sadd(self._used_tokens_key, *live_tokens)
+                pipe.set(self._token_pool_ready_key, datetime.now().isoformat())
+                await pipe.execute()
+
+            return len(free_tokens)
+        finally:
+            await self._release_pool_lock(owner)
+
+    async def recycle_expired_tokens(self) -> int:
+        """
+        만료된 토큰을 used_tokens 에서 제거하고 풀로 되돌립니다.
+        풀이 비었을 때 자동으로 호출되며, 주기적으로 호출해도 안전합니다.
+
+        Returns:
+            int: 풀로 회수된 토큰 수
+        """
+        owner = await self._acquire_pool_lock()
+        if owner is None:
+            return 0  # 다른 프로세스가 회수/초기화 중
+
+        try:
+            return await self._recycle_all()
+        finally:
+            await self._release_pool_lock(owner)
+
+    async def _recycle_all(self) -> int:
+        """used_tokens 전체를 훑어 만료된 토큰 회수 (풀 작업 락을 잡은 상태에서 호출)"""
+        recycled = 0
+        batch = []
+        async for token in self._redis.sscan_iter(self._used_tokens_key, count=self._token_pool_batch_size):
+            batch.append(token)
+            if len(batch) >= self._token_pool_batch_size:
+                recycled += await self._recycle_batch(batch)
+                batch = []
+        if batch:
+            recycled += await self._recycle_batch(batch)
+        return recycled
+
+    async def _recycle_batch(self, tokens: list[str]) -> int:
+        """회수 후보 토큰을 섞어서 스크립트로 원자적으로 회수"""
+        random.shuffle(tokens)
+        return await self._pool_recycle_script(
+            keys=[self._token_pool_key, self._used_tokens_key],
+            args=[self._token_prefix, *tokens]
+        )
+
+    async def validate_token(self, token: str) -> bool:
         """토큰 유효성 검증"""
         # 형식 검증
         if not self._token_pattern.match(token):
             return False
+
+        # 프로세스 내 캐시 확인 (유효한 토큰만 캐싱되어 있음)
+        if self._validation_cache.get(token):
+            return True
         
         # Redis에서 토큰 정보 조회
         token_key = f"{self._token_prefix}{token}"
-        token_data = self._redis.hgetall(token_key)
+        async with self._redis_guard():
+            token_data = await self._redis.hgetall(token_key)
         
         if not token_data:
             return False
@@ -91,9 +465,41 @@ class TokenService:
         if self.is_token_expired(created_at):
             return False
 
-        return token_data.get("status") == "active"
+        is_valid = token_data.get("status") == "active"
+        if is_valid:
+            # 실제 토큰 만료 시각보다 늦게 캐시가 남지 않도록 TTL 제한
+            remaining = created_at + timedelta(days=self._token_expiry_days) - datetime.now()
+            self._validation_cache.set(token, True, ttl=remaining.total_seconds())
+
+        return is_valid
+
+    @asynccontextmanager
+    async def _redis_guard(self):
+        """
+        Redis 장애 감지 및 빠른 실패 처리
+
+        연결/타임아웃 오류가 연속으로 발생하면 서킷을 열어 일정 시간 동안
+        Redis 를 호출하지 않고 즉시 '서비스 이용 불가' 오류를 반환합니다.
+        성공은 블록이 정상 종료된 경우에만 집계하고, 커넥션 풀 대기 시간 초과(부하)나
+        취소 / 응답 오류 등 Redis 연결 상태와 무관한 예외는 어느 쪽으로도 집계하지 않습니다.
+        """
+        if not self._circuit_breaker.allow_request():
+            raise redis.ConnectionError(REDIS_UNAVAILABLE_MESSAGE)
+
+        try:
+            yield
+        except PoolExhaustedError:
+            self._circuit_breaker.release_trial()
+            raise
+        except (redis.ConnectionError, redis.TimeoutError) as e:
+            self._circuit_breaker.record_failure()
+            raise redis.ConnectionError(REDIS_UNAVAILABLE_MESSAGE) from e
+        except BaseException:
+            self._circuit_breaker.release_trial()
+            raise
+        else:
+            self._circuit_breaker.record_success()
 
     def is_token_expired(self, created_at: datetime) -> bool:
         """토큰 만료 여부 확인"""
         return datetime.now() - created_at >= timedelta(days=self._token_expiry_days)
-
@@ -5,11 +5,25 @@ Celery 애플리케이션 설정
 - broker_url: RabbitMQ 연결 설정
 - result_backend: 작업 결과 저장소 설정
 - task_routes: 작업별 큐 설정
+
+받기 큐 샤드(RECEIVE_QUEUE_SHARDS > 1)를 사용하는 경우 샤드 큐마다 동시성 1 워커를 실행합니다.
+    celery -A src.worker.celery_app worker -Q receive_requests.0 -c 1 -n receive0@%h
+    celery -A src.worker.celery_app worker -Q receive_requests.1 -c 1 -n receive1@%h
+    ...
+
+받기 요청 micro-batching(RECEIVE_BATCH_ENABLED)을 사용하면 워커가 배치 크기만큼 메시지를 미리 가져오도록
+worker_prefetch_multiplier 를 RECEIVE_BATCH_SIZE 로 설정합니다.
+
+받기 집계 정합성 점검(reconcile_distribution_summaries)은 beat 로 주기 실행하며,
+받기 큐와 분리된 maintenance 큐로 발행되므로 이 큐를 소비하는 워커를 별도로 실행합니다.
+    celery -A src.worker.celery_app beat
+    celery -A src.worker.celery_app worker -Q maintenance -c 1 -n maintenance@%h
 """
 
 import os
 from celery import Celery
 from ..core.config import settings
+from .routing import RECEIVE_QUEUE, MAINTENANCE_QUEUE
 
 # RabbitMQ 연결 URL 구성
 RABBITMQ_URL = f"amqp://{settings.RABBITMQ_USER}:{settings.RABBITMQ_PASSWORD}@{settings.RABBITMQ_HOST}:{settings.RABBITMQ_PORT}//"
@@ -29,8 +43,29 @@ celery_app.conf.update(
     result_serializer='json',
     timezone='UTC',
     enable_utc=True,
-    task_default_queue='receive_requests',  # 기본 큐 이름
+    task_default_queue=RECEIVE_QUEUE,  # 기본 큐 이름
     task_routes={
-        'process_receive_money': {'queue': 'receive_requests'},  # 돈 받기 요청 처리 큐
+        # 돈 받기 요청 처리 큐 (샤드 사용 시 발행하는 쪽에서 receive_queue_for(token) 큐를 지정)
+        'process_receive_money': {'queue': RECEIVE_QUEUE},
+        'process_receive_money_batch': {'queue': RECEIVE_QUEUE},
+        # 받기 집계 정합성 점검 / 보정 (받기 처리와 워커를 공유하지 않도록 별도 큐)
+        'reconcile_distribution_summaries': {'queue': MAINTENANCE_QUEUE},
+    },
+    beat_schedule={
+        # 뿌리기 건 받기 집계와 분배 내역 정합성 점검 / 보정
+        'reconcile-distribution-summaries': {
+            'task': 'reconcile_distribution_summaries',
+            'schedule': settings.SUMMARY_RECONCILE_INTERVAL_SECONDS,
+        },
     }
-) 
\ No newline at end of file
+)
+
+if settings.RECEIVE_BATCH_ENABLED:
+    # 동시성 1 워커도 배치 하나를 채울 만큼 메시지를 미리 가져오도록 설정
+    celery_app.conf.worker_prefetch_multiplier = settings.RECEIVE_BATCH_SIZE 
+
+
+def get_queue_depth(queue_name: str) -> int:
+    """브로커 큐에 쌓여 있는 메시지 수 조회 (블로킹 호출)"""
+    with celery_app.connection_for_read() as connection:
+        return connection.default_channel.queue_declare(queue=queue_name, passive=True).message_count
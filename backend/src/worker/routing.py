@@ -0,0 +1,49 @@
+"""
+받기 태스크 샤드 라우팅
+
+토큰을 jump consistent hash 로 RECEIVE_QUEUE_SHARDS 개의 받기 큐 중 하나에 배정합니다.
+샤드 큐마다 동시성 1 워커를 붙이면 같은 뿌리기 건의 받기는 한 워커에서 순서대로 처리되어
+DB 행 락 경합이 없고, 서로 다른 뿌리기 건은 여러 코어/노드에서 병렬로 처리됩니다.
+샤드 수를 늘려도 jump consistent hash 특성상 약 1/N 의 토큰만 다른 큐로 이동합니다.
+"""
+
+import hashlib
+
+from ..core.config import settings
+
+RECEIVE_QUEUE = "receive_requests"
+# 정합성 점검 등 주기 작업 큐 (받기 큐 워커가 점검 작업에 묶이지 않도록 분리)
+MAINTENANCE_QUEUE = "maintenance"
+
+
+def jump_consistent_hash(key: int, num_buckets: int) -> int:
+    """Lamping & Veach 의 jump consistent hash (0 <= 반환값 < num_buckets)"""
+    if num_buckets <= 0:
+        raise ValueError("num_buckets must be greater than 0")
+
+    bucket, jump = -1, 0
+    while jump < num_buckets:
+        bucket = jump
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        jump = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return bucket
+
+
+def token_shard(token: str, num_shards: int) -> int:
+    """토큰이 배정될 샤드 번호 (프로세스/노드가 달라도 같은 값이 되도록 고정 해시 사용)"""
+    key = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "big")
+    return jump_consistent_hash(key, num_shards)
+
+
+def receive_queues() -> list[str]:
+    """받기 큐 이름 목록 (샤드를 사용하지 않으면 기존 단일 큐)"""
+    if settings.RECEIVE_QUEUE_SHARDS <= 1:
+        return [RECEIVE_QUEUE]
+    return [f"{RECEIVE_QUEUE}.{shard}" for shard in range(settings.RECEIVE_QUEUE_SHARDS)]
+
+
+def receive_queue_for(token: str) -> str:
+    """토큰의 받기 태스크를 보낼 큐 이름"""
+    if settings.RECEIVE_QUEUE_SHARDS <= 1:
+        return RECEIVE_QUEUE
+    return f"{RECEIVE_QUEUE}.{token_shard(token, settings.RECEIVE_QUEUE_SHARDS)}"
@@ -0,0 +1,95 @@
+"""
+Celery 워커 프로세스 런타임
+
+워커 프로세스마다 이벤트 루프 / DB 엔진 / Redis 커넥션 풀을 한 번만 만들고 모든 태스크에서 재사용합니다.
+- worker_process_init: prefork 자식 프로세스가 시작될 때 생성
+- worker_process_shutdown: 자식 프로세스가 종료될 때 정리
+
+커넥션 풀은 생성된 이벤트 루프에 묶이므로, 태스크는 반드시 run_in_worker_loop 로 실행해야 합니다.
+solo 풀처럼 worker_process_init 이 발생하지 않는 환경에서는 첫 태스크 실행 시 생성합니다.
+(하나의 루프를 공유하므로 threads/gevent 풀은 지원하지 않습니다.)
+"""
+
+import asyncio
+import logging
+from typing import Any, Coroutine, Optional
+
+from celery.signals import worker_process_init, worker_process_shutdown
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from ..core.config import settings
+from ..db import redis as redis_db
+
+logger = logging.getLogger(__name__)
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_engine: Optional[AsyncEngine] = None
+_session_maker: Optional[sessionmaker] = None
+
+
+def init_worker_runtime() -> None:
+    """워커 프로세스 전용 이벤트 루프 / DB 엔진 / Redis 커넥션 풀 생성"""
+    global _loop, _engine, _session_maker
+    if _loop is not None:
+        return
+
+    _loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_loop)
+
+    _engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=settings.WORKER_DB_ECHO,
+        pool_size=settings.WORKER_DB_POOL_SIZE,
+        pool_pre_ping=True
+    )
+    _session_maker = sessionmaker(
+        _engine,
+        class_=AsyncSession,
+        expire_on_commit=False
+    )
+
+    # 부모 프로세스에서 만들어진 Redis 풀을 물려받았다면 버리고 이 프로세스에서 새로 생성
+    redis_db.redis_pool = None
+    redis_db.init_redis_pool()
+    logger.info("Worker runtime initialized")
+
+
+def shutdown_worker_runtime() -> None:
+    """워커 프로세스 종료 시 커넥션 풀과 이벤트 루프 정리"""
+    global _loop, _engine, _session_maker
+    if _loop is None:
+        return
+
+    try:
+        _loop.run_until_complete(redis_db.close_redis_pool())
+        _loop.run_until_complete(_engine.dispose())
+    finally:
+        _loop.close()
+        asyncio.set_event_loop(None)
+        _loop = None
+        _engine = None
+        _session_maker = None
+        logger.info("Worker runtime closed")
+
+
+def get_session_maker() -> sessionmaker:
+    """워커 프로세스 전용 세션 팩토리"""
+    init_worker_runtime()
+    return _session_maker
+
+
+def run_in_worker_loop(coro: Coroutine[Any, Any, Any]) -> Any:
+    """워커 프로세스의 이벤트 루프에서 코루틴 실행"""
+    init_worker_runtime()
+    return _loop.run_until_complete(coro)
+
+
+@worker_process_init.connect
+def _on_worker_process_init(**kwargs) -> None:
+    init_worker_runtime()
+
+
+@worker_process_shutdown.connect
+def _on_worker_process_shutdown(**kwargs) -> None:
+    shutdown_worker_runtime()
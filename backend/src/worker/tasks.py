@@ -4,29 +4,47 @@ Celery 태스크 정의
 이 모듈은 비동기적으로 처리될 작업들을 정의합니다.
 주요 태스크:
 - process_receive_money: 돈 받기 요청 처리
+- process_receive_money_batch: 돈 받기 요청 micro-batching 처리
+- reconcile_distribution_summaries: 뿌리기 건 받기 집계 정합성 점검 / 보정
 """
 
-import asyncio
 import logging
+from datetime import datetime, timedelta
+from typing import Optional
+from celery_batches import Batches
 from .celery_app import celery_app
-from ..db.database import async_session_maker
+from ..core.config import settings
+from ..db.redis import get_redis_client
+from .runtime import get_session_maker, run_in_worker_loop
 
 logger = logging.getLogger(__name__)
 
 @celery_app.task(name="process_receive_money", bind=True)
-def process_receive_money(self, *, token: str, user_id: int, room_id: str) -> dict:
+def process_receive_money(
+    self,
+    *,
+    token: str,
+    user_id: int,
+    room_id: str,
+    store_result: bool = False,
+    reply_channel: Optional[str] = None,
+    context: Optional[dict] = None
+) -> dict:
     """
     돈 받기 요청을 처리하는 Celery 태스크
     
     이 태스크는 다음과 같은 순서로 처리됩니다:
-    1. 비동기 DB 세션 생성
-    2. ReceiveService를 통해 돈 받기 처리 (비관적 락 사용)
+    1. 워커 프로세스 전용 DB 세션 생성 (이벤트 루프 / 엔진은 프로세스 단위로 재사용)
+    2. ReceiveService를 통해 돈 받기 처리 (API 단계 검증 결과가 있으면 바뀔 수 있는 조건만 재확인)
     3. 처리 결과 반환
     
     Args:
         token: 뿌리기 토큰
         user_id: 받기 요청한 사용자 ID
         room_id: 대화방 ID
+        store_result: 비동기 받기 요청이면 True (처리 결과를 ClaimResultStore 에 기록)
+        reply_channel: 결과를 기다리는 API 프로세스의 Redis 결과 채널 (RECEIVE_RESULT_CHANNEL=redis)
+        context: API 단계 검증 결과 (ReceiveValidationContext, 주어지면 뿌리기 건 재조회 생략)
         
     Returns:
         dict: 처리 결과를 담은 딕셔너리 {"received_amount": int}
@@ -37,8 +55,30 @@ def process_receive_money(self, *, token: str, user_id: int, room_id: str) -> di
     async def _process():
         # 순환 참조를 피하기 위해 함수 내부에서 import
         from ..api.distribution.service.receive_service import ReceiveService
+        from ..api.distribution.schema import ReceiveValidationContext
+        from ..utils.claim_result.claim_result_store import ClaimResultStore
+        from ..utils.result_channel.result_channel import publish_result
         
-        async with async_session_maker() as session:
+        async def _deliver(**result):
+            # 결과 전달 실패는 기록만 하고 처리 결과(커밋 여부)를 바꾸지 않음
+            if store_result:
+                try:
+                    if "error" in result:
+                        # 검증 실패(ValueError)만 사유를 그대로 전달
+                        e = result["error"]
+                        error = str(e) if isinstance(e, ValueError) else "Internal server error"
+                        await ClaimResultStore().save_failure(self.request.id, error)
+                    else:
+                        await ClaimResultStore().save_success(self.request.id, result["received_amount"])
+                except Exception as e:
+                    logger.error(f"[Task {self.request.id}] Failed to save claim result: {str(e)}")
+            if reply_channel:
+                try:
+                    await publish_result(get_redis_client(), reply_channel, self.request.id, **result)
+                except Exception as e:
+                    logger.error(f"[Task {self.request.id}] Failed to publish result: {str(e)}")
+
+        async with get_session_maker()() as session:
             try:
                 # ReceiveService 인스턴스 생성
                 receive_service = ReceiveService(session)
@@ -47,16 +87,131 @@ def process_receive_money(self, *, token: str, user_id: int, room_id: str) -> di
                 received_amount = await receive_service.receive_money(
                     token=token,
                     user_id=user_id,
-                    room_id=room_id
+                    room_id=room_id,
+                    context=ReceiveValidationContext.model_validate(context) if context else None
                 )
                 
-                logger.info(f"[Task {self.request.id}] Successfully processed. Amount: {received_amount}")
-                return {"received_amount": received_amount}
-                
             except Exception as e:
                 logger.error(f"[Task {self.request.id}] Processing failed: {str(e)}")
+                await _deliver(error=e)
                 raise
 
-    # 비동기 함수를 동기적으로 실행
-    loop = asyncio.get_event_loop()
-    return loop.run_until_complete(_process()) 
\ No newline at end of file
+        logger.info(f"[Task {self.request.id}] Successfully processed. Amount: {received_amount}")
+        # 커밋이 끝난 뒤에 결과 전달 (전달 실패가 성공한 받기를 실패로 바꾸지 않도록)
+        await _deliver(received_amount=received_amount)
+        return {"received_amount": received_amount}
+
+    # 워커 프로세스의 이벤트 루프에서 비동기 함수를 동기적으로 실행
+    return run_in_worker_loop(_process()) 
+
+
+@celery_app.task(
+    name="process_receive_money_batch",
+    base=Batches,
+    flush_every=settings.RECEIVE_BATCH_SIZE,
+    flush_interval=settings.RECEIVE_BATCH_INTERVAL_SECONDS
+)
+def process_receive_money_batch(requests: list) -> None:
+    """
+    돈 받기 요청을 모아서 처리하는 Celery 태스크 (micro-batching)
+
+    RECEIVE_BATCH_SIZE 건이 모이거나 RECEIVE_BATCH_INTERVAL_SECONDS 가 지나면 호출됩니다.
+    1. 요청을 (토큰, 대화방) 별로 묶음
+    2. 묶음마다 RECEIVE_CLAIM_MODE 에 맞게 처리 (ReceiveService.receive_money_batch, db_lock 이면 한 트랜잭션)
+    3. 요청별 결과를 각 호출자에게 전달 (결과 백엔드 / Redis 결과 채널 / ClaimResultStore)
+
+    Args:
+        requests: 요청 목록 (각 요청의 kwargs 는 process_receive_money 와 동일)
+    """
+    logger.info(f"Starting batched money receive processing - {len(requests)} requests")
+
+    async def _process():
+        # 순환 참조를 피하기 위해 함수 내부에서 import
+        from ..api.distribution.service.receive_service import ReceiveService
+        from ..api.distribution.schema import ReceiveValidationContext
+        from ..utils.claim_result.claim_result_store import ClaimResultStore
+        from ..utils.result_channel.result_channel import publish_result
+
+        groups = {}
+        for request in requests:
+            key = (request.kwargs["token"], request.kwargs["room_id"])
+            groups.setdefault(key, []).append(request)
+
+        results = []
+        for (token, room_id), group in groups.items():
+            # 같은 토큰의 검증 결과는 모두 같으므로 하나만 사용
+            context = next((request.kwargs["context"] for request in group if request.kwargs.get("context")), None)
+            async with get_session_maker()() as session:
+                try:
+                    outcomes = await ReceiveService(session).receive_money_batch(
+                        token=token,
+                        room_id=room_id,
+                        user_ids=[request.kwargs["user_id"] for request in group],
+                        context=ReceiveValidationContext.model_validate(context) if context else None
+                    )
+                except Exception as e:
+                    logger.error(f"Batch processing failed - Token: {token}: {str(e)}")
+                    outcomes = [e] * len(group)
+            results.extend(zip(group, outcomes))
+
+        # Redis 결과 채널로 결과를 기다리는 요청에 결과 전달
+        redis_client = get_redis_client()
+        for request, outcome in results:
+            reply_channel = request.kwargs.get("reply_channel")
+            if not reply_channel:
+                continue
+            if isinstance(outcome, Exception):
+                await publish_result(redis_client, reply_channel, request.id, error=outcome)
+            else:
+                await publish_result(redis_client, reply_channel, request.id, received_amount=outcome)
+
+        # 비동기 받기 요청은 ClaimResultStore 로 결과 전달
+        claim_results = ClaimResultStore()
+        for request, outcome in results:
+            if not request.kwargs.get("store_result"):
+                continue
+            if isinstance(outcome, Exception):
+                # 검증 실패(ValueError)만 사유를 그대로 전달
+                error = str(outcome) if isinstance(outcome, ValueError) else "Internal server error"
+                await claim_results.save_failure(request.id, error)
+            else:
+                await claim_results.save_success(request.id, outcome)
+        return results
+
+    results = run_in_worker_loop(_process())
+
+    # 결과를 기다리는 호출자에게 요청별 결과 전달
+    for request, outcome in results:
+        if request.ignore_result:
+            continue
+        if isinstance(outcome, Exception):
+            celery_app.backend.mark_as_failure(request.id, outcome, request=request)
+        else:
+            celery_app.backend.mark_as_done(request.id, {"received_amount": outcome}, request=request)
+    logger.info(f"Finished batched money receive processing - {len(results)} requests")
+
+
+@celery_app.task(name="reconcile_distribution_summaries")
+def reconcile_distribution_summaries(lookback_days: Optional[int] = None) -> int:
+    """
+    뿌리기 건 받기 집계(claimed_count / claimed_amount / last_claimed_at)를 분배 내역과 대조하여 보정
+
+    Args:
+        lookback_days: 점검 대상 기간 (기본값 SUMMARY_RECONCILE_LOOKBACK_DAYS, 최근 생성된 건만 점검)
+
+    Returns:
+        int: 보정한 뿌리기 건 수
+    """
+    days = settings.SUMMARY_RECONCILE_LOOKBACK_DAYS if lookback_days is None else lookback_days
+
+    async def _process():
+        # 순환 참조를 피하기 위해 함수 내부에서 import
+        from ..api.distribution.service.summary_service import SummaryService
+
+        async with get_session_maker()() as session:
+            mismatches = await SummaryService(session).reconcile(since=datetime.utcnow() - timedelta(days=days))
+        return len(mismatches)
+
+    fixed = run_in_worker_loop(_process())
+    logger.info(f"Reconciled distribution summaries - fixed: {fixed}")
+    return fixed